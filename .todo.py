@@ -18,10 +18,6 @@
 #  d2fobdu_Duplicate( d2fctx *pd2fctx, d2fob *new_owner, d2fob *pd2fob_src, d2fob **ppd2fob_dst, text *new_name );
 
 
-# todo:
-#  d2fobfo_FindObj(d2fctx *pd2fctx, d2fob *owner, text *name, d2fotyp objtyp, d2fob **ppd2fob );
-
-
 # todo: property numbers for data sources and arguments..
 #  368 -- Query Data Source Columns
 #  369 -- Query Data Source Arguments
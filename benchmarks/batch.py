@@ -0,0 +1,85 @@
+"""Scaling of batch.map with the number of worker processes.
+
+Saves MODULES generated modules with the in-process fake API, then reads every
+property of every item of each one through batch.map, with 1, 2, 4 and so on
+workers up to the number of cores, and prints the speedup over one worker,
+then once more with all the workers replaced after every RECYCLE modules.
+
+    python -m benchmarks.batch
+"""
+
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import List, Optional
+
+from pyoracle_forms import (
+    DataBlock,
+    FakeAPI,
+    Item,
+    Module,
+    batch,
+    context,
+    initialize_context,
+)
+
+MODULES = 32
+BLOCKS = 5
+ITEMS = 40
+RECYCLE = 4
+
+
+def export(module: Module) -> int:
+    return len(
+        [
+            item.get_properties()
+            for data_block in module.data_blocks
+            for item in data_block.items
+        ]
+    )
+
+
+def generate(directory: str) -> List[str]:
+    initialize_context(api=FakeAPI())
+    paths = []
+    for number in range(MODULES):
+        path = os.path.join(directory, f"module_{number}.fmb")
+        with Module.create(f"MODULE_{number}") as module:
+            for block in range(BLOCKS):
+                data_block = DataBlock.create(module, f"BLOCK_{block}")
+                for item in range(ITEMS):
+                    Item.create(data_block, f"ITEM_{item}")
+            module.save(path)
+        paths.append(path)
+    context.destroy_context()
+    return paths
+
+
+def run(paths: List[str], workers: int, max_modules: Optional[int] = None) -> float:
+    start = perf_counter()
+    for result in batch.map(
+        export, paths, workers, api_factory=FakeAPI, max_modules=max_modules
+    ):
+        assert result.ok, result.traceback
+    return perf_counter() - start
+
+
+def main() -> None:
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+
+    with TemporaryDirectory() as directory:
+        paths = generate(directory)
+        print(f"{'workers':<8}{'ms':>10}{'speedup':>9}")
+        single = 0.0
+        for workers in counts:
+            elapsed = run(paths, workers)
+            single = single or elapsed
+            print(f"{workers:<8}{elapsed * 1e3:>10.0f}{single / elapsed:>9.1f}")
+        elapsed = run(paths, counts[-1], max_modules=RECYCLE)
+        print(f"recycled every {RECYCLE} modules: {elapsed * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
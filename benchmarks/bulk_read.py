@@ -0,0 +1,67 @@
+"""Time spent reading many properties of every item in a block.
+
+Compares reading each property through its attribute against get_properties,
+which reads all properties of the same kind with one buffer in one loop.
+
+    python -m benchmarks.bulk_read
+"""
+
+from typing import Callable, List
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+
+from benchmarks.stub_api import measure
+
+ITEMS = 100
+PROPERTIES = [
+    "name",
+    "x_position",
+    "y_position",
+    "width",
+    "height",
+    "enabled",
+    "visible",
+    "maximum_length",
+    "database_item",
+    "item_type",
+    "justification",
+    "canvas_object_pointer",
+]
+
+
+def report(label: str, read: Callable[[], object], items: List[Item]) -> None:
+    per_item = measure(read, number=20) / len(items)
+    print(f"{label}{per_item / 1e3:.1f} us per item")
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    data_block = DataBlock.create(Module.create("BENCHMARK"), "BLOCK")
+    for index in range(ITEMS):
+        Item.create(data_block, f"ITEM_{index}")
+    items: List[Item] = list(data_block.items)  # type: ignore
+
+    print(f"{len(PROPERTIES)} properties of {ITEMS} items")
+    report(
+        "before: ",
+        lambda: [{name: getattr(item, name) for name in PROPERTIES} for item in items],
+        items,
+    )
+    report(
+        "after:  ", lambda: [item.get_properties(PROPERTIES) for item in items], items
+    )
+
+    print(f"all {len(items[0].get_properties())} properties of {ITEMS} items")
+    names = list(items[0].get_properties())
+    report(
+        "before: ",
+        lambda: [{name: getattr(item, name) for name in names} for item in items],
+        items,
+    )
+    report("after:  ", lambda: [item.get_properties() for item in items], items)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Native writes and calls spent applying a style to every item of a block.
+
+Compares setting each attribute, as the README font example does, against
+set_all with skip_unchanged, which reads the current values in bulk and only
+writes the ones that differ. Half of the items already have the style.
+
+    python -m benchmarks.bulk_write
+"""
+
+from time import perf_counter
+from typing import Callable
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+
+ITEMS = 300
+STYLE = {"font_name": "Comic Sans MS", "font_size": 900, "height": 17, "width": 80}
+
+
+def half_styled_block() -> DataBlock:
+    data_block = DataBlock.create(Module.create("BENCHMARK"), "BLOCK")
+    for index in range(ITEMS):
+        item = Item.create(data_block, f"ITEM_{index}")
+        if index % 2:
+            for name, value in STYLE.items():
+                setattr(item, name, value)
+    return data_block
+
+
+def run(api: FakeAPI, label: str, apply: Callable[[], int]) -> None:
+    api.api_calls = 0
+    start = perf_counter()
+    written = apply()
+    elapsed = perf_counter() - start
+    print(
+        f"{label}{written} writes, {api.api_calls} native calls, {elapsed * 1e3:.1f} ms"
+    )
+
+
+def set_each(data_block: DataBlock) -> int:
+    written = 0
+    for item in data_block.items:
+        for name, value in STYLE.items():
+            setattr(item, name, value)
+            written += 1
+    return written
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    data_block = half_styled_block()
+    run(api, "before: ", lambda: set_each(data_block))
+
+    data_block = half_styled_block()
+    run(
+        api,
+        "after:  ",
+        lambda: data_block.items.set_all(STYLE, skip_unchanged=True).written,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Traversal, bulk edit and export throughput against the in-process fake API.
+
+Builds a module of BLOCKS blocks with ITEMS items each through the package
+itself, then walks every item reading its name, sets a few properties on all
+of them, and exports every property of every item, as the scripts using the
+package do. Runs anywhere, as pyoracle_forms.FakeAPI needs no Oracle Forms.
+
+    python -m benchmarks.fake_backend
+"""
+
+from time import perf_counter
+from typing import Callable
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+
+BLOCKS = 20
+ITEMS = 50
+
+
+def timed(name: str, count: int, operation: Callable[[], object]) -> None:
+    start = perf_counter()
+    operation()
+    elapsed = perf_counter() - start
+    print(f"{name:<12}{count:>8}{elapsed * 1e3:>10.1f}{count / elapsed:>12.0f}")
+
+
+def build(module: Module) -> None:
+    for block in range(BLOCKS):
+        data_block = DataBlock.create(module, f"BLOCK_{block}")
+        for item in range(ITEMS):
+            Item.create(data_block, f"ITEM_{item}")
+
+
+def main() -> None:
+    initialize_context(api=FakeAPI())
+    module = Module.create("BENCHMARK")
+    items = BLOCKS * ITEMS
+
+    print(f"{'operation':<12}{'objects':>8}{'ms':>10}{'per second':>12}")
+    timed("create", items, lambda: build(module))
+    timed(
+        "traverse",
+        items,
+        lambda: [item.name for block in module.data_blocks for item in block.items],
+    )
+    timed(
+        "bulk edit",
+        items,
+        lambda: [
+            block.items.set_all({"enabled": True, "maximum_length": 30})
+            for block in module.data_blocks
+        ],
+    )
+    timed(
+        "export",
+        items,
+        lambda: [
+            item.get_properties()
+            for block in module.data_blocks
+            for item in block.items
+        ],
+    )
+    module.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Native calls and time spent finding items by block and item name.
+
+Compares scanning the data blocks and items of a freshly loaded module, as
+scripts had to before, against letting d2fobfo_FindObj do the search.
+
+    python -m benchmarks.find_object
+"""
+
+from time import perf_counter
+from typing import Callable, Optional
+
+from pyoracle_forms import (
+    DataBlock,
+    FakeAPI,
+    FormsObjects,
+    Item,
+    Module,
+    initialize_context,
+)
+from pyoracle_forms.generic_object import BaseObject
+from pyoracle_forms.object_collection import clear_collections
+
+BLOCKS, ITEMS = 10, 100
+
+
+def scan(module: Module, block_name: str, item_name: str) -> Optional[BaseObject]:
+    clear_collections()
+    for data_block in module.data_blocks:
+        if data_block.name == block_name:  # type: ignore
+            for item in data_block.items:  # type: ignore
+                if item.name == item_name:
+                    return item  # type: ignore
+    return None
+
+
+def run(api: FakeAPI, find: Callable[[str, str], Optional[BaseObject]]) -> None:
+    api.api_calls = 0
+    start = perf_counter()
+    found = sum(1 for index in range(BLOCKS) if find(f"BLOCK_{index}", "ITEM_50"))
+    elapsed = perf_counter() - start
+    print(f"{found} lookups, {api.api_calls} native calls, {elapsed * 1e3:.1f} ms")
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    module = Module.create("BENCHMARK")
+    for block_index in range(BLOCKS):
+        data_block = DataBlock.create(module, f"BLOCK_{block_index}")
+        for item_index in range(ITEMS):
+            Item.create(data_block, f"ITEM_{item_index}")
+
+    # nothing cached between lookups, as for every module a script opens
+    print("before: ", end="")
+    run(api, lambda block, item: scan(module, block, item))
+    print("after:  ", end="")
+    run(
+        api,
+        lambda block, item: module.find(f"{block}.{item}", FormsObjects.item),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Per-call cost of a property read through the d2f function table.
+
+Compares the resolved table built in Context.init against the previous way of
+calling the API, which looked the function up, reassigned its argtypes and
+wrapped it in a partial on every call.
+
+    python -m benchmarks.function_table
+"""
+
+from ctypes import byref, c_int, c_void_p, pointer
+from functools import partial
+
+from pyoracle_forms.context import context, get_number, set_number
+from pyoracle_forms.error_handling import raise_for_code
+from pyoracle_forms.generic_object import BaseObject
+
+from benchmarks.stub_api import StubAPI, initialize_stub_context, measure
+
+CALLS = 100_000
+
+
+def legacy_get_number(generic_object: BaseObject, property_number: int) -> int:
+    api_func = getattr(context.api, "d2fobgn_GetNumProp")
+    api_func.argtypes = (c_void_p, c_void_p, c_int, c_void_p)
+    return_value = c_int()
+    error_code = partial(api_func, context)(
+        generic_object, property_number, pointer(return_value)
+    )
+    if error_code:
+        raise_for_code(error_code)
+    return return_value.value
+
+
+def legacy_set_number(
+    generic_object: BaseObject, property_number: int, value: int
+) -> None:
+    api_func = getattr(context.api, "d2fobsn_SetNumProp")
+    api_func.argtypes = (c_void_p, c_void_p, c_int, c_int)
+    error_code = partial(api_func, context)(generic_object, property_number, value)
+    if error_code:
+        raise_for_code(error_code)
+
+
+def main() -> None:
+    initialize_stub_context(StubAPI())
+    obj = BaseObject(c_void_p(1))
+
+    # the callback inside the stub costs the same either way, so it is measured
+    # on its own and subtracted to leave only the overhead added by the package
+    ctx, value = context._as_parameter_, byref(c_int())
+    get_num_prop = context.functions["d2fobgn_GetNumProp"]
+    set_num_prop = context.functions["d2fobsn_SetNumProp"]
+    stub = {
+        "get_number": measure(lambda: get_num_prop(ctx, 1, 263, value), CALLS),
+        "set_number": measure(lambda: set_num_prop(ctx, 1, 263, 10), CALLS),
+    }
+
+    results = {
+        "get_number": (
+            measure(lambda: legacy_get_number(obj, 263), CALLS),
+            measure(lambda: get_number(obj, 263), CALLS),
+        ),
+        "set_number": (
+            measure(lambda: legacy_set_number(obj, 263, 10), CALLS),
+            measure(lambda: set_number(obj, 263, 10), CALLS),
+        ),
+    }
+
+    print("overhead per call on top of the stubbed native function")
+    print(
+        f"{'call':<12}{'stub ns':>10}{'before ns':>12}{'after ns':>12}{'speedup':>10}"
+    )
+    for name, (before, after) in results.items():
+        before, after = before - stub[name], after - stub[name]
+        print(
+            f"{name:<12}{stub[name]:>10.0f}{before:>12.0f}{after:>12.0f}"
+            f"{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
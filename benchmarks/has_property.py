@@ -0,0 +1,68 @@
+"""Native calls and time spent probing which properties items have.
+
+Asks has_property for every known property number of every item in a block,
+as an export of "every property an object has" does. Compares asking the API
+every time against asking it once per object type and property, as with
+initialize_context(confirm_properties=True), and against the bitsets built
+from parsed_<version>.json.
+
+    python -m benchmarks.has_property
+"""
+
+from time import perf_counter
+from typing import Callable, List
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+from pyoracle_forms.context import has_property
+from pyoracle_forms.forms_api import api_metadata
+from pyoracle_forms.generic_object import (
+    BaseObject,
+    checked_properties,
+    load_property_support,
+    supported_properties,
+)
+
+ITEMS = 100
+
+
+def probe(
+    api: FakeAPI,
+    items: List[BaseObject],
+    numbers: List[int],
+    has: Callable[[BaseObject, int], bool],
+) -> None:
+    api.api_calls = 0
+    start = perf_counter()
+    found = sum(has(item, number) for item in items for number in numbers)
+    elapsed = perf_counter() - start
+    print(f"{found} of {len(items) * len(numbers)} supported, ", end="")
+    print(f"{api.api_calls} native calls, {elapsed * 1e3:.1f} ms")
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    data_block = DataBlock.create(Module.create("BENCHMARK"), "BLOCK")
+    for index in range(ITEMS):
+        Item.create(data_block, f"ITEM_{index}")
+    items = list(data_block.items)
+    numbers = sorted(api.property_names)
+
+    print("before:    ", end="")
+    probe(api, items, numbers, has_property)
+
+    supported_properties.clear()
+    checked_properties.clear()
+    print("confirmed: ", end="")
+    probe(api, items, numbers, BaseObject.has_property)
+
+    supported_properties.clear()
+    checked_properties.clear()
+    load_property_support(api_metadata("12c").supported_properties)
+    print("after:     ", end="")
+    probe(api, items, numbers, BaseObject.has_property)
+
+
+if __name__ == "__main__":
+    main()
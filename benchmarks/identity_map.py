@@ -0,0 +1,59 @@
+"""Wrapper allocations and time spent on repeated object property reads.
+
+Reads owning_object of every item of a block many times, as a traversal
+going back up does, comparing constructing a wrapper for every read against
+the identity map handing out the wrapper already in use.
+
+    python -m benchmarks.identity_map
+"""
+
+import tracemalloc
+from time import perf_counter
+from typing import Callable, List
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+from pyoracle_forms.context import get_object
+from pyoracle_forms.generic_object import BaseObject
+from pyoracle_forms.misc import get_object_constructor
+
+ITEMS, ROUNDS = 100, 100
+
+
+def legacy_owning_object(item: BaseObject) -> BaseObject:
+    obj = get_object(item, vars(Item)["owning_object"].number)
+    return get_object_constructor(obj)(obj)
+
+
+def run(items: List[BaseObject], owner: Callable[[BaseObject], BaseObject]) -> None:
+    owners = []
+    tracemalloc.start()
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        owners.extend(owner(item) for item in items)
+    elapsed = perf_counter() - start
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    wrappers = len({id(obj) for obj in owners})
+    print(
+        f"{len(owners)} reads, {wrappers} wrappers, "
+        f"{allocated / 1024:.0f} KiB held, {elapsed * 1e3:.1f} ms"
+    )
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    data_block = DataBlock.create(Module.create("BENCHMARK"), "BLOCK")
+    for index in range(ITEMS):
+        Item.create(data_block, f"ITEM_{index}")
+    items = list(data_block.items)
+
+    print("before: ", end="")
+    run(items, legacy_owning_object)
+    print("after:  ", end="")
+    run(items, lambda item: item.owning_object)  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
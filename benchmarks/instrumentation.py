@@ -0,0 +1,66 @@
+"""Cost of the call statistics, per property read through a descriptor.
+
+Reads the name of every item of a module on the in-process fake API, with
+the statistics never enabled, enabled, and enabled and then disabled again,
+and prints the functions and descriptors that took the most time.
+
+    python -m benchmarks.instrumentation
+"""
+
+from pyoracle_forms import (
+    DataBlock,
+    FakeAPI,
+    Item,
+    Module,
+    disable_stats,
+    enable_stats,
+    initialize_context,
+    reset_stats,
+    stats,
+)
+
+from benchmarks.stub_api import measure
+
+ITEMS = 100
+CALLS = 200
+
+
+def main() -> None:
+    initialize_context(api=FakeAPI())
+    module = Module.create("BENCHMARK")
+    block = DataBlock.create(module, "BLOCK")
+    items = [Item.create(block, f"ITEM_{item}") for item in range(ITEMS)]
+
+    def read_names() -> None:
+        for item in items:
+            item.name
+
+    results = {"never enabled": measure(read_names, CALLS) / ITEMS}
+    enable_stats()
+    results["enabled"] = measure(read_names, CALLS) / ITEMS
+    collected = stats()
+    disable_stats()
+    results["disabled again"] = measure(read_names, CALLS) / ITEMS
+    reset_stats()
+
+    print(f"{'statistics':<16}{'ns per read':>12}")
+    for name, elapsed in results.items():
+        print(f"{name:<16}{elapsed:>12.0f}")
+
+    print()
+    print(f"{'slowest':<24}{'calls':>10}{'errors':>8}{'total ms':>10}")
+    slowest = sorted(
+        [*collected.functions.items(), *collected.descriptors.items()],
+        key=lambda entry: entry[1].total,
+        reverse=True,
+    )
+    for name, call_stats in slowest[:5]:
+        print(
+            f"{name:<24}{call_stats.calls:>10}{call_stats.errors:>8}"
+            f"{call_stats.total * 1e3:>10.1f}"
+        )
+    module.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Native calls and time spent looking up every item of a block by name.
+
+Compares scanning data_block.items and reading each name, the only way there
+used to be, against the name index of the collection.
+
+    python -m benchmarks.name_lookup
+"""
+
+from time import perf_counter
+from typing import Callable, Optional
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+from pyoracle_forms.generic_object import BaseObject
+
+ITEMS = 300
+
+
+def scan(data_block: DataBlock, name: str) -> Optional[BaseObject]:
+    for item in data_block.items:
+        if item.name == name:  # type: ignore
+            return item
+    return None
+
+
+def run(api: FakeAPI, find: Callable[[str], Optional[BaseObject]]) -> None:
+    api.api_calls = 0
+    start = perf_counter()
+    found = sum(1 for index in range(ITEMS) if find(f"ITEM_{index}"))
+    elapsed = perf_counter() - start
+    print(f"{found} lookups, {api.api_calls} native calls, {elapsed * 1e3:.1f} ms")
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    data_block = DataBlock.create(Module.create("BENCHMARK"), "BLOCK")
+    for index in range(ITEMS):
+        Item.create(data_block, f"ITEM_{index}")
+
+    print("before: ", end="")
+    run(api, lambda name: scan(data_block, name))
+    print("after:  ", end="")
+    run(api, lambda name: data_block.items.get(name))  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Cost of wrapping object handles in their Python class.
+
+Compares get_object_constructor, which looks the class up by the object type
+number, against resolving the type name through d2fobgcn_GetConstName for
+every handle as it used to.
+
+    python -m benchmarks.object_dispatch
+"""
+
+from ctypes import addressof, create_string_buffer, string_at
+from time import perf_counter
+from typing import Callable
+
+from pyoracle_forms.context import object_name, query_type
+from pyoracle_forms.generic_object import BaseObject, GenericObject
+from pyoracle_forms.misc import get_object_constructor, objects, registered_objects
+
+from benchmarks.stub_api import (
+    StubAPI,
+    initialize_stub_context,
+    write_int,
+    write_pointer,
+)
+
+HANDLES = 100_000
+ITEM_TYPE = 15
+
+item_name = create_string_buffer(b"ITEM")
+
+
+def query_item_type(ctx: int, obj: int, type_number: int) -> int:
+    write_int(type_number, ITEM_TYPE)
+    return 0
+
+
+def get_item_name(ctx: int, type_number: int, name: int) -> int:
+    write_pointer(name, addressof(item_name))
+    return 0
+
+
+def get_object_number(ctx: int, name: int, type_number: int) -> int:
+    if string_at(name) != item_name.value:
+        return 1
+    write_int(type_number, ITEM_TYPE)
+    return 0
+
+
+def legacy_get_object_constructor(obj: BaseObject) -> objects:
+    return registered_objects.get(object_name(query_type(obj)), GenericObject)
+
+
+def wrap_handles(constructor: Callable[[BaseObject], objects]) -> float:
+    start = perf_counter()
+    for handle in range(1, HANDLES + 1):
+        obj = BaseObject(handle)
+        constructor(obj)(obj)
+    return perf_counter() - start
+
+
+def main() -> None:
+    initialize_stub_context(
+        StubAPI(
+            {
+                "d2fobqt_QueryType": query_item_type,
+                "d2fobgcn_GetConstName": get_item_name,
+                "d2fobgcv_GetConstValue": get_object_number,
+            }
+        )
+    )
+
+    before = min(wrap_handles(legacy_get_object_constructor) for _ in range(3))
+    after = min(wrap_handles(get_object_constructor) for _ in range(3))
+
+    print(f"wrapping {HANDLES} handles")
+    print(f"before: {before:.3f}s ({before / HANDLES * 1e9:.0f} ns per handle)")
+    print(f"after:  {after:.3f}s ({after / HANDLES * 1e9:.0f} ns per handle)")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Native calls and time spent reordering items through data_block.items.
+
+Compares reading the whole chain again on every access, as Subobjects used to,
+against the cached collection that is updated in place by move.
+
+    python -m benchmarks.reorder
+"""
+
+from time import perf_counter
+from typing import Callable, List
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+from pyoracle_forms.context import get_object
+from pyoracle_forms.generic_object import BaseObject
+from pyoracle_forms.misc import object_chain
+
+ITEMS = 200
+
+
+def legacy_items(data_block: DataBlock) -> List[BaseObject]:
+    return list(object_chain(get_object(data_block, vars(DataBlock)["items"].number)))
+
+
+def reverse(items: Callable[[], List[BaseObject]]) -> None:
+    for index in range(ITEMS - 1):
+        items()[-1].move(items()[index])
+
+
+def run(api: FakeAPI, items: Callable[[], List[BaseObject]]) -> None:
+    api.api_calls = 0
+    start = perf_counter()
+    reverse(items)
+    elapsed = perf_counter() - start
+    print(f"{ITEMS} moves, {api.api_calls} native calls, {elapsed * 1e3:.1f} ms")
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    data_block = DataBlock.create(Module.create("BENCHMARK"), "BLOCK")
+    for index in range(ITEMS):
+        Item.create(data_block, f"ITEM_{index}")
+
+    print("before: ", end="")
+    run(api, lambda: legacy_items(data_block))
+    print("after:  ", end="")
+    run(api, lambda: data_block.items)  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
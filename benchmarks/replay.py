@@ -0,0 +1,76 @@
+"""Recording and replaying a trace of the calls a script makes.
+
+Runs a script building and reading a module on the in-process fake API, plain
+and while being recorded, then replays the recorded trace, and prints the time
+of each along with the size of the trace.
+
+    python -m benchmarks.replay
+"""
+
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from pyoracle_forms import (
+    DataBlock,
+    FakeAPI,
+    Item,
+    Module,
+    context,
+    initialize_context,
+    replay,
+    trace,
+)
+
+BLOCKS = 10
+ITEMS = 50
+
+
+def script() -> None:
+    with Module.create("BENCHMARK") as module:
+        for block in range(BLOCKS):
+            data_block = DataBlock.create(module, f"BLOCK_{block}")
+            for item in range(ITEMS):
+                Item.create(data_block, f"ITEM_{item}").prompt = f"Item {item}"
+        for data_block in module.data_blocks:
+            for item in data_block.items:
+                item.name, item.prompt
+
+
+def run(path: str, traced: bool) -> float:
+    initialize_context(api=FakeAPI())
+    start = perf_counter()
+    if traced:
+        with trace(path):
+            script()
+    else:
+        script()
+    elapsed = perf_counter() - start
+    context.destroy_context()
+    return elapsed
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.trace")
+        plain = run(path, traced=False)
+        recorded = run(path, traced=True)
+        start = perf_counter()
+        replay_stats = replay(path, script)
+        replayed = perf_counter() - start
+        size = os.path.getsize(path)
+
+    print(f"{'run':<12}{'ms':>10}")
+    print(f"{'plain':<12}{plain * 1e3:>10.1f}")
+    print(f"{'recorded':<12}{recorded * 1e3:>10.1f}")
+    print(f"{'replayed':<12}{replayed * 1e3:>10.1f}")
+    print()
+    print(f"{replay_stats.calls} calls, {size / replay_stats.calls:.1f} bytes each")
+    print(
+        f"native {replay_stats.native * 1e3:.1f} ms, "
+        f"python {replay_stats.python * 1e3:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
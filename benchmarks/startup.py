@@ -0,0 +1,91 @@
+"""Time spent loading the property metadata in initialize_context.
+
+Every sample runs in a fresh interpreter, as a script calling initialize_context
+would, comparing parsing parsed_<version>.json and deriving the tables from it
+against importing the module precompiled by forms_api/api_scraper.py. The time
+to import the package itself is shown alongside.
+
+    python -m benchmarks.startup
+"""
+
+import os
+import subprocess
+import sys
+from statistics import median
+from typing import Dict, List
+
+RUNS = 20
+VERSION = "12c"
+
+SAMPLES = {
+    "import pyoracle_forms": "import pyoracle_forms",
+    "parse json": f"""
+from pyoracle_forms.forms_api import read_api_objects
+api_objects = read_api_objects("{VERSION}")
+property_numbers = {{
+    api_property["macro_name"][5:]: api_property["property_number"]
+    for api_object in api_objects.values()
+    for api_property in api_object["properties"]
+}}
+supported_properties = {{
+    api_object["object_number"]: sum(
+        {{1 << api_property["property_number"] for api_property in api_object["properties"]}}
+    )
+    for name, api_object in api_objects.items()
+    if name != "D2FFO_ANY"
+}}
+""",
+    "precompiled": f"""
+from pyoracle_forms.forms_api import api_metadata
+api_metadata("{VERSION}")
+""",
+}
+
+TIMER = """
+from time import perf_counter
+{setup}
+start = perf_counter()
+exec(compile({code!r}, "<sample>", "exec"))
+print(perf_counter() - start)
+"""
+
+
+# installed packages have their bytecode written, whatever this shell says
+ENVIRONMENT = {
+    name: value
+    for name, value in os.environ.items()
+    if name != "PYTHONDONTWRITEBYTECODE"
+}
+
+
+def sample(code: str) -> float:
+    # the package itself is imported up front, except when that is measured
+    setup = "" if code == SAMPLES["import pyoracle_forms"] else "import pyoracle_forms"
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(setup=setup, code=code)],
+        env=ENVIRONMENT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def main() -> None:
+    # once first, so the timed runs get the bytecode from __pycache__
+    for code in SAMPLES.values():
+        sample(code)
+
+    results: Dict[str, List[float]] = {name: [] for name in SAMPLES}
+    for _ in range(RUNS):
+        for name, code in SAMPLES.items():
+            results[name].append(sample(code))
+
+    print(f"median of {RUNS} fresh interpreters, api version {VERSION}")
+    print(f"{'step':<24}{'ms':>8}")
+    for name, times in results.items():
+        print(f"{name:<24}{median(times) * 1e3:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Stand-in for the Oracle Forms d2f library, used to benchmark the Python side.
+
+Every entry point is a real ctypes callback built with the same signature the
+package binds, so argument conversion costs the same as with the actual DLL,
+only the work done inside the native call is gone.
+"""
+
+from ctypes import CFUNCTYPE, c_int, c_void_p
+from timeit import repeat
+from typing import Callable, Dict, Optional
+from unittest import mock
+
+from pyoracle_forms import initialize_context
+from pyoracle_forms.context import api_signatures
+
+
+def succeed(*args: object) -> int:
+    return 0
+
+
+def write_int(address: int, value: int) -> None:
+    c_int.from_address(address).value = value
+
+
+def write_pointer(address: int, value: Optional[int]) -> None:
+    c_void_p.from_address(address).value = value
+
+
+class StubAPI:
+    def __init__(self, implementations: Optional[Dict[str, Callable]] = None):
+        implementations = implementations or {}
+        for api_function_name, arguments in api_signatures.items():
+            prototype = CFUNCTYPE(c_int, c_void_p, *arguments)
+            implementation = implementations.get(api_function_name, succeed)
+            setattr(self, api_function_name, prototype(implementation))
+
+        self.d2fctxcr_Create = CFUNCTYPE(c_int, c_void_p, c_void_p)(self.create_context)
+        self.free = CFUNCTYPE(None, c_void_p)(lambda address: None)
+
+    @staticmethod
+    def create_context(ctx: int, attributes: int) -> int:
+        write_pointer(ctx, 1)
+        return 0
+
+
+def initialize_stub_context(api: StubAPI) -> None:
+    with mock.patch("pyoracle_forms.context.dlls", return_value=(api, api)):
+        initialize_context()
+
+
+def measure(func: Callable[[], object], number: int) -> float:
+    """Nanoseconds per call of func, best of three runs."""
+    return min(repeat(func, number=number, repeat=3)) / number * 1e9
@@ -0,0 +1,53 @@
+"""Native calls and time spent iterating a sibling chain.
+
+Compares Subobjects, which follows D2FP_NEXT with the class of the first
+child, against wrapping every sibling through its next_object attribute.
+
+    python -m benchmarks.subobjects
+"""
+
+from time import perf_counter
+from typing import Callable, Iterable
+
+from pyoracle_forms import DataBlock, FakeAPI, Item, Module, initialize_context
+from pyoracle_forms.context import get_object
+from pyoracle_forms.generic_object import BaseObject
+from pyoracle_forms.misc import get_object_constructor
+
+ITEMS = 1_000
+
+
+def legacy_items(data_block: DataBlock) -> Iterable[BaseObject]:
+    first_child = get_object(data_block, vars(DataBlock)["items"].number)
+    if first_child:
+        klass = get_object_constructor(first_child)
+        child = klass(first_child)
+        while child:
+            yield child
+            child = klass(child.next_object)  # type: ignore
+
+
+def walk(api: FakeAPI, items: Callable[[], Iterable[BaseObject]]) -> None:
+    api.api_calls = 0
+    start = perf_counter()
+    count = sum(1 for _ in items())
+    elapsed = perf_counter() - start
+    print(f"{count} items, {api.api_calls} native calls, {elapsed * 1e3:.1f} ms")
+
+
+def main() -> None:
+    api = FakeAPI()
+    initialize_context(api=api)
+
+    data_block = DataBlock.create(Module.create("BENCHMARK"), "BLOCK")
+    for index in range(ITEMS):
+        Item.create(data_block, f"ITEM_{index}")
+
+    print("before: ", end="")
+    walk(api, lambda: legacy_items(data_block))
+    print("after:  ", end="")
+    walk(api, lambda: iter(data_block.items))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Benchmark suite of the common paths, with results kept as json.
+
+Generates a module of BLOCKS blocks, each with ITEMS items, each item with
+TRIGGERS triggers, on the in-process fake API, and times full traversal, bulk
+text reads, bulk sets, creating items in a loop, moving items, collection
+indexing and saving. Every operation starts from a freshly generated module,
+with nothing cached, and the best of REPEAT runs is kept.
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --compare baseline.json
+
+With --compare, operations that got slower per object than the baseline by
+more than --threshold are flagged, and the exit status is 1 if there are any.
+"""
+
+import argparse
+import json
+import os
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple
+
+from pyoracle_forms import (
+    DataBlock,
+    FakeAPI,
+    Item,
+    Module,
+    Trigger,
+    context,
+    initialize_context,
+)
+from pyoracle_forms.object_collection import clear_collections
+
+
+class Sizes(NamedTuple):
+    blocks: int
+    items: int
+    triggers: int
+
+
+class Case(NamedTuple):
+    # number of objects operated on, and the operation itself
+    objects: Callable[[Sizes], int]
+    operation: Callable[[Module, Sizes], object]
+
+
+def generate(sizes: Sizes) -> Module:
+    module = Module.create("BENCHMARK")
+    for block in range(sizes.blocks):
+        data_block = DataBlock.create(module, f"BLOCK_{block}")
+        for item in range(sizes.items):
+            created = Item.create(data_block, f"ITEM_{item}")
+            created.prompt = f"Item {item}"
+            for trigger in range(sizes.triggers):
+                Trigger.create(created, f"TRIGGER_{trigger}")
+    return module
+
+
+def traverse(module: Module, sizes: Sizes) -> None:
+    for data_block in module.data_blocks:
+        for item in data_block.items:
+            item.name
+            for trigger in item.triggers:
+                trigger.name
+
+
+def text_reads(module: Module, sizes: Sizes) -> None:
+    for data_block in module.data_blocks:
+        for item in data_block.items:
+            item.get_properties(["name", "prompt", "hint", "tooltip"])
+
+
+def bulk_sets(module: Module, sizes: Sizes) -> None:
+    for data_block in module.data_blocks:
+        data_block.items.set_all(
+            {"enabled": False, "maximum_length": 30, "hint": "Hint"}
+        )
+
+
+def create_items(module: Module, sizes: Sizes) -> None:
+    data_block = DataBlock.create(module, "CREATED")
+    for item in range(sizes.items * sizes.blocks):
+        Item.create(data_block, f"CREATED_{item}")
+
+
+def move_items(module: Module, sizes: Sizes) -> None:
+    # reverses the items of every block, one move at a time
+    for data_block in module.data_blocks:
+        items = list(data_block.items)
+        for item in items[1:]:
+            item.move(data_block.items[0])
+
+
+def index_collections(module: Module, sizes: Sizes) -> None:
+    for data_block in module.data_blocks:
+        items = data_block.items
+        for item in range(sizes.items):
+            items[item]
+            items[f"item_{item}"]
+
+
+def save(module: Module, sizes: Sizes) -> None:
+    with TemporaryDirectory() as directory:
+        module.save(os.path.join(directory, "benchmark.fmb"))
+
+
+def items(sizes: Sizes) -> int:
+    return sizes.blocks * sizes.items
+
+
+cases: Dict[str, Case] = {
+    "traverse": Case(lambda sizes: items(sizes) * (1 + sizes.triggers), traverse),
+    "text reads": Case(items, text_reads),
+    "bulk sets": Case(items, bulk_sets),
+    "create": Case(items, create_items),
+    "move": Case(lambda sizes: items(sizes) - sizes.blocks, move_items),
+    "indexing": Case(lambda sizes: items(sizes) * 2, index_collections),
+    "save": Case(lambda sizes: items(sizes) * (1 + sizes.triggers), save),
+}
+
+
+def run(name: str, sizes: Sizes, repeat: int) -> float:
+    # best seconds of the operation over repeat freshly generated modules
+    timings: List[float] = []
+    for _ in range(repeat):
+        initialize_context(api=FakeAPI())
+        module = generate(sizes)
+        # nothing kept from generating it
+        clear_collections()
+        start = perf_counter()
+        cases[name].operation(module, sizes)
+        timings.append(perf_counter() - start)
+        context.destroy_context()
+    return min(timings)
+
+
+def measure(sizes: Sizes, repeat: int) -> Dict[str, object]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name, case in cases.items():
+        seconds = run(name, sizes, repeat)
+        objects = case.objects(sizes)
+        results[name] = {
+            "objects": objects,
+            "seconds": seconds,
+            "ns_per_object": seconds / objects * 1e9,
+        }
+    return {"sizes": sizes._asdict(), "repeat": repeat, "results": results}
+
+
+def compare(
+    current: Dict[str, object], baseline: Dict[str, object], threshold: float
+) -> List[str]:
+    # names of the operations slower than the baseline by more than threshold
+    print(f"{'operation':<12}{'baseline':>12}{'current':>12}{'change':>9}")
+    regressions = []
+    results: Dict[str, Dict[str, float]] = current["results"]  # type: ignore
+    baseline_results: Dict[str, Dict[str, float]] = baseline["results"]  # type: ignore
+    for name, result in results.items():
+        if name not in baseline_results:
+            continue
+        before = baseline_results[name]["ns_per_object"]
+        after = result["ns_per_object"]
+        change = after / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  slower"
+        print(f"{name:<12}{before:>12.0f}{after:>12.0f}{change:>+9.0%}{flag}")
+    if current["sizes"] != baseline["sizes"]:
+        print("the baseline was measured on a module of another size")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=10)
+    parser.add_argument("--items", type=int, default=20)
+    parser.add_argument("--triggers", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="json file to write the results to")
+    parser.add_argument("--compare", help="json file of baseline results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown flagged as a regression, 0.1 being 10%%",
+    )
+    arguments = parser.parse_args()
+
+    sizes = Sizes(arguments.blocks, arguments.items, arguments.triggers)
+    current = measure(sizes, arguments.repeat)
+    if arguments.output:
+        with open(arguments.output, mode="w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare, mode="r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        if compare(current, baseline, arguments.threshold):
+            sys.exit(1)
+    else:
+        print(f"{'operation':<12}{'objects':>8}{'ms':>10}{'ns per object':>15}")
+        results: Dict[str, Dict[str, float]] = current["results"]  # type: ignore
+        for name, result in results.items():
+            print(
+                f"{name:<12}{result['objects']:>8.0f}{result['seconds'] * 1e3:>10.1f}"
+                f"{result['ns_per_object']:>15.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Time and Python memory allocated per text property read.
+
+Compares the former String out-parameter, a c_char_p subclass freeing the
+API allocated text from __del__, against get_text, which reuses one pointer
+and frees the text as soon as it is copied. The stub API hands out real
+malloc'd copies of a trigger body, released with the C library free.
+
+    python -m benchmarks.text_reads
+"""
+
+import tracemalloc
+from ctypes import CDLL, byref, c_char_p, c_int, c_void_p
+from ctypes.util import find_library
+from typing import Callable, Optional
+
+from pyoracle_forms.context import api_function, context, get_text
+from pyoracle_forms.error_handling import raise_for_code
+
+from benchmarks.stub_api import StubAPI, initialize_stub_context, measure, write_pointer
+
+READS = 100_000
+
+libc = CDLL(find_library("c"))
+libc.strdup.argtypes, libc.strdup.restype = (c_char_p,), c_void_p
+trigger_text = b"BEGIN\n  GO_BLOCK('EMP');\n  EXECUTE_QUERY;\nEND;\n" * 20
+
+
+def get_trigger_text(ctx: int, obj: int, number: int, value: int) -> int:
+    write_pointer(value, libc.strdup(trigger_text))
+    return 0
+
+
+class String(c_char_p):
+    def __init__(self) -> None:
+        super().__init__()
+        self.free = context.free
+
+    def __del__(self) -> None:
+        self.free(self)  # type: ignore
+
+
+legacy_func = api_function("d2fobgt_GetTextProp", (c_void_p, c_int, c_void_p))
+
+
+def legacy_get_text(generic_object: int, property_number: int) -> Optional[bytes]:
+    return_value = String()
+    error_code = legacy_func(generic_object, property_number, byref(return_value))
+    if error_code:
+        raise_for_code(error_code)
+    return return_value.value
+
+
+def peak_allocation(read: Callable[[int, int], Optional[bytes]]) -> int:
+    # most Python memory held at once during a read, the text itself included
+    tracemalloc.start()
+    read(1, 1)
+    peaks = []
+    for _ in range(100):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        read(1, 1)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+    return min(peaks)
+
+
+def main() -> None:
+    api = StubAPI({"d2fobgt_GetTextProp": get_trigger_text})
+    api.free = libc.free  # type: ignore
+    initialize_stub_context(api)
+
+    assert legacy_get_text(1, 1) == get_text(1, 1) == trigger_text
+
+    print(f"reading a {len(trigger_text)} byte text {READS} times")
+    for label, read in (("before: ", legacy_get_text), ("after:  ", get_text)):
+        per_read = measure(lambda: read(1, 1), number=READS)
+        peak = peak_allocation(read)
+        print(f"{label}{per_read:.0f} ns per read, {peak} bytes allocated at peak")
+
+
+if __name__ == "__main__":
+    main()
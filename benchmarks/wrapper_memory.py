@@ -0,0 +1,42 @@
+"""Memory held per wrapper, for N wrapped handles.
+
+Compares wrappers laid out as before, with an instance __dict__ holding a
+c_void_p, against the slot based wrappers holding the plain handle value.
+
+    python -m benchmarks.wrapper_memory
+"""
+
+import tracemalloc
+from ctypes import c_void_p
+from typing import Callable, List
+
+from pyoracle_forms import Item
+
+HANDLES = 100_000
+
+
+class LegacyItem:
+    def __init__(self, generic_object: c_void_p) -> None:
+        self._as_parameter_ = generic_object
+
+
+def bytes_per_wrapper(wrap: Callable[[int], object]) -> float:
+    tracemalloc.start()
+    wrappers: List[object] = [wrap(handle) for handle in range(1, HANDLES + 1)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(wrappers) == HANDLES
+    return allocated / HANDLES
+
+
+def main() -> None:
+    before = bytes_per_wrapper(lambda handle: LegacyItem(c_void_p(handle)))
+    after = bytes_per_wrapper(lambda handle: Item(c_void_p(handle)))
+
+    print(f"wrapping {HANDLES} handles")
+    print(f"before: {before:.0f} bytes per wrapper")
+    print(f"after:  {after:.0f} bytes per wrapper")
+
+
+if __name__ == "__main__":
+    main()
@@ -148,8 +148,89 @@ def parse_all():
             json.dump(parse_headers(version), file, indent=2)
 
 
+def compile_metadata(api_version, api_objects):
+    # the parts of the parsed headers initialize_context needs, as a module
+    # that gets imported from bytecode instead of parsing the json every time
+    object_numbers = {
+        obj_name: api_object["object_number"]
+        for obj_name, api_object in sorted(api_objects.items())
+    }
+    property_numbers = {
+        api_property["macro_name"][5:]: api_property["property_number"]
+        for api_object in api_objects.values()
+        for api_property in api_object["properties"]
+    }
+    property_types = {
+        api_property["property_number"]: api_property["data_type"]
+        for api_object in api_objects.values()
+        for api_property in api_object["properties"]
+    }
+    supported_properties = {
+        api_object["object_number"]: sum(
+            {
+                1 << api_property["property_number"]
+                for api_property in api_object["properties"]
+            }
+        )
+        for obj_name, api_object in api_objects.items()
+        if obj_name != "D2FFO_ANY"
+    }
+
+    lines = [
+        f"# generated by forms_api/api_scraper.py from parsed_{api_version}.json",
+        "from typing import Dict",
+        "",
+        "object_numbers: Dict[str, int] = {",
+        *(f'    "{name}": {number},' for name, number in object_numbers.items()),
+        "}",
+        "",
+        "property_numbers: Dict[str, int] = {",
+        *(
+            f'    "{name}": {number},'
+            for name, number in sorted(property_numbers.items())
+        ),
+        "}",
+        "",
+        "# data types of the properties, by property number",
+        "property_types: Dict[int, str] = {",
+        *(
+            f'    {number}: "{data_type}",'
+            for number, data_type in sorted(property_types.items())
+        ),
+        "}",
+        "",
+        "# bitsets of the property numbers every object type has, by object number",
+        "supported_properties: Dict[int, int] = {",
+        *(
+            f"    {number}: 0x{bits:X},"
+            for number, bits in sorted(supported_properties.items())
+        ),
+        "}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def compile_all():
+    versions = ["6i", "10g", "12c"]
+
+    for version in versions:
+        with open(
+            f"../pyoracle_forms/forms_api/parsed_{version}.json",
+            mode="r",
+            encoding="utf-8",
+        ) as file:
+            api_objects = json.load(file)
+        with open(
+            f"../pyoracle_forms/metadata/api_{version}.py",
+            mode="w",
+            encoding="utf-8",
+        ) as file:
+            file.write(compile_metadata(version, api_objects))
+
+
 def main():
     parse_all()
+    compile_all()
 
 
 if __name__ == "__main__":
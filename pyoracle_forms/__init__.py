@@ -1,164 +1,406 @@
+from importlib import import_module
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
 from .context import context
-from .context import move
 from .context import property_type
 from .context import property_constant_number
 from .context import object_number
-from .generic_object import FormsObjects
+from .context import property_numbers
 from .error_handling import FormsException
-from .forms_api import read_api_objects
-from .forms_objects import Alert
-from .forms_objects import AttachedLibrary
-from .forms_objects import Canvas
-from .forms_objects import ColumnValue
-from .forms_objects import CompoundText
-from .forms_objects import DataBlock
-from .forms_objects import DataSourceArgument
-from .forms_objects import DataSourceColumn
-from .forms_objects import Editor
-from .forms_objects import Event
-from .forms_objects import FormParameter
-from .forms_objects import GenericObject
-from .forms_objects import Graphic
-from .forms_objects import Item
-from .forms_objects import Library
-from .forms_objects import LibraryProgramUnit
-from .forms_objects import LOV
-from .forms_objects import LOVColumnMap
-from .forms_objects import Menu
-from .forms_objects import MenuItem
-from .forms_objects import Module
-from .forms_objects import ObjectLibrary
-from .forms_objects import ObjectLibraryTab
-from .forms_objects import ObjectChild
-from .forms_objects import ObjectGroup
-from .forms_objects import Point
-from .forms_objects import ProgramUnit
-from .forms_objects import PropertyClass
-from .forms_objects import RadioButton
-from .forms_objects import RecordGroup
-from .forms_objects import RecordGroupColspec
-from .forms_objects import Relation
-from .forms_objects import Report
-from .forms_objects import TabPage
-from .forms_objects import Trigger
-from .forms_objects import VisualAttribute
-from .forms_objects import VisualState
-from .forms_objects import Window
-from .misc import add_properties
-from .misc import registered_objects
-from .property_types import Properties
-from .constants import Justification
-from .constants import DefaultAlertButton
-from .constants import AlertStyle
-from .constants import Bevel
-from .constants import CaseRestriction
-from .constants import CheckBoxMappingofOtherValues
-from .constants import CanvasType
-from .constants import ColumnDataType
-from .constants import CommandType
-from .constants import ImageFormat
-from .constants import ImageDepth
-from .constants import CoordinateSystem
-from .constants import CursorMode
-from .constants import DeleteRecordBehavior
-from .constants import InitialKeyboardState
-from .constants import Direction
-from .constants import ExecutionHierarchy
-from .constants import FontStyle
-from .constants import FontWeight
-from .constants import FontSpacing
-from .constants import ParameterDataType
-from .constants import ExecutionMode
-from .constants import ItemType
-from .constants import DataType
-from .constants import KeyMode
-from .constants import PLSQLLibrarySource
-from .constants import LockingMode
-from .constants import ListType
-from .constants import ListStyle
-from .constants import MagicItem
-from .constants import MenuItemType
-from .constants import CompressionQuality
-from .constants import MouseNavigationLimit
-from .constants import NavigationStyle
-from .constants import DisplayQuality
-from .constants import ReadingOrder
-from .constants import RealUnit
-from .constants import RecordGroupType
-from .constants import RecordOrientation
-from .constants import ScrollBarOrientation
-from .constants import SizingStyle
-from .constants import TriggerStyle
-from .constants import PromptFontStyle
-from .constants import CalculationMode
-from .constants import PromptFontWeight
-from .constants import PromptFontSpacing
-from .constants import PromptDisplayStyle
-from .constants import ValidationUnit
-from .constants import WindowStyle
-from .constants import WrapStyle
-from .constants import GraphicsType
-from .constants import ArrowStyle
-from .constants import PromptReadingOrder
-from .constants import PromptJustification
-from .constants import PromptAttachmentEdge
-from .constants import PromptAlignment
-from .constants import FrameTitleReadingOrder
-from .constants import FrameTitleAlignment
-from .constants import LayoutStyle
-from .constants import FrameAlignment
-from .constants import SingleObjectAlignment
-from .constants import StartPromptAlignment
-from .constants import TopPromptAlignment
-from .constants import UpdateLayout
-from .constants import DashStyle
-from .constants import CapStyle
-from .constants import JoinStyle
-from .constants import LineSpacing
-from .constants import HorizontalOrigin
-from .constants import VerticalOrigin
-from .constants import HorizontalJustification
-from .constants import VerticalJustification
-from .constants import SummaryFunction
-from .constants import ArgumentMode
-from .constants import CommunicationMode
-from .constants import ColumnType
-from .constants import ArgumentType
-from .constants import QueryDataSourceType
-from .constants import DMLDataTargetType
-from .constants import TabAttachmentEdge
-from .constants import VisualAttributeType
-from .constants import FrameTitleFontStyle
-from .constants import FrameTitleFontWeight
-from .constants import FrameTitleFontSpacing
-from .constants import CornerStyle
-from .constants import InteractionMode
-from .constants import IsolationMode
-from .constants import ReportDestinationType
-from .constants import KeyboardState
-from .constants import ScrollBarAlignment
-from .constants import ProgramUnitType
-from .constants import RuntimeCompatibilityMode
-from .constants import GraphicFontWeight
-from .constants import GraphicFontSpacing
-from .constants import RelationType
-from .constants import DataLengthSemantics
-from .constants import EventType
-from .constants import Scope
-from .constants import ViewMode
+from .error_handling import DLLNotFoundError
+from .error_handling import TraceError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .fake_api import CallbackAPI, FakeAPI
+    from .instrumentation import stats
+    from .instrumentation import reset_stats
+    from .instrumentation import enable_stats
+    from .instrumentation import disable_stats
+    from .tracing import ReplayAPI
+    from .tracing import read_trace
+    from .tracing import replay
+    from .tracing import start_trace
+    from .tracing import stop_trace
+    from .tracing import trace
+    from .generic_object import move
+    from .generic_object import FormsObjects
+    from .forms_api import read_api_objects
+    from .forms_api import api_metadata
+    from .generic_object import load_property_support
+    from .forms_objects import Alert
+    from .forms_objects import AttachedLibrary
+    from .forms_objects import Canvas
+    from .forms_objects import ColumnValue
+    from .forms_objects import CompoundText
+    from .forms_objects import DataBlock
+    from .forms_objects import DataSourceArgument
+    from .forms_objects import DataSourceColumn
+    from .forms_objects import Editor
+    from .forms_objects import Event
+    from .forms_objects import FormParameter
+    from .forms_objects import GenericObject
+    from .forms_objects import Graphic
+    from .forms_objects import Item
+    from .forms_objects import Library
+    from .forms_objects import LibraryProgramUnit
+    from .forms_objects import LOV
+    from .forms_objects import LOVColumnMap
+    from .forms_objects import Menu
+    from .forms_objects import MenuItem
+    from .forms_objects import Module
+    from .forms_objects import ObjectLibrary
+    from .forms_objects import ObjectLibraryTab
+    from .forms_objects import ObjectChild
+    from .forms_objects import ObjectGroup
+    from .forms_objects import Point
+    from .forms_objects import ProgramUnit
+    from .forms_objects import PropertyClass
+    from .forms_objects import RadioButton
+    from .forms_objects import RecordGroup
+    from .forms_objects import RecordGroupColspec
+    from .forms_objects import Relation
+    from .forms_objects import Report
+    from .forms_objects import TabPage
+    from .forms_objects import Trigger
+    from .forms_objects import VisualAttribute
+    from .forms_objects import VisualState
+    from .forms_objects import Window
+    from .misc import add_properties
+    from .object_collection import ObjectCollection
+    from .misc import index_object_classes
+    from .misc import registered_objects
+    from .property_types import Properties
+    from .constants import Justification
+    from .constants import DefaultAlertButton
+    from .constants import AlertStyle
+    from .constants import Bevel
+    from .constants import CaseRestriction
+    from .constants import CheckBoxMappingofOtherValues
+    from .constants import CanvasType
+    from .constants import ColumnDataType
+    from .constants import CommandType
+    from .constants import ImageFormat
+    from .constants import ImageDepth
+    from .constants import CoordinateSystem
+    from .constants import CursorMode
+    from .constants import DeleteRecordBehavior
+    from .constants import InitialKeyboardState
+    from .constants import Direction
+    from .constants import ExecutionHierarchy
+    from .constants import FontStyle
+    from .constants import FontWeight
+    from .constants import FontSpacing
+    from .constants import ParameterDataType
+    from .constants import ExecutionMode
+    from .constants import ItemType
+    from .constants import DataType
+    from .constants import KeyMode
+    from .constants import PLSQLLibrarySource
+    from .constants import LockingMode
+    from .constants import ListType
+    from .constants import ListStyle
+    from .constants import MagicItem
+    from .constants import MenuItemType
+    from .constants import CompressionQuality
+    from .constants import MouseNavigationLimit
+    from .constants import NavigationStyle
+    from .constants import DisplayQuality
+    from .constants import ReadingOrder
+    from .constants import RealUnit
+    from .constants import RecordGroupType
+    from .constants import RecordOrientation
+    from .constants import ScrollBarOrientation
+    from .constants import SizingStyle
+    from .constants import TriggerStyle
+    from .constants import PromptFontStyle
+    from .constants import CalculationMode
+    from .constants import PromptFontWeight
+    from .constants import PromptFontSpacing
+    from .constants import PromptDisplayStyle
+    from .constants import ValidationUnit
+    from .constants import WindowStyle
+    from .constants import WrapStyle
+    from .constants import GraphicsType
+    from .constants import ArrowStyle
+    from .constants import PromptReadingOrder
+    from .constants import PromptJustification
+    from .constants import PromptAttachmentEdge
+    from .constants import PromptAlignment
+    from .constants import FrameTitleReadingOrder
+    from .constants import FrameTitleAlignment
+    from .constants import LayoutStyle
+    from .constants import FrameAlignment
+    from .constants import SingleObjectAlignment
+    from .constants import StartPromptAlignment
+    from .constants import TopPromptAlignment
+    from .constants import UpdateLayout
+    from .constants import DashStyle
+    from .constants import CapStyle
+    from .constants import JoinStyle
+    from .constants import LineSpacing
+    from .constants import HorizontalOrigin
+    from .constants import VerticalOrigin
+    from .constants import HorizontalJustification
+    from .constants import VerticalJustification
+    from .constants import SummaryFunction
+    from .constants import ArgumentMode
+    from .constants import CommunicationMode
+    from .constants import ColumnType
+    from .constants import ArgumentType
+    from .constants import QueryDataSourceType
+    from .constants import DMLDataTargetType
+    from .constants import TabAttachmentEdge
+    from .constants import VisualAttributeType
+    from .constants import FrameTitleFontStyle
+    from .constants import FrameTitleFontWeight
+    from .constants import FrameTitleFontSpacing
+    from .constants import CornerStyle
+    from .constants import InteractionMode
+    from .constants import IsolationMode
+    from .constants import ReportDestinationType
+    from .constants import KeyboardState
+    from .constants import ScrollBarAlignment
+    from .constants import ProgramUnitType
+    from .constants import RuntimeCompatibilityMode
+    from .constants import GraphicFontWeight
+    from .constants import GraphicFontSpacing
+    from .constants import RelationType
+    from .constants import DataLengthSemantics
+    from .constants import EventType
+    from .constants import Scope
+    from .constants import ViewMode
+
+# the wrapper classes and the enums for the constants are most of the import
+# time, so these names get imported from their modules only on first use
+lazy_imports: Dict[str, Tuple[str, ...]] = {
+    "generic_object": (
+        "move",
+        "FormsObjects",
+        "load_property_support",
+    ),
+    "forms_api": (
+        "read_api_objects",
+        "api_metadata",
+    ),
+    "forms_objects": (
+        "Alert",
+        "AttachedLibrary",
+        "Canvas",
+        "ColumnValue",
+        "CompoundText",
+        "DataBlock",
+        "DataSourceArgument",
+        "DataSourceColumn",
+        "Editor",
+        "Event",
+        "FormParameter",
+        "GenericObject",
+        "Graphic",
+        "Item",
+        "Library",
+        "LibraryProgramUnit",
+        "LOV",
+        "LOVColumnMap",
+        "Menu",
+        "MenuItem",
+        "Module",
+        "ObjectLibrary",
+        "ObjectLibraryTab",
+        "ObjectChild",
+        "ObjectGroup",
+        "Point",
+        "ProgramUnit",
+        "PropertyClass",
+        "RadioButton",
+        "RecordGroup",
+        "RecordGroupColspec",
+        "Relation",
+        "Report",
+        "TabPage",
+        "Trigger",
+        "VisualAttribute",
+        "VisualState",
+        "Window",
+    ),
+    "misc": (
+        "add_properties",
+        "index_object_classes",
+        "registered_objects",
+    ),
+    "object_collection": ("ObjectCollection",),
+    "fake_api": ("FakeAPI",),
+    "instrumentation": ("stats", "reset_stats", "enable_stats", "disable_stats"),
+    "tracing": (
+        "ReplayAPI",
+        "read_trace",
+        "replay",
+        "start_trace",
+        "stop_trace",
+        "trace",
+    ),
+    "property_types": ("Properties",),
+    "constants": (
+        "Justification",
+        "DefaultAlertButton",
+        "AlertStyle",
+        "Bevel",
+        "CaseRestriction",
+        "CheckBoxMappingofOtherValues",
+        "CanvasType",
+        "ColumnDataType",
+        "CommandType",
+        "ImageFormat",
+        "ImageDepth",
+        "CoordinateSystem",
+        "CursorMode",
+        "DeleteRecordBehavior",
+        "InitialKeyboardState",
+        "Direction",
+        "ExecutionHierarchy",
+        "FontStyle",
+        "FontWeight",
+        "FontSpacing",
+        "ParameterDataType",
+        "ExecutionMode",
+        "ItemType",
+        "DataType",
+        "KeyMode",
+        "PLSQLLibrarySource",
+        "LockingMode",
+        "ListType",
+        "ListStyle",
+        "MagicItem",
+        "MenuItemType",
+        "CompressionQuality",
+        "MouseNavigationLimit",
+        "NavigationStyle",
+        "DisplayQuality",
+        "ReadingOrder",
+        "RealUnit",
+        "RecordGroupType",
+        "RecordOrientation",
+        "ScrollBarOrientation",
+        "SizingStyle",
+        "TriggerStyle",
+        "PromptFontStyle",
+        "CalculationMode",
+        "PromptFontWeight",
+        "PromptFontSpacing",
+        "PromptDisplayStyle",
+        "ValidationUnit",
+        "WindowStyle",
+        "WrapStyle",
+        "GraphicsType",
+        "ArrowStyle",
+        "PromptReadingOrder",
+        "PromptJustification",
+        "PromptAttachmentEdge",
+        "PromptAlignment",
+        "FrameTitleReadingOrder",
+        "FrameTitleAlignment",
+        "LayoutStyle",
+        "FrameAlignment",
+        "SingleObjectAlignment",
+        "StartPromptAlignment",
+        "TopPromptAlignment",
+        "UpdateLayout",
+        "DashStyle",
+        "CapStyle",
+        "JoinStyle",
+        "LineSpacing",
+        "HorizontalOrigin",
+        "VerticalOrigin",
+        "HorizontalJustification",
+        "VerticalJustification",
+        "SummaryFunction",
+        "ArgumentMode",
+        "CommunicationMode",
+        "ColumnType",
+        "ArgumentType",
+        "QueryDataSourceType",
+        "DMLDataTargetType",
+        "TabAttachmentEdge",
+        "VisualAttributeType",
+        "FrameTitleFontStyle",
+        "FrameTitleFontWeight",
+        "FrameTitleFontSpacing",
+        "CornerStyle",
+        "InteractionMode",
+        "IsolationMode",
+        "ReportDestinationType",
+        "KeyboardState",
+        "ScrollBarAlignment",
+        "ProgramUnitType",
+        "RuntimeCompatibilityMode",
+        "GraphicFontWeight",
+        "GraphicFontSpacing",
+        "RelationType",
+        "DataLengthSemantics",
+        "EventType",
+        "Scope",
+        "ViewMode",
+    ),
+}
+lazy_modules = {
+    name: module for module, names in lazy_imports.items() for name in names
+}
+
+__all__ = [
+    "context",
+    "property_type",
+    "property_constant_number",
+    "object_number",
+    "property_numbers",
+    "FormsException",
+    "DLLNotFoundError",
+    "TraceError",
+    "initialize_context",
+    *lazy_modules,
+]
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module = lazy_modules[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *lazy_modules})
 
 
 __version__ = "0.5.2"
 
 
-def initialize_context(version: str = "12c", encoding: str = "utf-8") -> None:
-    context.init(version=version, encoding=encoding)
+def initialize_context(
+    version: str = "12c",
+    encoding: str = "utf-8",
+    confirm_properties: bool = False,
+    dll_path: Optional[str] = None,
+    api: Optional["CallbackAPI"] = None,
+) -> None:
+    from .forms_api import api_metadata
+    from .forms_objects import Module
+    from .generic_object import load_property_support
+    from .misc import add_properties, index_object_classes, registered_objects
 
-    api_objects = read_api_objects(version=version)
+    context.init(version=version, encoding=encoding, dll_path=dll_path, api=api)
+
+    metadata = api_metadata(version=version)
+    property_numbers.update(metadata.property_numbers)
+    if not confirm_properties:
+        # otherwise has_property asks the API, once per object type and property
+        load_property_support(metadata.supported_properties)
 
     for forms_object in registered_objects.values():
         # todo: i could just add static ones for all objects
         #  and still have this code run adding missing values
         #  or by removing ones not present in the version
         if forms_object != Module:
-            add_properties(forms_object, api_objects)
+            add_properties(forms_object, metadata.object_numbers)
+
+    index_object_classes()
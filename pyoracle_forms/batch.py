@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import SpawnContext, SpawnProcess
+from time import perf_counter
+from traceback import format_exc, format_exception_only
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from . import initialize_context
+from .forms_objects import Module
+from .cache import ResultCache
+from .journal import Journal
+from .misc import resident_memory
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .fake_api import CallbackAPI
+
+# runs a function over many modules on all cores, as the context is one per
+# process, each worker process initializes its own once and loads one module
+# after the other into it:
+#     for result in batch.map(rename_triggers, paths, save=True):
+#         ...
+# the memory the API holds on to only grows, so workers can be replaced after
+# a number of modules, or once they use too much, and a worker stuck on a
+# module longer than the timeout is killed and replaced.
+
+
+class FileResult(NamedTuple):
+    path: str
+    # what func returned, None if it raised
+    result: object
+    # the exception and its traceback, if func, loading or saving raised
+    error: Optional[str]
+    traceback: Optional[str]
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class Settings(NamedTuple):
+    func: Callable[[Module], object]
+    save: bool
+    version: str
+    encoding: str
+    dll_path: Optional[str]
+    api_factory: Optional[Callable[[], CallbackAPI]]
+    # replace the worker after this many modules, or bytes of resident memory
+    max_modules: Optional[int]
+    max_memory: Optional[int]
+    cache: Optional[ResultCache]
+
+
+def process(settings: Settings, path: str) -> FileResult:
+    start = perf_counter()
+    try:
+        if settings.cache is not None:
+            result = settings.cache.apply(settings.func, path)
+        else:
+            with Module.load(path) as module:
+                result = settings.func(module)
+                if settings.save:
+                    module.save()
+    except Exception as error:
+        return failed(path, format_exc(), start, error)
+    return FileResult(path, result, None, None, perf_counter() - start)
+
+
+def failed(
+    path: str,
+    traceback: Optional[str],
+    start: float,
+    error: Optional[BaseException] = None,
+    message: str = "",
+) -> FileResult:
+    if error is not None:
+        message = "".join(format_exception_only(type(error), error)).strip()
+    return FileResult(path, None, message, traceback, perf_counter() - start)
+
+
+def work(connection: Connection[object, Optional[str]], settings: Settings) -> None:
+    # runs in the worker process, sends ("ready", None) once the context is
+    # initialized, then ("done", (result, retiring)) for each path received,
+    # until it gets None or retires
+    try:
+        api = settings.api_factory() if settings.api_factory is not None else None
+        initialize_context(
+            version=settings.version,
+            encoding=settings.encoding,
+            dll_path=settings.dll_path,
+            api=api,
+        )
+    except Exception:
+        connection.send(("failed", format_exc()))
+        return
+    connection.send(("ready", None))
+
+    done = 0
+    while True:
+        path = connection.recv()
+        if path is None:
+            return
+        result = process(settings, path)
+        done += 1
+        retiring = bool(
+            (settings.max_modules and done >= settings.max_modules)
+            or (settings.max_memory and resident_memory() >= settings.max_memory)
+        )
+        connection.send(("done", (result, retiring)))
+        if retiring:
+            return
+
+
+class Worker:
+    def __init__(self, context: SpawnContext, settings: Settings) -> None:
+        self.connection, child = context.Pipe()
+        self.process: SpawnProcess = context.Process(
+            target=work, args=(child, settings), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.ready = False
+        self.path: Optional[str] = None
+        self.started = 0.0
+
+    def assign(self, path: str) -> None:
+        self.connection.send(path)
+        self.path, self.started = path, perf_counter()
+
+    def receive(self) -> Optional[Tuple[str, object]]:
+        # None once the process is gone
+        try:
+            if self.connection.poll():
+                return self.connection.recv()
+        except (EOFError, OSError):
+            pass
+        return None if not self.process.is_alive() else ("waiting", None)
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def map(
+    func: Callable[[Module], object],
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    save: bool = False,
+    version: str = "12c",
+    encoding: str = "utf-8",
+    dll_path: Optional[str] = None,
+    api_factory: Optional[Callable[[], CallbackAPI]] = None,
+    max_modules: Optional[int] = None,
+    max_memory: Optional[int] = None,
+    timeout: Optional[float] = None,
+    journal: Optional[str] = None,
+    cache: Optional[ResultCache] = None,
+) -> Iterator[FileResult]:
+    # results come back as the modules are done, not in the order of paths.
+    # func, api_factory and what func returns have to be picklable, so func
+    # has to be defined at the top level of a module. with a journal, files
+    # done in an earlier run are skipped, see journal.py, with a cache, the
+    # results of func are kept for modules that don't change, see cache.py
+    if cache is not None and save:
+        raise ValueError("Results of functions saving the modules can't be cached")
+    context = multiprocessing.get_context("spawn")
+    settings = Settings(
+        func,
+        save,
+        version,
+        encoding,
+        dll_path,
+        api_factory,
+        max_modules,
+        max_memory,
+        cache,
+    )
+    journaled = Journal(journal) if journal is not None else None
+    pending = iter(journaled.schedule(paths) if journaled is not None else paths)
+    pool = [Worker(context, settings) for _ in range(workers or os.cpu_count() or 1)]
+    try:
+        while pool:
+            waited_on: List[object] = [worker.connection for worker in pool]
+            waited_on.extend(worker.process.sentinel for worker in pool)
+            wait(waited_on, timeout=deadline(pool, timeout))  # type: ignore
+
+            for worker in list(pool):
+                message = worker.receive()
+                result: Optional[FileResult] = None
+                replace = False
+                if message is None:
+                    # died, on its own or in the native code
+                    if worker.path is None and not worker.ready:
+                        raise RuntimeError("batch worker exited while starting")
+                    if worker.path is not None:
+                        result = failed(
+                            worker.path,
+                            None,
+                            worker.started,
+                            message=f"worker exited with code "
+                            f"{worker.process.exitcode}",
+                        )
+                    replace = True
+                elif message[0] == "failed":
+                    raise RuntimeError(
+                        f"batch worker could not initialize the context:\n"
+                        f"{message[1]}"
+                    )
+                elif message[0] == "ready":
+                    worker.ready = True
+                elif message[0] == "done":
+                    result, replace = message[1]  # type: ignore
+                    worker.path = None
+                elif (
+                    timeout is not None
+                    and worker.path is not None
+                    and perf_counter() - worker.started > timeout
+                ):
+                    result = failed(
+                        worker.path,
+                        None,
+                        worker.started,
+                        message=f"timed out after {timeout} seconds",
+                    )
+                    replace = True
+
+                if result is not None:
+                    if journaled is not None:
+                        journaled.record(result)
+                    yield result
+                if replace:
+                    worker.kill()
+                    pool.remove(worker)
+                    pool.append(Worker(context, settings))
+                elif worker.ready and worker.path is None:
+                    path = next(pending, None)
+                    if path is None:
+                        worker.stop()
+                        pool.remove(worker)
+                    else:
+                        worker.assign(path)
+    finally:
+        for worker in pool:
+            worker.kill()
+        if journaled is not None:
+            journaled.close()
+
+
+def deadline(pool: List[Worker], timeout: Optional[float]) -> Optional[float]:
+    # seconds until the earliest module being worked on times out
+    if timeout is None:
+        return None
+    started = [worker.started for worker in pool if worker.path is not None]
+    if not started:
+        return None
+    return max(0.0, min(started) + timeout - perf_counter())
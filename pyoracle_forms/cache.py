@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import pickle
+from functools import partial
+from typing import Callable, List, Optional, Tuple
+
+from .context import context
+from .journal import content_hash
+from .misc import load_file
+
+# results of read-only analyses, kept on disk by the content of the module,
+# the API version and the function, so unchanged modules are not even loaded:
+#     cache = ResultCache("~/.cache/trigger_inventory")
+#     triggers = cache.apply(trigger_inventory, "module.fmb")
+# the least recently used results are removed once there are more than
+# max_size bytes of them. can be passed to batch.map too. the function is told
+# apart by its code, defaults and closure, not by the helpers it calls, so
+# changing those needs a new version:
+#     cache = ResultCache("~/.cache/trigger_inventory", version="2")
+
+suffix = ".pickle"
+
+
+def function_identity(func: Callable[..., object], seen: Tuple[int, ...] = ()) -> str:  # type: ignore
+    # changes with the code of the function and with the values it was given,
+    # its defaults, closure or the arguments of a partial, not only its name
+    if isinstance(func, partial):
+        arguments = [value_identity(value, seen) for value in func.args]
+        arguments.extend(
+            f"{name}={value_identity(value, seen)}"
+            for name, value in sorted(func.keywords.items())
+        )
+        return f"{function_identity(func.func, seen)}({','.join(arguments)})"
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', func)}"
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return name
+    seen += (id(func),)
+    digest = hashlib.sha256(marshal.dumps(code))
+    cells = []
+    for cell in getattr(func, "__closure__", None) or ():
+        try:
+            cells.append(cell.cell_contents)
+        except ValueError:
+            # not assigned yet
+            cells.append(None)
+    defaults = getattr(func, "__defaults__", None)
+    kwdefaults = getattr(func, "__kwdefaults__", None)
+    for value in (defaults, kwdefaults, tuple(cells)):
+        digest.update(value_identity(value, seen).encode())
+    return f"{name}:{digest.hexdigest()}"
+
+
+def value_identity(value: object, seen: Tuple[int, ...]) -> str:
+    if isinstance(value, partial) or hasattr(value, "__code__"):
+        # a function calling itself from its closure
+        if id(value) in seen:
+            return "recursive"
+        return function_identity(value, seen)  # type: ignore
+    if isinstance(value, (tuple, list)):
+        return f"({','.join(value_identity(item, seen) for item in value)})"
+    if isinstance(value, dict):
+        items = sorted(
+            (repr(key), value_identity(item, seen)) for key, item in value.items()
+        )
+        return f"{{{','.join(f'{key}:{item}' for key, item in items)}}}"
+    try:
+        return hashlib.sha256(pickle.dumps(value, protocol=4)).hexdigest()
+    except Exception:
+        return repr(value)
+
+
+class ResultCache:
+    def __init__(
+        self, directory: str, max_size: int = 2**30, version: str = ""
+    ) -> None:
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        # part of every key, changed to drop what was kept before
+        self.version = version
+        # bytes of results in the directory, counted once needed
+        self.size: Optional[int] = None
+        self.hits = self.misses = 0
+
+    def key(  # type: ignore
+        self, path: str, func: Callable[..., object], version: Optional[str] = None
+    ) -> Optional[str]:
+        # None if the file can't be read, so there is nothing to key on
+        content = content_hash(path)
+        if content is None:
+            return None
+        if version is None:
+            version = self.version
+        identity = "\0".join(
+            (content, context.version, function_identity(func), version)
+        )
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def get(self, key: str) -> Tuple[bool, object]:
+        entry_path = self.entry_path(key)
+        try:
+            with open(entry_path, mode="rb") as file:
+                value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, ImportError, AttributeError):
+            # missing, cut short, or of classes that were moved or removed since
+            self.misses += 1
+            return False, None
+        # the modification time orders the results by when they were last used
+        os.utime(entry_path)
+        self.hits += 1
+        return True, value
+
+    def put(self, key: str, value: object) -> None:
+        entry_path = self.entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # written aside first, so other processes never read half a result
+        partial = f"{entry_path}.{os.getpid()}"
+        try:
+            with open(partial, mode="wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # results that can't be pickled are not kept
+            os.remove(partial)
+            return
+        os.replace(partial, entry_path)
+
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self.entries())
+        else:
+            self.size += os.path.getsize(entry_path)
+        if self.size > self.max_size:
+            self.evict()
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        # last use, size and path of every result
+        found = []
+        for directory, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(suffix):
+                    entry_path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(entry_path)
+                    except OSError:
+                        continue
+                    found.append((stat.st_mtime, stat.st_size, entry_path))
+        return found
+
+    def evict(self) -> None:
+        # other processes could have added results too, so the directory is
+        # counted again
+        entries = sorted(self.entries())
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in entries:
+            if self.size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            self.size -= size
+
+    def apply(  # type: ignore
+        self, func: Callable[..., object], path: str, version: Optional[str] = None
+    ) -> object:
+        # func of the module at path, loaded only if the result is not kept
+        key = self.key(path, func, version)
+        if key is not None:
+            found, value = self.get(key)
+            if found:
+                return value
+        with load_file(path) as module:
+            value = func(module)
+        if key is not None:
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        for _, _, entry_path in self.entries():
+            os.remove(entry_path)
+        self.size = 0
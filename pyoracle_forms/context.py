@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import atexit
-from ctypes import pointer, c_int, c_void_p, c_char_p, c_bool, c_uint, CDLL
-from functools import partial
+from ctypes import pointer, byref, c_int, c_void_p, c_char_p, c_bool, c_uint, CDLL
+from ctypes import string_at
 from typing import (
     Callable,
     Any,
+    Dict,
     Optional,
     Tuple,
     TYPE_CHECKING,
@@ -13,13 +14,17 @@ from typing import (
     Union,
     Type,
     TypeVar,
+    List,
+    Sequence,
 )
+from weakref import WeakValueDictionary
 
 from .error_handling import raise_for_code
 from .forms_api import dlls
 
 if TYPE_CHECKING:  # pragma: no cover
     from ctypes import _FuncPointer
+    from .fake_api import CallbackAPI
     from .generic_object import BaseObject
     from .forms_objects import Module, ObjectLibrary, ObjectLibraryTab
 
@@ -27,31 +32,86 @@ T = TypeVar("T")
 
 Setter = Callable[["BaseObject", int, T], None]
 Getter = Callable[["BaseObject", int], T]
-CTypes = Union[Type[c_void_p], Type[c_bool], Type[c_int], Type["String"]]
+BulkGetter = Callable[["BaseObject", Sequence[int]], List[T]]
+CTypes = Union[Type[c_void_p], Type[c_bool], Type[c_int]]
+ApiFunction = Callable[..., int]  # type: ignore
+Instrument = Callable[[str, ApiFunction], ApiFunction]
+
+# argument types (without the leading context pointer) of every d2f entry point
+# used by the package, filled in by api_function as the module gets imported
+api_signatures: Dict[str, Tuple[Any, ...]] = {}  # type: ignore
 
 
 class Context:
     version: str
     encoding: str
-    api: Optional[CDLL]
+    api: Union[CDLL, CallbackAPI, None]
     free: Optional[_FuncPointer]
+    functions: Dict[str, ApiFunction]
+    # wrap every entry point as it gets bound, see instrumentation.py
+    instruments: List[Instrument]
+    objects: WeakValueDictionary[int, BaseObject]
+    # called once the context is destroyed, to forget what was kept for it
+    destroy_hooks: List[Callable[[], None]]
 
     def __init__(self) -> None:
         self.version, self.encoding = "12c", "utf-8"
         self.api, self.free = None, None
+        self.functions, self.instruments = {}, []
+        # wrappers in use, by the value of their handle
+        self.objects = WeakValueDictionary()
+        self.destroy_hooks = []
         self._as_parameter_ = c_void_p(0)
 
     def __bool__(self) -> bool:
         return bool(self._as_parameter_)
 
-    def init(self, version: str, encoding: str) -> None:
+    def init(
+        self,
+        version: str,
+        encoding: str,
+        dll_path: Optional[str] = None,
+        api: Optional[CallbackAPI] = None,
+    ) -> None:
         if not self:
             self.version, self.encoding = version, encoding
-            self.api, msvcrt = dlls(self.version)
-            self.free = msvcrt.free
+            if api is not None:
+                self.api, self.free = api, api.free
+            else:
+                self.api, msvcrt = dlls(self.version, dll_path)
+                self.free = msvcrt.free
+            self.free.argtypes, self.free.restype = (c_void_p,), None
+            self.bind_functions()
             self.create_context()
             atexit.register(self.destroy_context)
 
+    def bind_function(
+        self, api_function_name: str, arguments: Tuple[CTypes, ...]
+    ) -> None:
+        func = getattr(self.api, api_function_name)
+        func.argtypes = (c_void_p,) + arguments
+        func.restype = c_int
+        for instrument in self.instruments:
+            func = instrument(api_function_name, func)
+        self.functions[api_function_name] = func
+
+    def bind_functions(self) -> None:
+        # resolve every entry point once, so calls don't pay for getattr and argtypes
+        for api_function_name, arguments in api_signatures.items():
+            self.bind_function(api_function_name, arguments)
+
+    def add_instrument(self, instrument: Instrument) -> None:
+        if instrument not in self.instruments:
+            self.instruments.append(instrument)
+            if self.api is not None:
+                self.bind_functions()
+
+    def remove_instrument(self, instrument: Instrument) -> None:
+        if instrument in self.instruments:
+            self.instruments.remove(instrument)
+            if self.api is not None:
+                self.bind_functions()
+
     def create_context(self) -> None:
         # todo: maybe better way than just an assert?
         assert self.api is not None
@@ -68,30 +128,29 @@ class Context:
 
     def destroy_context(self) -> None:
         if self._as_parameter_:
-            handled_api_function("d2fctxde_Destroy", tuple())(self)
+            destroy_api_context()
             self._as_parameter_ = c_void_p(0)
+            self.objects.clear()
+            for hook in self.destroy_hooks:
+                hook()
 
 
 context: Context = Context()
 
 
-class String(c_char_p):
-    def __init__(self) -> None:
-        # todo: maybe better way than just an assert?
-        assert context.free is not None
-        super().__init__()
-        self.free = context.free
-
-    def __del__(self) -> None:
-        self.free(self)
-
-
 def api_function(  # type: ignore
     api_function_name: str, arguments: Tuple[Any, ...]
 ) -> Callable[..., int]:
-    api_func = getattr(context.api, api_function_name)
-    api_func.argtypes = (c_void_p,) + arguments
-    return partial(api_func, context)
+    api_signatures[api_function_name] = arguments
+    if context.api is not None:
+        context.bind_function(api_function_name, arguments)
+
+    functions = context.functions
+
+    def _api_function(*args: Any) -> int:  # type: ignore
+        return functions[api_function_name](context._as_parameter_, *args)
+
+    return _api_function
 
 
 def inject_return_value(  # type: ignore
@@ -100,7 +159,7 @@ def inject_return_value(  # type: ignore
     if return_value_index is not None:
         func_args = list(args)
         return_value = func_args[return_value_index]
-        func_args[return_value_index] = pointer(return_value)
+        func_args[return_value_index] = byref(return_value)
         injected_args = tuple(func_args)
     else:
         injected_args, return_value = args, None
@@ -112,10 +171,12 @@ def handled_api_function(  # type: ignore
     arguments: Tuple[Any, ...],
     return_value_index: Optional[int] = None,
 ) -> Callable[..., Any]:
+    func = api_function(api_function_name, arguments)
+
     def _handled_api_function(*args: Any) -> Any:  # type: ignore
         injected_args, return_value = inject_return_value(args, return_value_index)
 
-        error_code = api_function(api_function_name, arguments)(*injected_args)
+        error_code = func(*injected_args)
 
         if error_code:
             raise_for_code(error_code)
@@ -124,21 +185,28 @@ def handled_api_function(  # type: ignore
     return _handled_api_function
 
 
+destroy_api_context = handled_api_function("d2fctxde_Destroy", tuple())
+
+
 def handle_return_value(result: int) -> bool:
     if result in (2, 3):  # YES, NO
         return bool(result == 2)
     raise_for_code(result)
 
 
+_is_subclassed = api_function("d2fobis_IsSubclassed", (c_void_p,))
+
+
 def is_subclassed(generic_object: BaseObject) -> bool:
-    func = api_function("d2fobis_IsSubclassed", (c_void_p,))
-    result = func(generic_object)
+    result = _is_subclassed(generic_object)
     return handle_return_value(result)
 
 
+_has_property = api_function("d2fobhp_HasProp", (c_void_p, c_int))
+
+
 def has_property(generic_object: BaseObject, property_number: int) -> bool:
-    func = api_function("d2fobhp_HasProp", (c_void_p, c_int))
-    result = func(generic_object, property_number)
+    result = _has_property(generic_object, property_number)
     return handle_return_value(result)
 
 
@@ -153,10 +221,14 @@ set_object: Setter[BaseObject] = setter("d2fobso_SetObjProp", c_void_p)
 
 
 def getter(function_name: str, return_type: CTypes) -> Getter[T]:
-    func = handled_api_function(function_name, (c_void_p, c_int, c_void_p), 2)
+    func = api_function(function_name, (c_void_p, c_int, c_void_p))
 
     def _getter(generic_object: BaseObject, property_number: int) -> Getter[T]:
-        return func(generic_object, property_number, return_type()).value
+        return_value = return_type()
+        error_code = func(generic_object, property_number, byref(return_value))
+        if error_code:
+            raise_for_code(error_code)
+        return return_value.value  # type: ignore
 
     return cast(Getter[T], _getter)
 
@@ -164,71 +236,144 @@ def getter(function_name: str, return_type: CTypes) -> Getter[T]:
 get_boolean: Getter[bool] = getter("d2fobgb_GetBoolProp", c_bool)
 get_number: Getter[int] = getter("d2fobgn_GetNumProp", c_int)
 get_object: Getter[BaseObject] = getter("d2fobgo_GetObjProp", c_void_p)
-get_text: Getter[bytes] = getter("d2fobgt_GetTextProp", String)
+
+
+def text_getter(function_name: str) -> Getter[Optional[bytes]]:
+    func = api_function(function_name, (c_void_p, c_int, c_void_p))
+    # texts are allocated by the API, one out-parameter serves every read, as
+    # the text gets copied and freed right after
+    return_value = c_void_p()
+    reference = byref(return_value)
+
+    def _text_getter(
+        generic_object: BaseObject, property_number: int
+    ) -> Optional[bytes]:
+        error_code = func(generic_object, property_number, reference)
+        if error_code:
+            raise_for_code(error_code)
+        address, return_value.value = return_value.value, None
+        if address is None:
+            return None
+        try:
+            return string_at(address)
+        finally:
+            context.free(address)  # type: ignore
+
+    return _text_getter
+
+
+get_text: Getter[Optional[bytes]] = text_getter("d2fobgt_GetTextProp")
+
+
+def bulk_getter(function_name: str, return_type: CTypes) -> BulkGetter[T]:
+    func = api_function(function_name, (c_void_p, c_int, c_void_p))
+
+    def _bulk_getter(
+        generic_object: BaseObject, property_numbers: Sequence[int]
+    ) -> List[T]:
+        # one buffer for all the values, read back right after each call
+        return_value = return_type()
+        reference = byref(return_value)
+        values: List[T] = []
+        for property_number in property_numbers:
+            error_code = func(generic_object, property_number, reference)
+            if error_code:
+                raise_for_code(error_code)
+            values.append(return_value.value)  # type: ignore
+        return values
+
+    return cast(BulkGetter[T], _bulk_getter)
+
+
+def get_texts(
+    generic_object: BaseObject, property_numbers: Sequence[int]
+) -> List[Optional[bytes]]:
+    return [get_text(generic_object, number) for number in property_numbers]
+
+
+get_booleans: BulkGetter[bool] = bulk_getter("d2fobgb_GetBoolProp", c_bool)
+get_numbers: BulkGetter[int] = bulk_getter("d2fobgn_GetNumProp", c_int)
+get_objects: BulkGetter[BaseObject] = bulk_getter("d2fobgo_GetObjProp", c_void_p)
+
+
+_load_library = handled_api_function(
+    "d2flibld_Load", (c_void_p, c_char_p), return_value_index=0
+)
 
 
 def load_library(library_path: str) -> c_void_p:
-    return handled_api_function(
-        "d2flibld_Load", (c_void_p, c_char_p), return_value_index=0
-    )(c_void_p(), library_path.encode(context.encoding))
+    return _load_library(c_void_p(), library_path.encode(context.encoding))
+
+
+_load_module = handled_api_function(
+    "d2ffmdld_Load", (c_void_p, c_char_p, c_bool), return_value_index=0
+)
 
 
 def load_module(form_path: str) -> c_void_p:
-    return handled_api_function(
-        "d2ffmdld_Load", (c_void_p, c_char_p, c_bool), return_value_index=0
-    )(c_void_p(), form_path.encode(context.encoding), False)
+    return _load_module(c_void_p(), form_path.encode(context.encoding), False)
+
+
+_load_object_library = handled_api_function(
+    "d2folbld_Load", (c_void_p, c_char_p, c_bool), return_value_index=0
+)
 
 
 def load_object_library(object_library_path: str) -> c_void_p:
-    return handled_api_function(
-        "d2folbld_Load", (c_void_p, c_char_p, c_bool), return_value_index=0
-    )(c_void_p(), object_library_path.encode(context.encoding), False)
+    return _load_object_library(
+        c_void_p(), object_library_path.encode(context.encoding), False
+    )
+
+
+_create_module = handled_api_function(
+    "d2ffmdcr_Create", (c_void_p, c_char_p), return_value_index=0
+)
 
 
 def create_module(name: str) -> c_void_p:
-    return handled_api_function(
-        "d2ffmdcr_Create", (c_void_p, c_char_p), return_value_index=0
-    )(c_void_p(), name.encode(context.encoding))
+    return _create_module(c_void_p(), name.encode(context.encoding))
+
+
+_save_module = handled_api_function("d2ffmdsv_Save", (c_void_p, c_char_p, c_bool))
 
 
 def save_module(module: Module, path: str) -> None:
-    handled_api_function("d2ffmdsv_Save", (c_void_p, c_char_p, c_bool))(
-        module, path.encode(context.encoding), False
-    )
+    _save_module(module, path.encode(context.encoding), False)
 
 
-def create(owner: BaseObject, name: str, obj_number: int) -> c_void_p:
-    return handled_api_function(
-        "d2fobcr_Create", (c_void_p, c_void_p, c_char_p, c_int), return_value_index=1
-    )(owner, c_void_p(), name.encode(context.encoding), obj_number)
+_create = handled_api_function(
+    "d2fobcr_Create", (c_void_p, c_void_p, c_char_p, c_int), return_value_index=1
+)
 
 
-def destroy(generic_object: BaseObject) -> None:
-    handled_api_function("d2fobde_Destroy", (c_void_p,))(generic_object)
+def create(owner: BaseObject, name: str, obj_number: int) -> c_void_p:
+    return _create(owner, c_void_p(), name.encode(context.encoding), obj_number)
 
 
-def move(generic_object: BaseObject, next_object: Optional[BaseObject]) -> None:
-    handled_api_function("d2fobmv_Move", (c_void_p, c_void_p))(
-        generic_object, next_object
-    )
+destroy: Callable[[BaseObject], None] = handled_api_function(
+    "d2fobde_Destroy", (c_void_p,)
+)
+move: Callable[[BaseObject, Optional[BaseObject]], None] = handled_api_function(
+    "d2fobmv_Move", (c_void_p, c_void_p)
+)
+
+_query_type = handled_api_function(
+    "d2fobqt_QueryType", (c_void_p, c_void_p), return_value_index=1
+)
 
 
 def query_type(generic_object: Union[BaseObject, c_void_p]) -> int:
-    return int(
-        handled_api_function("d2fobqt_QueryType", (c_void_p,), return_value_index=1)(
-            generic_object, c_int()
-        ).value
-    )
+    return int(_query_type(generic_object, c_int()).value)
 
 
 GetConstant = Callable[[int], str]
 
 
 def get_constant(function_name: str) -> GetConstant:
+    func = handled_api_function(function_name, (c_int, c_void_p), return_value_index=1)
+
     def _get_constant(constant_property: int) -> str:
-        constant_value = handled_api_function(
-            function_name, (c_int, c_void_p), return_value_index=1
-        )(constant_property, c_char_p())
+        constant_value = func(constant_property, c_char_p())
         return (constant_value.value or b"").decode(context.encoding)
 
     return _get_constant
@@ -239,58 +384,105 @@ property_constant_name: GetConstant = get_constant("d2fprgcn_GetConstName")
 property_name: GetConstant = get_constant("d2fprgn_GetName")
 
 
+_property_type = api_function("d2fprgt_GetType", (c_uint,))
+
+
 def property_type(property_number: int) -> int:
-    return int(api_function("d2fprgt_GetType", (c_uint,))(property_number))
+    return int(_property_type(property_number))
+
+
+_property_constant_number = handled_api_function(
+    "d2fprgcv_GetConstValue", (c_char_p, c_void_p), return_value_index=1
+)
 
 
 def property_constant_number(property_const_name: str) -> int:
-    return handled_api_function(
-        "d2fprgcv_GetConstValue", (c_char_p, c_void_p), return_value_index=1
-    )(property_const_name.encode(context.encoding), c_int()).value
+    return _property_constant_number(
+        property_const_name.encode(context.encoding), c_int()
+    ).value
+
+
+# property constant names (without the D2FP_ prefix) mapped to their numbers,
+# filled from the parsed API of the initialized version
+property_numbers: Dict[str, int] = {}
+
+
+def property_number(property_const_name: str) -> int:
+    try:
+        return property_numbers[property_const_name]
+    except KeyError:
+        # not documented for this version, so ask the API itself
+        number = property_constant_number(property_const_name)
+        property_numbers[property_const_name] = number
+        return number
+
+
+# the numbers differ between versions, so they are filled again for the next one
+context.destroy_hooks.append(property_numbers.clear)
+
+
+_object_number = handled_api_function(
+    "d2fobgcv_GetConstValue", (c_char_p, c_void_p), return_value_index=1
+)
 
 
 def object_number(obj_name: str) -> int:
-    return int(
-        handled_api_function(
-            "d2fobgcv_GetConstValue", (c_char_p, c_void_p), return_value_index=1
-        )(obj_name.encode(context.encoding), c_int()).value
-    )
+    return int(_object_number(obj_name.encode(context.encoding), c_int()).value)
+
+
+_find_object = handled_api_function(
+    "d2fobfo_FindObj", (c_void_p, c_char_p, c_int, c_void_p), return_value_index=3
+)
+
+
+def find_object(owner: BaseObject, name: str, obj_number: int) -> c_void_p:
+    return _find_object(owner, name.encode(context.encoding), obj_number, c_void_p())
+
+
+_set_subclass = handled_api_function("d2fobsc_SubClass", (c_void_p, c_void_p, c_bool))
 
 
 def set_subclass(
     to_subclass: BaseObject, parent: BaseObject, keep_path: bool = False
 ) -> None:
-    handled_api_function("d2fobsc_SubClass", (c_void_p, c_void_p, c_bool))(
-        to_subclass, parent, keep_path
-    )
+    _set_subclass(to_subclass, parent, keep_path)
+
 
+remove_subclass: Callable[[BaseObject], None] = handled_api_function(
+    "d2fobus_UnSubClass", (c_void_p,)
+)
 
-def remove_subclass(to_un_subclass: BaseObject) -> None:
-    handled_api_function("d2fobus_UnSubClass", (c_void_p,))(to_un_subclass)
+_find_library_object_by_position = handled_api_function(
+    "d2folbf2_Findobjbypos", (c_void_p, c_int, c_void_p), return_value_index=2
+)
 
 
 def find_library_object_by_position(
     object_library: ObjectLibrary, position: int
 ) -> c_void_p:
-    return handled_api_function(
-        "d2folbf2_Findobjbypos", (c_void_p, c_int, c_void_p), return_value_index=2
-    )(
+    return _find_library_object_by_position(
         object_library, position, c_void_p()
     )  # pragma: nocover
 
 
+_find_library_tab_object_by_position = handled_api_function(
+    "d2foltf2_Findobjbypos", (c_void_p, c_int, c_void_p), return_value_index=2
+)
+
+
 def find_library_tab_object_by_position(
     object_library: ObjectLibraryTab, position: int
 ) -> c_void_p:
-    return handled_api_function(
-        "d2foltf2_Findobjbypos", (c_void_p, c_int, c_void_p), return_value_index=2
-    )(object_library, position, c_void_p())
+    return _find_library_tab_object_by_position(object_library, position, c_void_p())
+
+
+_duplicate = handled_api_function(
+    "d2fobdu_Duplicate",
+    (c_void_p, c_void_p, c_void_p, c_char_p),
+    return_value_index=2,
+)
 
 
 def duplicate(new_owner: BaseObject, source: BaseObject, new_name: str) -> c_void_p:
     # d2fobdu_Duplicate(ctx, new_owner, pd2fob_src, & pd2fob_dst, new_name)
-    return handled_api_function(
-        "d2fobdu_Duplicate",
-        (c_void_p, c_void_p, c_void_p, c_char_p),
-        return_value_index=2,
-    )(new_owner, source, c_void_p(), new_name.encode(context.encoding))
+    return _duplicate(new_owner, source, c_void_p(), new_name.encode(context.encoding))
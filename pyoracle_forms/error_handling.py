@@ -1,4 +1,4 @@
-from typing import NoReturn
+from typing import List, NoReturn
 
 error_mapping = {
     0: "Operation Succeeded",
@@ -43,5 +43,18 @@ class FormsException(Exception):
     pass
 
 
+class DLLNotFoundError(ImportError):
+    def __init__(self, dll_name: str, searched: List[str]) -> None:
+        self.dll_name, self.searched = dll_name, searched
+        directories = "".join(f"\n  {directory}" for directory in searched)
+        super().__init__(
+            f"No Oracle Forms API found, {dll_name} is not in any of:{directories}"
+        )
+
+
+class TraceError(Exception):
+    pass
+
+
 def raise_for_code(error_code: int) -> NoReturn:
     raise FormsException(error_code, f"{error_mapping[error_code]}")
@@ -0,0 +1,564 @@
+from __future__ import annotations
+
+import json
+from ctypes import (
+    CFUNCTYPE,
+    Array,
+    addressof,
+    c_bool,
+    c_char,
+    c_int,
+    c_void_p,
+    create_string_buffer,
+    string_at,
+)
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from .context import api_signatures
+from .forms_api import api_metadata
+from .generic_object import ValueTypes
+
+# a stand-in for the d2f library, keeping the objects in memory, so the package
+# can run where Oracle Forms is not installed:
+#     initialize_context(api=FakeAPI())
+# every entry point is a ctypes callback with the signature the package binds,
+# so calls go through the same argument conversion as with the dll itself.
+# modules are saved as json instead of the .fmb format.
+
+Value = Union[bool, int, bytes, None]
+
+# return codes, see error_handling.error_mapping
+SUCCESS, FAILURE, YES, NO = 0, 1, 2, 3
+BAD_PROPERTY, BAD_ARGUMENT, UNKNOWN_TYPE, UNEXPECTED_OBJECT = 5, 6, 7, 8
+NULL_OBJECT, NOT_IMPLEMENTED, NOT_FOUND, FILE_NOT_FOUND = 10, 17, 26, 32
+
+# not documented in the headers, numbered here so they can be created still
+undocumented_objects = {"VIS_STATE": 100, "CMPTXT": 101, "COLUMN_VALUE": 102}
+
+# properties of the owner that point to the first object of a type, where
+# they are not named after the type
+chain_constants = {
+    "OBJ_GROUP": "OBJ_GRP",
+    "REC_GROUP": "REC_GRP",
+    "RG_COLSPEC": "COL_SPEC",
+    "CMPTXT": "COMPOUND_TEXT",
+}
+
+value_types = {
+    "bool": ValueTypes.BOOLEAN,
+    "num": ValueTypes.NUMBER,
+    "text": ValueTypes.TEXT,
+    "obj": ValueTypes.OBJECT,
+}
+
+
+class FakeError(Exception):
+    def __init__(self, code: int) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+def write_int(address: int, value: int) -> None:
+    c_int.from_address(address).value = value
+
+
+def write_pointer(address: int, value: Optional[int]) -> None:
+    c_void_p.from_address(address).value = value
+
+
+def not_implemented(*args: object) -> int:
+    return NOT_IMPLEMENTED
+
+
+class FakeObject:
+    __slots__ = ("type_number", "properties", "chains", "subclass_of")
+
+    def __init__(self, type_number: int) -> None:
+        self.type_number = type_number
+        self.properties: Dict[int, Value] = {}
+        # numbers of the properties holding the first object of a chain
+        self.chains: List[int] = []
+        self.subclass_of: Optional[int] = None
+
+
+class CallbackAPI:
+    # entry points built from python functions, with the signatures the package
+    # binds, missing ones answer NOT_IMPLEMENTED
+    def __init__(self, implementations: Dict[str, Callable[..., int]]) -> None:  # type: ignore
+        # texts handed out by the getters, until the package frees them, and
+        # the constant names, which are never freed
+        self.allocated: Dict[int, Array[c_char]] = {}
+        self.constants: Dict[bytes, Array[c_char]] = {}
+        # calls made into the api, for benchmarks to count the crossings
+        self.api_calls = 0
+
+        for api_function_name, arguments in api_signatures.items():
+            prototype = CFUNCTYPE(c_int, c_void_p, *arguments)
+            implementation = implementations.get(api_function_name, not_implemented)
+            setattr(
+                self, api_function_name, prototype(self.returns_code(implementation))
+            )
+
+        self.d2fctxcr_Create = CFUNCTYPE(c_int, c_void_p, c_void_p)(self.create_context)
+        self.free = CFUNCTYPE(None, c_void_p)(self.free_text)
+
+    def returns_code(self, implementation: Callable[..., int]) -> Callable[..., int]:  # type: ignore
+        # an exception can't get out of a callback, so it becomes the return code
+        def _returns_code(*args: object) -> int:
+            self.api_calls += 1
+            try:
+                return implementation(*args)
+            except FakeError as error:
+                return error.code
+
+        return _returns_code
+
+    def create_context(self, ctx: int, attributes: int) -> int:
+        write_pointer(ctx, 1)
+        return SUCCESS
+
+    def free_text(self, address: int) -> None:
+        self.allocated.pop(address, None)
+
+    def write_text(self, out: int, text: Optional[bytes]) -> None:
+        if text is None:
+            write_pointer(out, None)
+        else:
+            buffer = create_string_buffer(text)
+            self.allocated[addressof(buffer)] = buffer
+            write_pointer(out, addressof(buffer))
+
+    def write_constant(self, out: int, name: bytes) -> None:
+        buffer = self.constants.setdefault(name, create_string_buffer(name))
+        write_pointer(out, addressof(buffer))
+
+
+class FakeAPI(CallbackAPI):
+    def __init__(self, version: str = "12c") -> None:
+        metadata = api_metadata(version)
+        self.property_numbers: Dict[str, int] = dict(metadata.property_numbers)
+        self.property_names = {
+            number: name for name, number in self.property_numbers.items()
+        }
+        self.property_types: Dict[int, str] = metadata.property_types
+        self.support: Dict[int, int] = metadata.supported_properties
+        self.object_numbers = {
+            name[6:]: number
+            for name, number in metadata.object_numbers.items()
+            if name != "D2FFO_ANY"
+        }
+        self.object_numbers.update(undocumented_objects)
+        self.object_names = {
+            number: name for name, number in self.object_numbers.items()
+        }
+
+        self.NAME = self.property_numbers["NAME"]
+        self.OWNER = self.property_numbers["OWNER"]
+        self.NEXT = self.property_numbers["NEXT"]
+        self.PREVIOUS = self.property_numbers["PREVIOUS"]
+        self.OBJ_COUNT = self.property_numbers.get("OBJ_COUNT")
+
+        self.objects: Dict[int, FakeObject] = {}
+        self.handles = 0x10000
+
+        implementations: Dict[str, Callable[..., int]] = {  # type: ignore
+            "d2fctxde_Destroy": self.destroy_context,
+            "d2ffmdcr_Create": self.create_module,
+            "d2ffmdld_Load": self.load,
+            "d2flibld_Load": self.load,
+            "d2folbld_Load": self.load,
+            "d2ffmdsv_Save": self.save,
+            "d2fobcr_Create": self.create,
+            "d2fobde_Destroy": self.destroy,
+            "d2fobdu_Duplicate": self.duplicate,
+            "d2fobmv_Move": self.move,
+            "d2fobfo_FindObj": self.find_object,
+            "d2fobqt_QueryType": self.query_type,
+            "d2fobhp_HasProp": self.has_property,
+            "d2fobis_IsSubclassed": self.is_subclassed,
+            "d2fobsc_SubClass": self.subclass,
+            "d2fobus_UnSubClass": self.unsubclass,
+            "d2fobgb_GetBoolProp": self.get_boolean,
+            "d2fobgn_GetNumProp": self.get_number,
+            "d2fobgo_GetObjProp": self.get_object,
+            "d2fobgt_GetTextProp": self.get_text,
+            "d2fobsb_SetBoolProp": self.set_boolean,
+            "d2fobsn_SetNumProp": self.set_number,
+            "d2fobso_SetObjProp": self.set_object,
+            "d2fobst_SetTextProp": self.set_text,
+            "d2fobgcn_GetConstName": self.object_name,
+            "d2fobgcv_GetConstValue": self.object_number,
+            "d2fprgcn_GetConstName": self.property_constant_name,
+            "d2fprgcv_GetConstValue": self.property_number,
+            "d2fprgn_GetName": self.property_name,
+            "d2fprgt_GetType": self.property_type,
+            "d2folbf2_Findobjbypos": self.find_by_position,
+            "d2foltf2_Findobjbypos": self.find_by_position,
+        }
+        super().__init__(implementations)
+
+    def __getitem__(self, handle: Optional[int]) -> FakeObject:
+        if not handle:
+            raise FakeError(NULL_OBJECT)
+        try:
+            return self.objects[handle]
+        except KeyError:
+            raise FakeError(UNEXPECTED_OBJECT) from None
+
+    # objects and their chains
+
+    def add(self, type_number: int, name: bytes, owner: Optional[int] = None) -> int:
+        if type_number not in self.object_names:
+            raise FakeError(UNKNOWN_TYPE)
+        self.handles += 0x10
+        handle = self.handles
+        fake_object = self.objects[handle] = FakeObject(type_number)
+        fake_object.properties[self.NAME] = name
+        if owner:
+            fake_object.properties[self.OWNER] = owner
+            self.link(handle, None)
+        return handle
+
+    def chain(self, handle: int) -> int:
+        name = self.object_names[self[handle].type_number]
+        constant = chain_constants.get(name, name)
+        return self.property_numbers.get(constant, -self[handle].type_number)
+
+    def children(self, handle: int) -> Iterator[int]:
+        properties = self[handle].properties
+        for chain in list(self[handle].chains):
+            child = properties.get(chain)
+            while child:
+                next_child = self[child].properties.get(self.NEXT)  # type: ignore
+                yield child  # type: ignore
+                child = next_child
+
+    def link(self, handle: int, next_object: Optional[int]) -> None:
+        # before next_object, or at the end of the chain
+        properties = self[handle].properties
+        owner = self[properties[self.OWNER]]  # type: ignore
+        chain = self.chain(handle)
+        if chain not in owner.chains:
+            owner.chains.append(chain)
+
+        if next_object:
+            previous = self[next_object].properties.get(self.PREVIOUS)
+        else:
+            previous = owner.properties.get(chain)
+            while previous and self[previous].properties.get(self.NEXT):  # type: ignore
+                previous = self[previous].properties[self.NEXT]  # type: ignore
+
+        properties[self.NEXT], properties[self.PREVIOUS] = next_object, previous
+        if next_object:
+            self[next_object].properties[self.PREVIOUS] = handle
+        if previous:
+            self[previous].properties[self.NEXT] = handle  # type: ignore
+        else:
+            owner.properties[chain] = handle
+
+    def unlink(self, handle: int) -> None:
+        properties = self[handle].properties
+        next_object = properties.pop(self.NEXT, None)
+        previous = properties.pop(self.PREVIOUS, None)
+        if next_object:
+            self[next_object].properties[self.PREVIOUS] = previous  # type: ignore
+        if previous:
+            self[previous].properties[self.NEXT] = next_object  # type: ignore
+        else:
+            owner = self[properties[self.OWNER]]  # type: ignore
+            owner.properties[self.chain(handle)] = next_object
+
+    def remove(self, handle: int) -> None:
+        for child in self.children(handle):
+            self.remove(child)
+        del self.objects[handle]
+
+    def copy(self, source: int, owner: int, name: bytes) -> int:
+        handle = self.add(self[source].type_number, name, owner)
+        structure = {self.NAME, self.OWNER, self.NEXT, self.PREVIOUS}
+        structure.update(self[source].chains)
+        for number, value in self[source].properties.items():
+            if number not in structure:
+                self[handle].properties[number] = value
+        for child in self.children(source):
+            self.copy(child, handle, self[child].properties[self.NAME])  # type: ignore
+        return handle
+
+    def library_objects(self, handle: int) -> List[int]:
+        # the objects of a tab, or of all the tabs of an object library
+        if self.object_names[self[handle].type_number] == "OBJ_LIB":
+            return [
+                library_object
+                for tab in self.children(handle)
+                for library_object in self.children(tab)
+            ]
+        return list(self.children(handle))
+
+    # context
+
+    def destroy_context(self, ctx: int) -> int:
+        self.objects.clear()
+        self.allocated.clear()
+        return SUCCESS
+
+    # modules
+
+    def create_module(self, ctx: int, module: int, name: bytes) -> int:
+        write_pointer(module, self.add(self.object_numbers["FORM_MODULE"], name))
+        return SUCCESS
+
+    def dump(self, handle: int) -> List[Dict[str, object]]:
+        # the module and everything in it, owners before what they own
+        handles = [handle]
+        for owner in handles:
+            handles.extend(self.children(owner))
+        index = {handle: position for position, handle in enumerate(handles)}
+
+        dumped: List[Dict[str, object]] = []
+        for handle in handles:
+            fake_object = self[handle]
+            structure = {self.OWNER, self.NEXT, self.PREVIOUS, *fake_object.chains}
+            properties: Dict[str, object] = {}
+            for number, value in fake_object.properties.items():
+                name = self.property_names.get(number, str(number))
+                if number in structure or value is None:
+                    continue
+                if isinstance(value, bytes):
+                    properties[name] = ["text", value.decode("latin-1")]
+                elif self.property_types.get(number) == "obj":
+                    # references to objects outside of the module are not kept
+                    if value in index:
+                        properties[name] = ["obj", index[value]]
+                else:
+                    properties[name] = [type(value).__name__, value]
+            owner = fake_object.properties.get(self.OWNER)
+            dumped.append(
+                {
+                    "type": self.object_names[fake_object.type_number],
+                    "owner": index.get(owner) if handle != handles[0] else None,  # type: ignore
+                    "properties": properties,
+                }
+            )
+        return dumped
+
+    def save(self, ctx: int, module: int, path: bytes, database: bool) -> int:
+        try:
+            with open(path, mode="w", encoding="utf-8") as file:
+                json.dump(self.dump(module), file, indent=1)
+        except OSError:
+            return FAILURE
+        return SUCCESS
+
+    def load(self, ctx: int, module: int, path: bytes, database: bool = False) -> int:
+        try:
+            with open(path, mode="r", encoding="utf-8") as file:
+                dumped: List[Dict[str, object]] = json.load(file)
+        except OSError:
+            return FILE_NOT_FOUND
+
+        handles: List[int] = []
+        for entry in dumped:
+            properties: Dict[str, List[object]] = entry["properties"]  # type: ignore
+            name = properties.get("NAME", ["text", ""])[1]
+            owner = entry["owner"]
+            handles.append(
+                self.add(
+                    self.object_numbers[entry["type"]],
+                    name.encode("latin-1"),  # type: ignore
+                    handles[owner] if owner is not None else None,  # type: ignore
+                )
+            )
+        for handle, entry in zip(handles, dumped):
+            for name, (kind, value) in entry["properties"].items():  # type: ignore
+                number = self.property_numbers.get(name) or int(name)
+                if kind == "text":
+                    value = value.encode("latin-1")
+                elif kind == "obj":
+                    value = handles[value]
+                self[handle].properties[number] = value
+
+        write_pointer(module, handles[0])
+        return SUCCESS
+
+    # objects
+
+    def create(
+        self, ctx: int, owner: int, generic_object: int, name: bytes, type_number: int
+    ) -> int:
+        self[owner]
+        write_pointer(generic_object, self.add(type_number, name, owner))
+        return SUCCESS
+
+    def destroy(self, ctx: int, handle: int) -> int:
+        if self[handle].properties.get(self.OWNER):
+            self.unlink(handle)
+        self.remove(handle)
+        return SUCCESS
+
+    def duplicate(
+        self, ctx: int, owner: int, source: int, generic_object: int, name: bytes
+    ) -> int:
+        self[owner]
+        write_pointer(generic_object, self.copy(source, owner, name))
+        return SUCCESS
+
+    def move(self, ctx: int, handle: int, next_object: Optional[int]) -> int:
+        properties = self[handle].properties
+        if not properties.get(self.OWNER):
+            return BAD_ARGUMENT
+        if next_object and (
+            self[next_object].properties.get(self.OWNER) != properties[self.OWNER]
+            or self.chain(next_object) != self.chain(handle)
+        ):
+            return BAD_ARGUMENT
+        if next_object != handle:
+            self.unlink(handle)
+            self.link(handle, next_object)
+        return SUCCESS
+
+    def find_object(
+        self, ctx: int, owner: int, name: bytes, type_number: int, found: int
+    ) -> int:
+        for child in self.children(owner):
+            child_object = self[child]
+            if (
+                child_object.type_number == type_number
+                and (child_object.properties[self.NAME] or b"").upper() == name.upper()  # type: ignore
+            ):
+                write_pointer(found, child)
+                return SUCCESS
+        return NOT_FOUND
+
+    def find_by_position(self, ctx: int, owner: int, position: int, found: int) -> int:
+        library_objects = self.library_objects(owner)
+        if not 1 <= position <= len(library_objects):
+            return BAD_ARGUMENT
+        write_pointer(found, library_objects[position - 1])
+        return SUCCESS
+
+    def query_type(self, ctx: int, handle: int, type_number: int) -> int:
+        write_int(type_number, self[handle].type_number)
+        return SUCCESS
+
+    def has_property(self, ctx: int, handle: int, number: int) -> int:
+        return (
+            YES if self.support.get(self[handle].type_number, 0) >> number & 1 else NO
+        )
+
+    def is_subclassed(self, ctx: int, handle: int) -> int:
+        return YES if self[handle].subclass_of else NO
+
+    def subclass(self, ctx: int, handle: int, parent: int, keep_path: bool) -> int:
+        self[handle].subclass_of = parent
+        par_nam = self.property_numbers.get("PAR_NAM")
+        if par_nam is not None:
+            self[handle].properties[par_nam] = self[parent].properties[self.NAME]
+        return SUCCESS
+
+    def unsubclass(self, ctx: int, handle: int) -> int:
+        self[handle].subclass_of = None
+        self[handle].properties.pop(self.property_numbers.get("PAR_NAM", -1), None)
+        return SUCCESS
+
+    # properties
+
+    def known(self, number: int) -> int:
+        if number not in self.property_names:
+            raise FakeError(BAD_PROPERTY)
+        return number
+
+    def writable(self, handle: int, number: int) -> int:
+        if (
+            number in (self.OWNER, self.NEXT, self.PREVIOUS)
+            or number in self[handle].chains
+        ):
+            raise FakeError(FAILURE)
+        return self.known(number)
+
+    def get_boolean(self, ctx: int, handle: int, number: int, value: int) -> int:
+        c_bool.from_address(value).value = bool(
+            self[handle].properties.get(self.known(number))
+        )
+        return SUCCESS
+
+    def get_number(self, ctx: int, handle: int, number: int, value: int) -> int:
+        if number == self.OBJ_COUNT:
+            write_int(value, len(self.library_objects(handle)))
+        else:
+            write_int(value, self[handle].properties.get(self.known(number)) or 0)  # type: ignore
+        return SUCCESS
+
+    def get_object(self, ctx: int, handle: int, number: int, value: int) -> int:
+        write_pointer(value, self[handle].properties.get(self.known(number)))  # type: ignore
+        return SUCCESS
+
+    def get_text(self, ctx: int, handle: int, number: int, value: int) -> int:
+        self.write_text(value, self[handle].properties.get(self.known(number)))  # type: ignore
+        return SUCCESS
+
+    def set_boolean(self, ctx: int, handle: int, number: int, value: bool) -> int:
+        self[handle].properties[self.writable(handle, number)] = bool(value)
+        return SUCCESS
+
+    def set_number(self, ctx: int, handle: int, number: int, value: int) -> int:
+        self[handle].properties[self.writable(handle, number)] = value
+        return SUCCESS
+
+    def set_object(
+        self, ctx: int, handle: int, number: int, value: Optional[int]
+    ) -> int:
+        self[handle].properties[self.writable(handle, number)] = value
+        return SUCCESS
+
+    def set_text(self, ctx: int, handle: int, number: int, value: Optional[int]) -> int:
+        text = string_at(value) if value else None
+        self[handle].properties[self.writable(handle, number)] = text
+        return SUCCESS
+
+    # constants
+
+    def constant(self, name: str, out: int) -> int:
+        self.write_constant(out, name.encode())
+        return SUCCESS
+
+    def object_name(self, ctx: int, type_number: int, name: int) -> int:
+        if type_number not in self.object_names:
+            raise FakeError(UNKNOWN_TYPE)
+        return self.constant(self.object_names[type_number], name)
+
+    def object_number(self, ctx: int, name: bytes, type_number: int) -> int:
+        try:
+            write_int(type_number, self.object_numbers[name.decode()])
+        except KeyError:
+            return UNKNOWN_TYPE
+        return SUCCESS
+
+    def property_constant_name(self, ctx: int, number: int, name: int) -> int:
+        try:
+            return self.constant(self.property_names[number], name)
+        except KeyError:
+            return BAD_PROPERTY
+
+    def property_name(self, ctx: int, number: int, name: int) -> int:
+        try:
+            constant = self.property_names[number]
+        except KeyError:
+            return BAD_PROPERTY
+        return self.constant(constant.replace("_", " ").title(), name)
+
+    def property_number(self, ctx: int, name: bytes, number: int) -> int:
+        constant = name.decode()
+        if constant not in self.property_numbers:
+            # not in the headers, but the dll has it, so it gets a number here
+            added = max(self.property_names) + 1
+            self.property_numbers[constant], self.property_names[added] = (
+                added,
+                constant,
+            )
+        write_int(number, self.property_numbers[constant])
+        return SUCCESS
+
+    def property_type(self, ctx: int, number: int) -> int:
+        # not an error code, but the type itself
+        data_type = self.property_types.get(number, "")
+        return int(value_types.get(data_type, ValueTypes.UNKNOWN))
@@ -1,9 +1,11 @@
-import json
-import pathlib
 from ctypes import *
-from os import pathsep, environ
-from os.path import exists, abspath, join
-from typing import Dict, Tuple, Optional
+from importlib import import_module
+from os import makedirs, pathsep, environ
+from os.path import exists, abspath, dirname, expanduser, isfile, join
+from types import ModuleType
+from typing import Dict, List, Tuple, Optional
+
+from .error_handling import DLLNotFoundError
 
 dll_names = {
     "12c": ("frmd2f.dll", "msvcr100"),
@@ -12,28 +14,91 @@ dll_names = {
 }
 
 
-def find_dll(dll_name: str) -> Optional[str]:
-    search_path = environ["PATH"]
-    for path in search_path.split(pathsep):
+# directories to look for the dll in instead of PATH, separated like PATH. the
+# path of the dll itself can be given too, its directory is searched then
+dll_path_variable = "PYORACLE_FORMS_DLL_PATH"
+
+
+def search_directories(dll_path: Optional[str] = None) -> List[str]:
+    search_path = dll_path or environ.get(dll_path_variable) or environ["PATH"]
+    return [
+        dirname(abspath(path)) if isfile(path) else path
+        for path in search_path.split(pathsep)
+        if path
+    ]
+
+
+def dll_cache_file() -> str:
+    cache_home = environ.get("LOCALAPPDATA") or join(expanduser("~"), ".cache")
+    return join(cache_home, "pyoracle_forms", "dll_paths.json")
+
+
+def read_dll_cache() -> Dict[str, Dict[str, str]]:
+    import json
+
+    try:
+        with open(dll_cache_file(), mode="r", encoding="utf-8") as file:
+            cache: Dict[str, Dict[str, str]] = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def write_dll_cache(dll_name: str, search_path: str, directory: str) -> None:
+    import json
+
+    cache = read_dll_cache()
+    cache[dll_name] = {"search_path": search_path, "directory": directory}
+    try:
+        makedirs(dirname(dll_cache_file()), exist_ok=True)
+        with open(dll_cache_file(), mode="w", encoding="utf-8") as file:
+            json.dump(cache, file, indent=2)
+    except OSError:  # pragma: no cover
+        # the cache only saves the next start some time
+        pass
+
+
+def find_dll(dll_name: str, dll_path: Optional[str] = None) -> Optional[str]:
+    # where the dll was found last time is remembered, as long as the
+    # directories searched stay the same, so PATH is not scanned every start
+    directories = search_directories(dll_path)
+    search_path = pathsep.join(directories)
+    cached = read_dll_cache().get(dll_name, {})
+    if cached.get("search_path") == search_path:
+        directory = cached.get("directory", "")
+        if exists(join(directory, dll_name)):
+            return directory
+
+    for path in directories:
         if exists(join(path, dll_name)):
-            return abspath(path)
+            directory = abspath(path)
+            write_dll_cache(dll_name, search_path, directory)
+            return directory
     return None
 
 
-def dlls(version: str) -> Tuple[CDLL, CDLL]:
+def dlls(version: str, dll_path: Optional[str] = None) -> Tuple[CDLL, CDLL]:
     api_dll, cdll_name = dll_names[version]
-    dll_path = find_dll(api_dll)
-    if dll_path:
+    dll_directory = find_dll(api_dll, dll_path)
+    if dll_directory:
         from os import add_dll_directory
 
         msvcrt = cdll.LoadLibrary(cdll_name)
-        with add_dll_directory(dll_path):
+        with add_dll_directory(dll_directory):
             return cdll.LoadLibrary(api_dll), msvcrt
-    raise ImportError("No Oracle Forms API found")
+    raise DLLNotFoundError(api_dll, search_directories(dll_path))
 
 
 def read_api_objects(version: str) -> Dict:  # type: ignore
-    file_path = pathlib.Path(__file__).parent / "forms_api" / f"parsed_{version}.json"
+    # json is only needed here, initialize_context uses the precompiled metadata
+    import json
+
+    file_path = join(dirname(__file__), "forms_api", f"parsed_{version}.json")
     with open(file_path, mode="r", encoding="utf-8") as file:
         json_data: Dict = json.load(file)  # type: ignore
     return json_data
+
+
+def api_metadata(version: str) -> ModuleType:
+    # precompiled from parsed_<version>.json by forms_api/api_scraper.py
+    return import_module(f"{__package__}.metadata.api_{version}")
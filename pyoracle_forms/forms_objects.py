@@ -9,7 +9,8 @@ from .context import load_module
 from .context import save_module
 from .context import load_library
 from .context import load_object_library
-from .generic_object import GenericObject, BaseObject, FormsObjects
+from .generic_object import GenericObject, BaseObject, FormsObjects, remember
+from .object_collection import ObjectCollection
 from .misc import (
     forms_object,
     Text,
@@ -26,7 +27,7 @@ from .constants import *
 
 # satisfy both MyPy and PyCharm IDE autocomplete
 U = TypeVar("U")
-ObjectList = Union[List[U], Subobjects[U]]
+ObjectList = Union[ObjectCollection[U], List[U], Subobjects[U]]
 ObjectLibraryTabObjectList = Union[List[U], ObjectLibraryTabObjects]
 Obj = Union[U, Object[U]]
 
@@ -34,6 +35,7 @@ Obj = Union[U, Object[U]]
 @forms_object
 class Module(BaseObject):
     object_type = FormsObjects.module
+    __slots__ = ("path",)
 
     name = Text("NAME")
     comments = Text("COMMENT")
@@ -117,11 +119,11 @@ class Module(BaseObject):
 
     @classmethod
     def create(cls, module_name: str) -> Module:
-        return cls(create_module(module_name), module_name)
+        return remember(cls(create_module(module_name), module_name))
 
     @classmethod
     def load(cls, path: str) -> Module:
-        return cls(load_module(path), path=path)
+        return remember(cls(load_module(path), path=path))
 
     def save(self, path: Optional[str] = None) -> None:
         path = path or self.path
@@ -133,6 +135,7 @@ class Module(BaseObject):
 @forms_object
 class Library(BaseObject):
     object_type = FormsObjects.library
+    __slots__ = ("path",)
 
     attached_libraries: ObjectList[AttachedLibrary] = Subobjects("ATT_LIB")
     pl_sql_library_location = Text("LIB_LOC")
@@ -160,13 +163,14 @@ class Library(BaseObject):
 
     @classmethod
     def load(cls, path: str) -> Library:
-        return cls(load_library(path), path=path)
+        return remember(cls(load_library(path), path=path))
 
 
 @forms_object
 class ObjectLibrary(GenericObject):
     # auto-generated
     object_type = FormsObjects.object_library
+    __slots__ = ("path",)
 
     object_library_tabs: ObjectList[ObjectLibraryTab] = Subobjects("OBJ_LIB_TAB")
 
@@ -196,13 +200,14 @@ class ObjectLibrary(GenericObject):
 
     @classmethod
     def load(cls, path: str) -> ObjectLibrary:
-        return cls(load_object_library(path), path=path)
+        return remember(cls(load_object_library(path), path=path))
 
 
 @forms_object
 class ObjectLibraryTab(GenericObject):
     # auto-generated
     object_type = FormsObjects.object_library_tab
+    __slots__ = ()
 
     # object_library_tabs: ObjectList[ObjectLibraryTab] = Subobjects("OBJ_LIB_TAB")
     objects: ObjectLibraryTabObjectList[
@@ -224,6 +229,7 @@ class ObjectLibraryTab(GenericObject):
 class LibraryProgramUnit(GenericObject):
     # auto-generated
     object_type = FormsObjects.library_program_unit
+    __slots__ = ()
 
     name = Text("NAME")
     next_object: Obj[LibraryProgramUnit] = Object("NEXT")
@@ -235,6 +241,7 @@ class LibraryProgramUnit(GenericObject):
 class AttachedLibrary(GenericObject):
     # auto-generated
     object_type = FormsObjects.attached_library
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -251,6 +258,7 @@ class AttachedLibrary(GenericObject):
 class Alert(GenericObject):
     # auto-generated
     object_type = FormsObjects.alert
+    __slots__ = ()
 
     button_1_label = Text("BTN_1_LBL")
     button_2_label = Text("BTN_2_LBL")
@@ -291,6 +299,8 @@ class Alert(GenericObject):
 
 
 class Any(GenericObject):
+    __slots__ = ()
+
     keyboard_accelerator = Text("KBRD_ACC")
     alerts: Subobjects[Alert] = Subobjects("ALERT")
     justification = Number("JUSTIFICATION")
@@ -777,6 +787,7 @@ class Any(GenericObject):
 class Canvas(GenericObject):
     # auto-generated
     object_type = FormsObjects.canvas
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     bevel: Constant[Bevel] = Constant("BEVEL", Bevel)
@@ -842,12 +853,14 @@ class Canvas(GenericObject):
 class CompoundText(Any):
     # auto-generated
     object_type = FormsObjects.compound_text
+    __slots__ = ()
 
 
 @forms_object
 class DataBlock(GenericObject):
     # auto-generated
     object_type = FormsObjects.data_block
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     case_info = Unknown("CLIENT_INFO")
@@ -953,6 +966,7 @@ class DataBlock(GenericObject):
 class FormParameter(GenericObject):
     # auto-generated
     object_type = FormsObjects.form_parameter
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -980,6 +994,7 @@ class FormParameter(GenericObject):
 class Graphic(GenericObject):
     # auto-generated
     object_type = FormsObjects.graphic
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     bevel: Constant[Bevel] = Constant("BEVEL", Bevel)
@@ -1123,6 +1138,7 @@ class Graphic(GenericObject):
 class Item(GenericObject):
     # auto-generated
     object_type = FormsObjects.item
+    __slots__ = ()
 
     justification: Constant[Justification] = Constant("JUSTIFICATION", Justification)
     automatic_skip = Bool("AUTO_SKP")
@@ -1317,6 +1333,7 @@ class Item(GenericObject):
 class Point(GenericObject):
     # auto-generated
     object_type = FormsObjects.point
+    __slots__ = ()
 
     name = Text("NAME")
     next_object: Obj[Point] = Object("NEXT")
@@ -1329,6 +1346,7 @@ class Point(GenericObject):
 class ProgramUnit(GenericObject):
     # auto-generated
     object_type = FormsObjects.program_unit
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -1354,6 +1372,7 @@ class ProgramUnit(GenericObject):
 class PropertyClass(GenericObject):
     # auto-generated
     object_type = FormsObjects.property_class
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -1378,6 +1397,7 @@ class PropertyClass(GenericObject):
 class RadioButton(GenericObject):
     # auto-generated
     object_type = FormsObjects.radio_button
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     case_info = Unknown("CLIENT_INFO")
@@ -1455,6 +1475,7 @@ class RadioButton(GenericObject):
 class Relation(GenericObject):
     # auto-generated
     object_type = FormsObjects.relation
+    __slots__ = ()
 
     automatic_query = Bool("AUTO_QRY")
     case_info = Unknown("CLIENT_INFO")
@@ -1482,6 +1503,7 @@ class Relation(GenericObject):
 class TabPage(GenericObject):
     # auto-generated
     object_type = FormsObjects.tab_page
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     graphics: ObjectList[Graphic] = Subobjects("GRAPHIC")
@@ -1517,6 +1539,7 @@ class TabPage(GenericObject):
 class Trigger(GenericObject):
     # auto-generated
     object_type = FormsObjects.trigger
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -1556,6 +1579,7 @@ class Trigger(GenericObject):
 class VisualAttribute(GenericObject):
     # auto-generated
     object_type = FormsObjects.visual_attribute
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     case_info = Unknown("CLIENT_INFO")
@@ -1614,12 +1638,14 @@ class VisualAttribute(GenericObject):
 class VisualState(Any):
     # auto-generated
     object_type = FormsObjects.visual_state
+    __slots__ = ()
 
 
 @forms_object
 class Window(GenericObject):
     # auto-generated
     object_type = FormsObjects.window
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     bevel: Constant[Bevel] = Constant("BEVEL", Bevel)
@@ -1678,6 +1704,7 @@ class Window(GenericObject):
 class DataSourceArgument(GenericObject):
     # auto-generated
     object_type = FormsObjects.data_source_argument
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     next_object: Obj[DataSourceArgument] = Object("NEXT")
@@ -1696,6 +1723,7 @@ class DataSourceArgument(GenericObject):
 class DataSourceColumn(GenericObject):
     # auto-generated
     object_type = FormsObjects.data_source_column
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     next_object: Obj[DataSourceColumn] = Object("NEXT")
@@ -1716,6 +1744,7 @@ class DataSourceColumn(GenericObject):
 class Editor(GenericObject):
     # auto-generated
     object_type = FormsObjects.editor
+    __slots__ = ()
 
     background_color = Text("BACK_COLOR")
     bottom_title = Text("BTM_TTL")
@@ -1758,6 +1787,7 @@ class Editor(GenericObject):
 class LOV(GenericObject):
     # auto-generated
     object_type = FormsObjects.lov
+    __slots__ = ()
 
     automatic_select = Bool("AUTO_SLCT")
     automatic_display = Bool("AUTO_DISP")
@@ -1809,6 +1839,7 @@ class LOV(GenericObject):
 class LOVColumnMap(GenericObject):
     # auto-generated
     object_type = FormsObjects.lov_column_map
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     display_width = Number("DISP_WID")
@@ -1825,6 +1856,7 @@ class LOVColumnMap(GenericObject):
 class Menu(GenericObject):
     # auto-generated
     object_type = FormsObjects.menu
+    __slots__ = ()
 
     bottom_title = Text("BTM_TTL")
     case_info = Unknown("CLIENT_INFO")
@@ -1853,6 +1885,7 @@ class Menu(GenericObject):
 class MenuItem(GenericObject):
     # auto-generated
     object_type = FormsObjects.menu_item
+    __slots__ = ()
 
     keyboard_accelerator = Text("KBRD_ACC")
     case_info = Unknown("CLIENT_INFO")
@@ -1905,6 +1938,7 @@ class MenuItem(GenericObject):
 class ObjectGroup(GenericObject):
     # auto-generated
     object_type = FormsObjects.object_group
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -1930,6 +1964,7 @@ class ObjectGroup(GenericObject):
 class ObjectChild(GenericObject):
     # auto-generated
     object_type = FormsObjects.object_child
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     name = Text("NAME")
@@ -1947,6 +1982,7 @@ class ObjectChild(GenericObject):
 class RecordGroup(GenericObject):
     # auto-generated
     object_type = FormsObjects.record_group
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     record_group_colspecs: ObjectList[RecordGroupColspec] = Subobjects("COL_SPEC")
@@ -1976,6 +2012,7 @@ class RecordGroup(GenericObject):
 class RecordGroupColspec(GenericObject):
     # auto-generated
     object_type = FormsObjects.record_group_colspec
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     column_data_type: Constant[ColumnDataType] = Constant("COL_DAT_TYP", ColumnDataType)
@@ -1996,6 +2033,7 @@ class RecordGroupColspec(GenericObject):
 class Report(GenericObject):
     # auto-generated
     object_type = FormsObjects.report
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -2067,6 +2105,7 @@ class Report(GenericObject):
 class Event(GenericObject):
     # auto-generated
     object_type = FormsObjects.event
+    __slots__ = ()
 
     case_info = Unknown("CLIENT_INFO")
     comments = Text("COMMENT")
@@ -2099,3 +2138,4 @@ class Event(GenericObject):
 class ColumnValue(Any):
     # auto-generated
     object_type = FormsObjects.column_value
+    __slots__ = ()
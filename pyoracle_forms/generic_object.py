@@ -2,20 +2,51 @@ from __future__ import annotations
 
 import enum
 from ctypes import c_void_p
-from typing import Optional, Union, NoReturn
+from functools import cached_property
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    NoReturn,
+    TYPE_CHECKING,
+)
 
+from .context import BulkGetter
+from .context import context
 from .context import create
 from .context import destroy
+from .context import find_object
 from .context import has_property
 from .context import remove_subclass
 from .context import set_subclass
-from .context import move
+from .context import move as move_object
+from .context import object_name
+from .context import object_number
+from .context import property_number
 from .context import query_type
 from .context import is_subclassed
 from .context import duplicate
+from .object_collection import forget_collections
+from .object_collection import loaded_collection
+from .object_collection import object_handle
+from .object_collection import object_added
+from .object_collection import prepare_collections
+from .object_collection import PropertyWrites
 
+from .error_handling import FormsException
 from .property_types import Properties
 
+if TYPE_CHECKING:  # pragma: no cover
+    from . import Module
+    from . import Library
+
 
 class FormsObjects(enum.Enum):
     canvas = "D2FFO_CANVAS"
@@ -65,28 +96,298 @@ class ValueTypes(enum.IntEnum):
     OBJECT = 4
 
 
-PropertyTypes = Union[bool, int, str, bytes, "BaseObject", c_void_p]
+PropertyTypes = Union[bool, int, str, bytes, "BaseObject", c_void_p, None]
+
+module_types = (FormsObjects.module, FormsObjects.library, FormsObjects.object_library)
+
+# types tried, in this order, for the parts of a path that have no type given
+path_types = (
+    FormsObjects.data_block,
+    FormsObjects.item,
+    FormsObjects.canvas,
+    FormsObjects.tab_page,
+    FormsObjects.graphic,
+    FormsObjects.window,
+    FormsObjects.program_unit,
+    FormsObjects.trigger,
+    FormsObjects.menu,
+    FormsObjects.menu_item,
+    FormsObjects.record_group,
+    FormsObjects.record_group_colspec,
+    FormsObjects.lov,
+    FormsObjects.object_group,
+    FormsObjects.object_library_tab,
+)
+
+other_types = tuple(
+    object_type
+    for object_type in FormsObjects
+    if object_type not in path_types and object_type not in module_types
+)
+
+objects = Union[Type["Module"], Type["Library"], Type["GenericObject"]]
+registered_objects: Dict[str, objects] = {}
+object_classes: Dict[int, objects] = {}
+type_numbers: Dict[FormsObjects, int] = {}
+# bitsets of the properties each object type has, by object number, and of the
+# properties that is known for, anything else gets asked from the API once
+supported_properties: Dict[int, int] = {}
+checked_properties: Dict[int, int] = {}
+# what finding an object raises when there is none of the type, or it is not a
+# type the owner can have, or that the version knows
+not_found_codes = (7, 8, 18, 26)
+# properties whose number got cached, for another version it has to be looked up
+# again
+resolved_properties: List[Common] = []
+
+
+B = TypeVar("B", bound="BaseObject")
+
+
+class Common:
+    # reads the values of many properties of this kind at once, if it can
+    bulk_getter: Optional[BulkGetter[PropertyTypes]] = None
+    # whether set_properties may write it
+    writable = True
+
+    def __init__(self, constant: str):
+        self.constant = constant
+
+    @cached_property
+    def number(self) -> int:
+        number = property_number(self.constant)
+        resolved_properties.append(self)
+        return number
+
+    def convert(self, value: PropertyTypes) -> PropertyTypes:
+        return value
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}("{self.constant}")'
+
+
+class PropertyPlan(NamedTuple):
+    # the properties asked for, in order, and how to read them: by their bulk
+    # getter, or one by one for anything that is not a plain property
+    names: Tuple[str, ...]
+    groups: List[Tuple[BulkGetter[PropertyTypes], List[int], List[Tuple[str, Common]]]]
+    other: List[str]
+
+
+property_plans: Dict[Tuple[type, Optional[Tuple[str, ...]]], PropertyPlan] = {}
+
+
+def forget_numbers() -> None:
+    # object and property numbers differ between versions, so whatever was
+    # cached by them is dropped once the context is destroyed
+    for common in resolved_properties:
+        vars(common).pop("number", None)
+    resolved_properties.clear()
+    object_classes.clear()
+    type_numbers.clear()
+    supported_properties.clear()
+    checked_properties.clear()
+    property_plans.clear()
+
+
+context.destroy_hooks.append(forget_numbers)
+
+
+def class_properties(klass: type) -> Dict[str, Common]:
+    return {
+        name: attribute
+        for base in reversed(klass.__mro__)
+        for name, attribute in vars(base).items()
+        if isinstance(attribute, Common) and attribute.bulk_getter is not None
+    }
+
+
+def property_plan(klass: type, names: Optional[Tuple[str, ...]]) -> PropertyPlan:
+    known = class_properties(klass)
+    names = tuple(known) if names is None else names
+    groups: Dict[
+        BulkGetter[PropertyTypes], Tuple[List[int], List[Tuple[str, Common]]]
+    ] = {}
+    other = []
+    for name in names:
+        descriptor = known.get(name)
+        if descriptor is not None and descriptor.bulk_getter is not None:
+            numbers, descriptors = groups.setdefault(descriptor.bulk_getter, ([], []))
+            numbers.append(descriptor.number)
+            descriptors.append((name, descriptor))
+        elif any(name in vars(base) for base in klass.__mro__):
+            other.append(name)
+        else:
+            raise AttributeError(f"{klass.__name__} has no property {name!r}")
+    return PropertyPlan(
+        names,
+        [
+            (bulk_getter, numbers, descriptors)
+            for bulk_getter, (numbers, descriptors) in groups.items()
+        ],
+        other,
+    )
+
+
+def cached_plan(klass: type, names: Optional[Tuple[str, ...]]) -> PropertyPlan:
+    try:
+        return property_plans[klass, names]
+    except KeyError:
+        plan = property_plans[klass, names] = property_plan(klass, names)
+        return plan
+
+
+def check_writable(klass: type, names: Iterable[str]) -> None:
+    # a read-only name must fail before set_properties has written anything
+    for name in names:
+        attribute = next(
+            vars(base)[name] for base in klass.__mro__ if name in vars(base)
+        )
+        if isinstance(attribute, property):
+            writable = attribute.fset is not None
+        else:
+            writable = getattr(attribute, "writable", False)
+        if not writable:
+            raise AttributeError(f"{klass.__name__} property {name!r} is read-only")
+
+
+def wrap(klass: Type[B], generic_object: Union[c_void_p, int, BaseObject]) -> B:
+    # the same handle gives the same wrapper, for as long as it is in use
+    if isinstance(generic_object, BaseObject):
+        handle = object_handle(generic_object)
+    elif isinstance(generic_object, c_void_p):
+        handle = generic_object.value or 0
+    else:
+        handle = generic_object
+    wrapper = context.objects.get(handle)
+    if wrapper.__class__ is not klass:
+        wrapper = context.objects[handle] = klass(generic_object)
+    return wrapper
+
+
+def remember(wrapper: B) -> B:
+    context.objects[object_handle(wrapper)] = wrapper
+    return wrapper
+
+
+def get_object_constructor(obj: BaseObject) -> objects:
+    type_number = query_type(obj)
+    try:
+        return object_classes[type_number]
+    except KeyError:
+        klass = registered_objects.get(object_name(type_number), GenericObject)
+        object_classes[type_number] = klass
+        return klass
+
+
+def load_property_support(support: Dict[int, int]) -> None:
+    known = 0
+    for bits in support.values():
+        known |= bits
+    for object_type_number, bits in support.items():
+        supported_properties[object_type_number] = bits
+        checked_properties[object_type_number] = known
+
+
+def type_number(object_type: FormsObjects) -> int:
+    try:
+        return type_numbers[object_type]
+    except KeyError:
+        number = type_numbers[object_type] = object_number(object_type.value[6:])
+        return number
+
+
+def move(generic_object: BaseObject, next_object: Optional[BaseObject]) -> None:
+    collection = loaded_collection(generic_object)
+    move_object(generic_object, next_object)
+    if collection is not None:
+        collection.move(generic_object, next_object)
 
 
 class BaseObject:
+    # the handle is kept as its plain value, ctypes passes it on as a pointer.
+    # once destroyed it is 0, while _handle keeps it for hashing and equality
+    __slots__ = ("_as_parameter_", "_handle", "__weakref__")
+
     object_type: FormsObjects
     _object_number: Optional[int]
-    _as_parameter_: c_void_p
+    _as_parameter_: int
+    _handle: int
 
     def __init__(
-        self, generic_object: Union[c_void_p, BaseObject, GenericObject]
+        self, generic_object: Union[c_void_p, int, BaseObject, GenericObject, None]
     ) -> None:
         if isinstance(generic_object, BaseObject):
             self._as_parameter_ = generic_object._as_parameter_
+            self._handle = generic_object._handle
+        elif isinstance(generic_object, c_void_p):
+            self._as_parameter_ = self._handle = generic_object.value or 0
         else:
-            self._as_parameter_ = generic_object
+            self._as_parameter_ = self._handle = generic_object or 0
 
     def has_property(self, property_number: int) -> bool:
-        return has_property(self, property_number)
+        try:
+            object_type_number = type_number(self.object_type)
+        except (AttributeError, FormsException):
+            object_type_number = query_type(self)
+
+        bit = 1 << property_number
+        checked = checked_properties.get(object_type_number, 0)
+        if checked & bit:
+            return bool(supported_properties[object_type_number] & bit)
+
+        supported = has_property(self, property_number)
+        checked_properties[object_type_number] = checked | bit
+        if supported:
+            supported_properties[object_type_number] = (
+                supported_properties.get(object_type_number, 0) | bit
+            )
+        return supported
+
+    def get_properties(
+        self, names: Optional[Iterable[str]] = None
+    ) -> Dict[str, PropertyTypes]:
+        # all the properties of the class, if no names are given
+        plan = cached_plan(self.__class__, None if names is None else tuple(names))
+        values: Dict[str, PropertyTypes] = {}
+        for bulk_getter, numbers, descriptors in plan.groups:
+            for (name, descriptor), value in zip(
+                descriptors, bulk_getter(self, numbers)
+            ):
+                values[name] = descriptor.convert(value)
+        for name in plan.other:
+            values[name] = getattr(self, name)
+        return {name: values[name] for name in plan.names}
+
+    def set_properties(
+        self, values: Mapping[str, PropertyTypes], skip_unchanged: bool = False
+    ) -> PropertyWrites:
+        # fail on unknown or read-only names before writing anything
+        cached_plan(self.__class__, tuple(values))
+        check_writable(self.__class__, values)
+        # read all the current values at once, to only write the ones that differ
+        current = self.get_properties(values) if skip_unchanged else {}
+
+        written = skipped = 0
+        for name, value in values.items():
+            if name in current and current[name] == value:
+                skipped += 1
+            else:
+                setattr(self, name, value)
+                written += 1
+        return PropertyWrites(written, skipped)
 
     def destroy(self) -> None:
-        destroy(self)
-        self._as_parameter_ = c_void_p(0)
+        if getattr(self, "object_type", None) in module_types:
+            destroy(self)
+        else:
+            collection = loaded_collection(self)
+            destroy(self)
+            if collection is not None:
+                collection.remove(self)
+        forget_collections(self)
+        context.objects.pop(object_handle(self), None)
+        self._as_parameter_ = 0
 
     def remove_subclass(self) -> None:
         remove_subclass(self)
@@ -101,13 +402,38 @@ class BaseObject:
         return query_type(self)
 
     def duplicate(self, new_owner: GenericObject, new_name: str) -> BaseObject:
-        return self.__class__(duplicate(new_owner, self, new_name))
+        owned = prepare_collections(new_owner, self.__class__)
+        duplicated = wrap(self.__class__, duplicate(new_owner, self, new_name))
+        object_added(owned, duplicated)
+        return duplicated
 
     def replicate(self, new_owner: GenericObject, new_name: str) -> NoReturn:
         raise NotImplementedError()
 
-    def find_object(self, name: str, object_type: FormsObjects) -> NoReturn:
-        raise NotImplementedError()
+    def find_object(self, name: str, object_type: FormsObjects) -> BaseObject:
+        found = find_object(self, name, type_number(object_type))
+        return wrap(get_object_constructor(BaseObject(found)), found)
+
+    def find(self, path: str, object_type: Optional[FormsObjects] = None) -> BaseObject:
+        # a dotted path like "EMP.SAL", owners along it can be of any path type
+        *owners, name = path.split(".")
+        found: BaseObject = self
+        for owner_name in owners:
+            found = found._find_any(owner_name, path_types)
+        if object_type is not None:
+            return found.find_object(name, object_type)
+        return found._find_any(name, path_types + other_types)
+
+    def _find_any(
+        self, name: str, object_types: Tuple[FormsObjects, ...]
+    ) -> BaseObject:
+        for object_type in object_types:
+            try:
+                return self.find_object(name, object_type)
+            except FormsException as error:
+                if error.args[0] not in not_found_codes:
+                    raise
+        raise FormsException(26, f"{name} not found in {self!r}")
 
     def inherit_property(self, property_type: Properties) -> NoReturn:
         raise NotImplementedError()
@@ -130,12 +456,21 @@ class BaseObject:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, BaseObject):
             return NotImplemented
-        return self._as_parameter_ == other._as_parameter_
+        # a destroyed object is not the one the API may reuse its handle for
+        return self._handle == other._handle and bool(self) == bool(other)
+
+    def __hash__(self) -> int:
+        return self._handle
 
 
 class GenericObject(BaseObject):
+    __slots__ = ()
+
     @classmethod
     def create(cls, owner: BaseObject, name: str) -> GenericObject:
         # todo: maybe better way than just an assert?
         assert cls._object_number is not None
-        return cls(create(owner, name, cls._object_number))
+        owned = prepare_collections(owner, cls)
+        created = wrap(cls, create(owner, name, cls._object_number))
+        object_added(owned, created)
+        return created
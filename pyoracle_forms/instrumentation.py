@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple, Optional, TypeVar
+
+from .context import ApiFunction, context
+from .generic_object import BaseObject, Common
+from . import misc  # noqa: F401, where the descriptor classes are defined
+
+T = TypeVar("T")
+DescriptorMethod = Callable[[Common, Optional[BaseObject], T], T]
+
+# entry points that return a value rather than a status code
+value_functions = {"d2fprgt_GetType"}
+# status codes that are answers rather than errors: success, yes and no
+answers = (0, 2, 3)
+
+
+class CallStats(NamedTuple):
+    calls: int
+    errors: int
+    total: float
+    maximum: float
+
+
+class Stats(NamedTuple):
+    # by d2f function name, and by descriptor like Text("TRG_TXT")
+    functions: Dict[str, CallStats]
+    descriptors: Dict[str, CallStats]
+
+
+# running calls, errors, total and maximum seconds, updated in place, as the
+# wrappers hold on to them
+function_counters: Dict[str, List[float]] = {}
+descriptor_counters: Dict[Common, List[float]] = {}
+# the methods of the descriptor classes, while they are replaced
+descriptor_methods: Dict[type, Dict[str, DescriptorMethod[object]]] = {}
+
+
+def counter() -> List[float]:
+    return [0, 0, 0.0, 0.0]
+
+
+def timed_function(api_function_name: str, func: ApiFunction) -> ApiFunction:
+    counts = function_counters.setdefault(api_function_name, counter())
+    status = api_function_name not in value_functions
+
+    def _timed_function(*args: object) -> int:
+        start = perf_counter()
+        result = func(*args)
+        elapsed = perf_counter() - start
+        counts[0] += 1
+        counts[2] += elapsed
+        if elapsed > counts[3]:
+            counts[3] = elapsed
+        if status and result not in answers:
+            counts[1] += 1
+        return result
+
+    return _timed_function
+
+
+def timed_descriptor(method: DescriptorMethod[T]) -> DescriptorMethod[T]:
+    def _timed_descriptor(
+        descriptor: Common, instance: Optional[BaseObject], value: T
+    ) -> T:
+        if instance is None:
+            # looked up on the class itself
+            return method(descriptor, instance, value)
+        try:
+            counts = descriptor_counters[descriptor]
+        except KeyError:
+            counts = descriptor_counters[descriptor] = counter()
+        start = perf_counter()
+        try:
+            return method(descriptor, instance, value)
+        except Exception:
+            counts[1] += 1
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            counts[0] += 1
+            counts[2] += elapsed
+            if elapsed > counts[3]:
+                counts[3] = elapsed
+
+    return _timed_descriptor
+
+
+def descriptor_classes(klass: type = Common) -> List[type]:
+    subclasses: List[type] = klass.__subclasses__()
+    found = subclasses + [
+        subclass for child in subclasses for subclass in descriptor_classes(child)
+    ]
+    return list(dict.fromkeys(found))
+
+
+def enable_stats() -> None:
+    # nothing is measured until this, and after disable_stats the package
+    # calls the native functions and descriptors directly again
+    if timed_function in context.instruments:
+        return
+    context.add_instrument(timed_function)
+
+    for klass in descriptor_classes():
+        methods = {
+            name: vars(klass)[name]
+            for name in ("__get__", "__set__")
+            if name in vars(klass)
+        }
+        descriptor_methods[klass] = methods
+        for name, method in methods.items():
+            setattr(klass, name, timed_descriptor(method))
+
+
+def disable_stats() -> None:
+    if timed_function not in context.instruments:
+        return
+    context.remove_instrument(timed_function)
+
+    for klass, methods in descriptor_methods.items():
+        for name, method in methods.items():
+            setattr(klass, name, method)
+    descriptor_methods.clear()
+
+
+def snapshot(counts: List[float]) -> CallStats:
+    calls, errors, total, maximum = counts
+    return CallStats(int(calls), int(errors), total, maximum)
+
+
+def stats() -> Stats:
+    descriptors: Dict[str, List[float]] = {}
+    for descriptor, counts in descriptor_counters.items():
+        # the same property on different classes is counted together
+        combined = descriptors.setdefault(repr(descriptor), counter())
+        combined[0] += counts[0]
+        combined[1] += counts[1]
+        combined[2] += counts[2]
+        combined[3] = max(combined[3], counts[3])
+    return Stats(
+        {
+            name: snapshot(counts)
+            for name, counts in function_counters.items()
+            if counts[0]
+        },
+        {name: snapshot(counts) for name, counts in descriptors.items() if counts[0]},
+    )
+
+
+def reset_stats() -> None:
+    for counts in function_counters.values():
+        counts[:] = counter()
+    descriptor_counters.clear()
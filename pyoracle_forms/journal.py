@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import IO, TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .batch import FileResult
+
+# what batch.map did with every file, one json object a line, appended as the
+# files are done, so a run that died can be started again where it stopped:
+#     batch.map(func, paths, journal="nightly.journal")
+# files done before, that have not changed since, are skipped, and the rest
+# are taken slowest first, as timed before, or estimated from their size
+
+summary_length = 200
+
+
+class Entry(NamedTuple):
+    path: str
+    # sha256 of the file after it was done, None if it can't be read
+    hash: Optional[str]
+    size: int
+    # "done" or "failed"
+    status: str
+    seconds: float
+    # repr of what func returned, or the error
+    summary: str
+
+
+def content_hash(path: str) -> Optional[str]:
+    digest = hashlib.sha256()
+    try:
+        with open(path, mode="rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class Journal:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # the last entry of every file
+        self.entries: Dict[str, Entry] = {}
+        if os.path.exists(path):
+            with open(path, mode="r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = Entry(**json.loads(line))
+                    except (ValueError, TypeError):
+                        # cut short by the run dying while writing it
+                        continue
+                    self.entries[entry.path] = entry
+        self.file: Optional[IO[str]] = None
+
+    def completed(self, path: str) -> bool:
+        entry = self.entries.get(path)
+        return (
+            entry is not None
+            and entry.status == "done"
+            and entry.hash == content_hash(path)
+        )
+
+    def seconds_per_byte(self) -> float:
+        timed = [entry for entry in self.entries.values() if entry.size]
+        size = sum(entry.size for entry in timed)
+        return sum(entry.seconds for entry in timed) / size if size else 0.0
+
+    def schedule(self, paths: Iterable[str]) -> List[str]:
+        # what is left to do, slowest first
+        rate = self.seconds_per_byte()
+        estimates = {}
+        for path in paths:
+            if self.completed(path):
+                continue
+            entry = self.entries.get(path)
+            size = file_size(path)
+            # by size alone as long as nothing was timed
+            estimates[path] = entry.seconds if entry else size * rate or size
+        return sorted(estimates, key=estimates.__getitem__, reverse=True)
+
+    def record(self, result: FileResult) -> Entry:
+        if result.ok:
+            status, summary = "done", repr(result.result)
+        else:
+            status, summary = "failed", result.error or ""
+        entry = Entry(
+            result.path,
+            content_hash(result.path),
+            file_size(result.path),
+            status,
+            result.seconds,
+            summary[:summary_length],
+        )
+        if self.file is None:
+            self.file = open(self.path, mode="a", encoding="utf-8")
+        self.file.write(json.dumps(entry._asdict()) + "\n")
+        self.file.flush()
+        self.entries[entry.path] = entry
+        return entry
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -0,0 +1 @@
+# property metadata per api version, generated by forms_api/api_scraper.py
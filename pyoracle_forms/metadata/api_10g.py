@@ -0,0 +1,1077 @@
+# generated by forms_api/api_scraper.py from parsed_10g.json
+from typing import Dict
+
+object_numbers: Dict[str, int] = {
+    "D2FFO_ALERT": 1,
+    "D2FFO_ANY": 0,
+    "D2FFO_ATT_LIB": 2,
+    "D2FFO_BLOCK": 3,
+    "D2FFO_CANVAS": 4,
+    "D2FFO_COORD": 7,
+    "D2FFO_DAT_SRC_ARG": 8,
+    "D2FFO_DAT_SRC_COL": 9,
+    "D2FFO_EDITOR": 10,
+    "D2FFO_FONT": 11,
+    "D2FFO_FORM_MODULE": 12,
+    "D2FFO_FORM_PARAM": 13,
+    "D2FFO_GRAPHIC": 14,
+    "D2FFO_ITEM": 15,
+    "D2FFO_LIBRARY_MODULE": 17,
+    "D2FFO_LIB_PROG_UNIT": 16,
+    "D2FFO_LOV": 18,
+    "D2FFO_LV_COLMAP": 19,
+    "D2FFO_MENU": 20,
+    "D2FFO_MENU_ITEM": 21,
+    "D2FFO_MENU_MODULE": 22,
+    "D2FFO_OBG_CHILD": 24,
+    "D2FFO_OBJ_GROUP": 23,
+    "D2FFO_OBJ_LIB": 25,
+    "D2FFO_OBJ_LIB_TAB": 26,
+    "D2FFO_POINT": 27,
+    "D2FFO_PROG_UNIT": 28,
+    "D2FFO_PROP_CLASS": 29,
+    "D2FFO_RADIO_BUTTON": 30,
+    "D2FFO_REC_GROUP": 31,
+    "D2FFO_RELATION": 32,
+    "D2FFO_REPORT": 33,
+    "D2FFO_RG_COLSPEC": 34,
+    "D2FFO_TAB_PAGE": 35,
+    "D2FFO_TRIGGER": 37,
+    "D2FFO_VIS_ATTR": 39,
+    "D2FFO_WINDOW": 41,
+}
+
+property_numbers: Dict[str, int] = {
+    "ACCESS_KEY": 148,
+    "ALERT": 3,
+    "ALIAS": 547,
+    "ALLOW_EXPANSION": 313,
+    "ALLOW_MLT_LIN_PRMPTS": 322,
+    "ALLOW_STRT_ATT_PRMPTS": 324,
+    "ALLOW_TOP_ATT_PRMPTS": 323,
+    "ALT_MSG": 9,
+    "ALT_STY": 10,
+    "ARROW_STY": 283,
+    "ASSOC_MNUS": 146,
+    "ATT_LIB": 11,
+    "AUDIO_CHNNLS": 353,
+    "AUTO_COL_WID": 454,
+    "AUTO_DISP": 13,
+    "AUTO_HINT": 277,
+    "AUTO_POS": 453,
+    "AUTO_QRY": 14,
+    "AUTO_RFRSH": 15,
+    "AUTO_SKP": 16,
+    "AUTO_SLCT": 12,
+    "BACK_COLOR": 17,
+    "BEVEL": 19,
+    "BLOCK": 21,
+    "BOUNDING_BX_SCALABLE": 338,
+    "BTM_TTL": 22,
+    "BTN_1_LBL": 5,
+    "BTN_2_LBL": 6,
+    "BTN_3_LBL": 7,
+    "CALC_MODE": 248,
+    "CANVAS": 24,
+    "CAP_STY": 332,
+    "CASE_INSENSITIVE_QRY": 28,
+    "CASE_RSTRCTION": 29,
+    "CHAR_CELL_HGT": 31,
+    "CHAR_CELL_WID": 32,
+    "CHKED_VAL": 33,
+    "CHK_BX_OTHER_VALS": 30,
+    "CLIENT_INFO": 27,
+    "CLIP_HGT": 301,
+    "CLIP_WID": 300,
+    "CLIP_X_POS": 298,
+    "CLIP_Y_POS": 299,
+    "CLOSED": 282,
+    "CLS_ALLOWED": 34,
+    "CMPRSSION_QLTY": 145,
+    "CMPTXT": 344,
+    "CNV_NAM": 25,
+    "CNV_OBJ": 26,
+    "CNV_TYP": 35,
+    "COLUMN_VALUE": 570,
+    "COL_DAT_TYP": 37,
+    "COL_MAP": 38,
+    "COL_NAM": 251,
+    "COL_SPEC": 40,
+    "COL_VALS_COUNT": 471,
+    "COMMENT": 43,
+    "COMM_MODE": 359,
+    "COMPRESS": 354,
+    "COM_TXT": 41,
+    "COM_TYP": 42,
+    "CONCEAL_DATA": 222,
+    "CONSOLE_WIN": 45,
+    "COORD_SYS": 47,
+    "COPY_VAL_FROM_ITM": 107,
+    "CORNER_RADIUS_X": 284,
+    "CORNER_RADIUS_Y": 285,
+    "CRSR_MODE": 48,
+    "CSTM_SPCING": 335,
+    "DASH_STY": 331,
+    "DATA_LEN_SEMANTICS": 573,
+    "DAT_SRC_BLK": 360,
+    "DAT_SRC_X_AXS": 361,
+    "DAT_SRC_Y_AXS": 362,
+    "DAT_TYP": 108,
+    "DB_BLK": 377,
+    "DB_ITM": 18,
+    "DEFERRED": 49,
+    "DEL_ALLOWED": 50,
+    "DEL_DAT_SRC_ARG": 515,
+    "DEL_DAT_SRC_COL": 514,
+    "DEL_PROC_NAM": 425,
+    "DEL_REC": 51,
+    "DETAIL_BLK": 53,
+    "DETAIL_ITEMREF": 544,
+    "DFLT_ALT_BTN": 8,
+    "DFLT_BTN": 54,
+    "DFLT_FNT_SCALING": 56,
+    "DIRTY_INFO": 564,
+    "DISP_IN_KBRD_HLP": 223,
+    "DISP_NO_PRIV": 59,
+    "DISP_QLTY": 189,
+    "DISP_VIEWPORT": 60,
+    "DISP_WID": 61,
+    "DIST_BTWN_RECS": 198,
+    "DITHER": 297,
+    "DML_ARY_SIZ": 381,
+    "DML_DAT_NAM": 370,
+    "DML_DAT_TYP": 380,
+    "DML_RET_VAL": 559,
+    "DSA_MODE": 351,
+    "DSA_NAM": 374,
+    "DSA_TYP": 375,
+    "DSA_TYP_NAM": 447,
+    "DSA_VAL": 376,
+    "DSC_LEN": 433,
+    "DSC_MANDATORY": 434,
+    "DSC_NAM": 372,
+    "DSC_NOCHILDREN": 549,
+    "DSC_PARENT_NAME": 546,
+    "DSC_PRECISION": 435,
+    "DSC_SCALE": 436,
+    "DSC_TYP": 373,
+    "DSC_TYPE_NAME": 545,
+    "EDGE_BACK_COLOR": 329,
+    "EDGE_FORE_COLOR": 328,
+    "EDGE_PAT": 330,
+    "EDITOR": 64,
+    "EDT_NAM": 65,
+    "EDT_OBJ": 66,
+    "EDT_X_POS": 67,
+    "EDT_Y_POS": 68,
+    "ENABLED": 69,
+    "ENFRC_COL_SECURITY": 39,
+    "ENFRC_PRMRY_KEY": 265,
+    "EXEC_HIERARCHY": 70,
+    "EXEC_MODE": 93,
+    "FILL_PAT": 73,
+    "FIRE_IN_QRY": 74,
+    "FIXED_BOUNDING_BX": 336,
+    "FIXED_LEN": 77,
+    "FLNAM": 92,
+    "FLTR_BEFORE_DISP": 125,
+    "FMT_MSK": 88,
+    "FONT_NAM": 82,
+    "FONT_SCALEABLE": 339,
+    "FONT_SIZ": 83,
+    "FONT_SPCING": 86,
+    "FONT_STY": 84,
+    "FONT_WGHT": 85,
+    "FORE_COLOR": 87,
+    "FORMULA": 346,
+    "FORM_PARAM": 89,
+    "FRAME_ALIGN": 309,
+    "FRAME_TTL": 307,
+    "FRAME_TTL_ALIGN": 304,
+    "FRAME_TTL_BACK_COLOR": 459,
+    "FRAME_TTL_FILL_PAT": 460,
+    "FRAME_TTL_FONT_NAM": 461,
+    "FRAME_TTL_FONT_SIZ": 462,
+    "FRAME_TTL_FONT_SPCING": 465,
+    "FRAME_TTL_FONT_STY": 463,
+    "FRAME_TTL_FONT_WGHT": 464,
+    "FRAME_TTL_FORE_COLOR": 458,
+    "FRAME_TTL_OFST": 305,
+    "FRAME_TTL_SPCING": 306,
+    "FRAME_TTL_VAT_NAM": 457,
+    "FRAME_TTL_VAT_OBJ": 456,
+    "FRST_NAVIGATION_BLK_NAM": 75,
+    "FRST_NAVIGATION_BLK_OBJ": 76,
+    "GRAPHIC": 23,
+    "GRAPHICS_TYP": 281,
+    "GRA_FONT_COLOR": 568,
+    "GRA_FONT_COLOR_CODE": 569,
+    "GRA_FONT_NAM": 493,
+    "GRA_FONT_SIZ": 494,
+    "GRA_FONT_SPCING": 536,
+    "GRA_FONT_STY": 495,
+    "GRA_FONT_WGHT": 535,
+    "GRA_TEXT": 496,
+    "HEIGHT": 94,
+    "HELP_BOOK_TITLE": 550,
+    "HELP_BOOK_TOPIC": 551,
+    "HIDE": 213,
+    "HIDE_ON_EXIT": 207,
+    "HIGHEST_ALLOWED_VAL": 95,
+    "HINT": 96,
+    "HORZ_JST": 342,
+    "HORZ_MARGN": 314,
+    "HORZ_OBJ_OFST": 317,
+    "HORZ_ORGN": 340,
+    "HORZ_TLBR_CNV": 139,
+    "HTB_CNV_NAME": 98,
+    "ICONIC": 99,
+    "ICON_FLNAM": 101,
+    "ICON_IN_MNU": 452,
+    "IMG_DPTH": 46,
+    "IMG_FMT": 44,
+    "IMPL_CLASS": 558,
+    "INCLUDE_REFITEM": 548,
+    "INHRT_MNU": 103,
+    "INIT_KBRD_DIR": 55,
+    "INIT_MNU": 81,
+    "INIT_VAL": 109,
+    "INSRT_ALLOWED": 104,
+    "INSRT_PROC_NAM": 419,
+    "INS_DAT_SRC_ARG": 511,
+    "INS_DAT_SRC_COL": 510,
+    "INTERACTION_MODE": 467,
+    "INTERNAL_END_ANGLE": 287,
+    "INTERNAL_LIN_WID": 326,
+    "INTERNAL_ROTATION_ANGLE": 327,
+    "INTERNAL_STRT_ANGLE": 286,
+    "ISOLATION_MODE": 470,
+    "ITEM": 105,
+    "ITMS_DISP": 349,
+    "ITM_TYP": 106,
+    "JOIN_COND": 115,
+    "JOIN_STY": 333,
+    "JUSTIFICATION": 4,
+    "KBRD_ACC": 2,
+    "KBRD_HLP_TXT": 233,
+    "KBRD_NAVIGABLE": 156,
+    "KBRD_STATE": 488,
+    "KEEP_CRSR_POS": 116,
+    "KEY_MODE": 117,
+    "LABEL": 118,
+    "LANG_DIR": 57,
+    "LAYOUT_DATA_BLK_NAM": 439,
+    "LAYOUT_STY": 308,
+    "LIB_LOC": 120,
+    "LIB_PROG_UNIT": 567,
+    "LIB_SRC": 121,
+    "LIN_SPCING": 334,
+    "LOCK_DAT_SRC_ARG": 517,
+    "LOCK_DAT_SRC_COL": 516,
+    "LOCK_MODE": 123,
+    "LOCK_PROC_NAM": 428,
+    "LOCK_REC": 124,
+    "LOV": 126,
+    "LOV_NAM": 127,
+    "LOV_OBJ": 128,
+    "LOV_X_POS": 131,
+    "LOV_Y_POS": 132,
+    "LOWEST_ALLOWED_VAL": 133,
+    "LST_ELEMENT_COUNT": 474,
+    "LST_STY": 134,
+    "LST_TYP": 129,
+    "MAGIC_ITM": 135,
+    "MAIN_MNU": 136,
+    "MAXIMIZE_ALLOWED": 275,
+    "MAX_LEN": 137,
+    "MAX_OBJS": 312,
+    "MAX_QRY_TIME": 468,
+    "MAX_RECS_FETCHED": 469,
+    "MENU": 138,
+    "MINIMIZE_ALLOWED": 100,
+    "MINIMIZE_TTL": 102,
+    "MLT_LIN": 153,
+    "MNU_DRCTRY": 141,
+    "MNU_FLNAM": 142,
+    "MNU_ITM": 143,
+    "MNU_ITM_CODE": 507,
+    "MNU_ITM_RAD_GRP": 147,
+    "MNU_ITM_TYP": 144,
+    "MNU_MOD": 79,
+    "MNU_ROLE": 80,
+    "MODAL": 149,
+    "MODULE": 440,
+    "MOUSE_NAVIGATE": 151,
+    "MOUSE_NAVIGATION_LMT": 150,
+    "MV_ALLOWED": 152,
+    "NAME": 154,
+    "NAVIGATION_STY": 157,
+    "NEWDEFER_REQ_ENF": 572,
+    "NEXT": 159,
+    "NXT_NAVIGATION_BLK_NAM": 160,
+    "NXT_NAVIGATION_BLK_OBJ": 161,
+    "NXT_NAVIGATION_ITM_NAM": 162,
+    "NXT_NAVIGATION_ITM_OBJ": 163,
+    "OBJ_COUNT": 502,
+    "OBJ_GRP": 164,
+    "OBJ_GRP_CHILD_REAL_OBJ": 472,
+    "OBJ_GRP_TYP": 533,
+    "OBJ_LIB_TAB": 418,
+    "OG_CHILD": 165,
+    "OLD_LOV_TXT": 166,
+    "OLE_ACT_STY": 167,
+    "OLE_CLASS": 168,
+    "OLE_INSD_OUT_SUPPORT": 169,
+    "OLE_IN_PLACE_ACT": 170,
+    "OLE_POPUP_MNU_ITMS": 276,
+    "OLE_RESIZ_STY": 171,
+    "OLE_SHOW_POPUP_MNU": 172,
+    "OLE_SHOW_TNNT_TYP": 278,
+    "OLE_TNNT_ASPCT": 173,
+    "OLE_TNNT_TYP": 174,
+    "OPT_HINT": 175,
+    "ORDR_BY_CLAUSE": 176,
+    "OTHER_VALS": 177,
+    "OWNER": 296,
+    "PARAM_DAT_TYP": 90,
+    "PARAM_INIT_VAL": 91,
+    "PAR_FLNAM": 500,
+    "PAR_FLPATH": 501,
+    "PAR_MODTYP": 498,
+    "PAR_MODULE": 497,
+    "PAR_NAM": 499,
+    "PAR_SL1OBJ_NAM": 537,
+    "PAR_SL1OBJ_TYP": 538,
+    "PAR_SL2OBJ_NAM": 539,
+    "PAR_SL2OBJ_TYP": 540,
+    "PAR_TYP": 541,
+    "PERSIST_CLIENT_INFO": 560,
+    "PERSIST_CLT_INF_LEN": 561,
+    "PGU_TXT": 451,
+    "PGU_TYP": 504,
+    "POINT": 302,
+    "POPUP_MNU_NAM": 366,
+    "POPUP_MNU_OBJ": 367,
+    "POPUP_VA_OBJ": 383,
+    "PRECOMP_SUMM": 475,
+    "PREVIOUS": 291,
+    "PREV_NAVIGATION_BLK_NAM": 182,
+    "PREV_NAVIGATION_BLK_OBJ": 183,
+    "PREV_NAVIGATION_ITM_NAM": 184,
+    "PREV_NAVIGATION_ITM_OBJ": 185,
+    "PRMPT": 288,
+    "PRMPT_ALIGN": 294,
+    "PRMPT_ALIGN_OFST": 295,
+    "PRMPT_ATT_EDGE": 292,
+    "PRMPT_ATT_OFST": 293,
+    "PRMPT_BACK_COLOR": 119,
+    "PRMPT_DISP_STY": 252,
+    "PRMPT_FILL_PAT": 155,
+    "PRMPT_FONT_NAM": 214,
+    "PRMPT_FONT_SIZ": 231,
+    "PRMPT_FONT_SPCING": 250,
+    "PRMPT_FONT_STY": 247,
+    "PRMPT_FONT_WGHT": 249,
+    "PRMPT_FORE_COLOR": 52,
+    "PRMPT_JST": 290,
+    "PRMPT_READING_ORDR": 289,
+    "PRMPT_VAT_NAM": 438,
+    "PRMPT_VAT_OBJ": 437,
+    "PRMRY_CNV": 271,
+    "PRMRY_KEY": 178,
+    "PROG_UNIT": 179,
+    "PROP_CLASS": 180,
+    "PRVNT_MSTRLESS_OPS": 181,
+    "QRY_ALLOWED": 186,
+    "QRY_ALL_RECS": 379,
+    "QRY_DAT_SRC_ARG": 509,
+    "QRY_DAT_SRC_COL": 508,
+    "QRY_DAT_SRC_NAM": 371,
+    "QRY_DAT_SRC_TYP": 378,
+    "QRY_LEN": 187,
+    "QRY_ONLY": 188,
+    "QUERY_NAME": 365,
+    "RAD_BUT": 190,
+    "RAISE_ON_ENT": 191,
+    "RDB_VAL": 192,
+    "READING_ORDR": 193,
+    "REAL_UNIT": 194,
+    "RECS_BUFFERED_COUNT": 195,
+    "RECS_DISP_COUNT": 196,
+    "RECS_FETCHED_COUNT": 197,
+    "REC_GRP": 199,
+    "REC_GRP_FETCH_SIZ": 455,
+    "REC_GRP_NAM": 200,
+    "REC_GRP_OBJ": 201,
+    "REC_GRP_QRY": 202,
+    "REC_GRP_TYP": 203,
+    "REC_ORNT": 204,
+    "REC_VAT_GRP_NAM": 205,
+    "REC_VAT_GRP_OBJ": 280,
+    "REL": 206,
+    "REL_TYPE": 543,
+    "RENDERED": 208,
+    "REPORT": 473,
+    "REQUIRED": 209,
+    "RESIZE_ALLOWED": 78,
+    "REV_DIR": 211,
+    "ROLE_COUNT": 503,
+    "RPT_DESTINATION_FMT": 478,
+    "RPT_DESTINATION_NAM": 477,
+    "RPT_DESTINATION_TYP": 476,
+    "RPT_PARAMS": 480,
+    "RPT_SRVR": 479,
+    "RTRN_ITM": 210,
+    "RUNTIME_COMP": 532,
+    "SCRLBR_ALIGN": 491,
+    "SCRLBR_CNV_NAM": 216,
+    "SCRLBR_CNV_OBJ": 350,
+    "SCRLBR_LEN": 542,
+    "SCRLBR_ORNT": 217,
+    "SCRLBR_TBP_NAM": 442,
+    "SCRLBR_TBP_OBJ": 443,
+    "SCRLBR_WID": 218,
+    "SCRLBR_X_POS": 219,
+    "SCRLBR_Y_POS": 220,
+    "SHARE_LIB": 487,
+    "SHOW_FAST_FWD": 484,
+    "SHOW_HORZ_SCRLBR": 97,
+    "SHOW_PLAY": 481,
+    "SHOW_REC": 482,
+    "SHOW_REWIND": 483,
+    "SHOW_SCRLBR": 221,
+    "SHOW_SLIDER": 489,
+    "SHOW_TIME": 486,
+    "SHOW_VERT_SCRLBR": 253,
+    "SHOW_VOLUME": 485,
+    "SHRINKWRAP": 492,
+    "SIZING_STY": 224,
+    "SND_FMT": 352,
+    "SND_QLTY": 355,
+    "SNGL_OBJ_ALIGN": 310,
+    "SNGL_REC": 431,
+    "SOURCE": 441,
+    "STRTUP_CODE": 225,
+    "STRT_PRMPT_ALIGN": 320,
+    "STRT_PRMPT_OFST": 318,
+    "SUBCL_OBJGRP": 566,
+    "SUBCL_SUBOBJ": 565,
+    "SUB_MNU_NAM": 505,
+    "SUB_MNU_OBJ": 506,
+    "SUB_TTL": 226,
+    "SUMM_BLK_NAM": 490,
+    "SUMM_FUNC": 347,
+    "SUMM_ITM_NAM": 348,
+    "SVPNT_MODE": 215,
+    "SYNC_ITM_NAM": 36,
+    "SYNC_ITM_OBJ": 20,
+    "TAB_ACT_STY": 562,
+    "TAB_ATT_EDGE": 446,
+    "TAB_PAGE": 356,
+    "TAB_STY": 466,
+    "TAB_WID_STY": 563,
+    "TBP_NAM": 357,
+    "TBP_OBJ": 358,
+    "TEAR_OFF_MNU": 229,
+    "TITLE": 230,
+    "TOOLTIP": 279,
+    "TOOLTIP_VAT_GRP": 382,
+    "TOP_PRMPT_ALIGN": 321,
+    "TOP_PRMPT_OFST": 319,
+    "TRE_ALLW_EMP_BRANCH": 552,
+    "TRE_DATA_QRY": 557,
+    "TRE_MULTI_SELECT": 553,
+    "TRE_REC_GRP": 556,
+    "TRE_SHOW_LINES": 554,
+    "TRE_SHOW_SYMBOL": 555,
+    "TRG_INTERNAL_TYP": 432,
+    "TRG_STY": 236,
+    "TRG_TXT": 237,
+    "TRIGGER": 232,
+    "TRIG_STEP": 234,
+    "TTL_READING_ORDR": 303,
+    "UNCHKED_VAL": 238,
+    "UPDT_ALLOWED": 239,
+    "UPDT_CHANGED_COLS": 240,
+    "UPDT_COMMIT": 363,
+    "UPDT_IF_NULL": 241,
+    "UPDT_LAYOUT": 325,
+    "UPDT_PROC_NAM": 422,
+    "UPDT_QRY": 364,
+    "UPD_DAT_SRC_ARG": 513,
+    "UPD_DAT_SRC_COL": 512,
+    "USE_3D_CNTRLS": 242,
+    "USE_SECURITY": 243,
+    "VALIDATE_FROM_LST": 130,
+    "VALIDATION_UNIT": 260,
+    "VAT_NAM": 245,
+    "VAT_OBJ": 246,
+    "VAT_TYP": 450,
+    "VERT_FILL": 311,
+    "VERT_JST": 343,
+    "VERT_MARGN": 315,
+    "VERT_OBJ_OFST": 316,
+    "VERT_ORGN": 341,
+    "VERT_TLBR_CNV": 140,
+    "VISIBLE": 58,
+    "VIS_ATTR": 258,
+    "VIS_STATE": 259,
+    "VPRT_HGT": 254,
+    "VPRT_WID": 255,
+    "VPRT_X_POS": 62,
+    "VPRT_X_POS_ON_CNV": 256,
+    "VPRT_Y_POS": 63,
+    "VPRT_Y_POS_ON_CNV": 257,
+    "VSBL_IN_HORZ_MNU_TLBR": 445,
+    "VSBL_IN_MENU": 448,
+    "VSBL_IN_VERT_MNU_TLBR": 444,
+    "VTB_CNV_NAME": 261,
+    "WHERE_CLAUSE": 262,
+    "WIDTH": 263,
+    "WINDOW": 264,
+    "WIN_STY": 270,
+    "WND_NAM": 268,
+    "WND_OBJ": 269,
+    "WRAP_STY": 272,
+    "WRAP_TXT": 337,
+    "X_POS": 273,
+    "Y_POS": 274,
+}
+
+# data types of the properties, by property number
+property_types: Dict[int, str] = {
+    2: "text",
+    3: "obj",
+    4: "num",
+    5: "text",
+    6: "text",
+    7: "text",
+    8: "num",
+    9: "text",
+    10: "num",
+    11: "obj",
+    12: "bool",
+    13: "bool",
+    14: "bool",
+    15: "bool",
+    16: "bool",
+    17: "text",
+    18: "bool",
+    19: "num",
+    20: "obj",
+    21: "obj",
+    22: "text",
+    23: "obj",
+    24: "obj",
+    25: "text",
+    26: "obj",
+    27: "blob",
+    28: "bool",
+    29: "num",
+    30: "num",
+    31: "num",
+    32: "num",
+    33: "text",
+    34: "bool",
+    35: "num",
+    36: "text",
+    37: "num",
+    38: "obj",
+    39: "bool",
+    40: "obj",
+    41: "text",
+    42: "num",
+    43: "text",
+    44: "num",
+    45: "text",
+    46: "num",
+    47: "num",
+    48: "num",
+    49: "bool",
+    50: "bool",
+    51: "num",
+    52: "text",
+    53: "text",
+    54: "bool",
+    55: "num",
+    56: "bool",
+    57: "num",
+    58: "bool",
+    59: "bool",
+    60: "bool",
+    61: "num",
+    62: "num",
+    63: "num",
+    64: "obj",
+    65: "text",
+    66: "obj",
+    67: "num",
+    68: "num",
+    69: "bool",
+    70: "num",
+    73: "text",
+    74: "bool",
+    75: "text",
+    76: "obj",
+    77: "bool",
+    78: "bool",
+    79: "text",
+    80: "text",
+    81: "text",
+    82: "text",
+    83: "num",
+    84: "num",
+    85: "num",
+    86: "num",
+    87: "text",
+    88: "text",
+    89: "obj",
+    90: "num",
+    91: "text",
+    92: "text",
+    93: "num",
+    94: "num",
+    95: "text",
+    96: "text",
+    97: "bool",
+    98: "text",
+    99: "bool",
+    100: "bool",
+    101: "text",
+    102: "text",
+    103: "bool",
+    104: "bool",
+    105: "obj",
+    106: "num",
+    107: "text",
+    108: "num",
+    109: "text",
+    115: "text",
+    116: "bool",
+    117: "num",
+    118: "text",
+    119: "text",
+    120: "text",
+    121: "num",
+    123: "num",
+    124: "bool",
+    125: "bool",
+    126: "obj",
+    127: "text",
+    128: "obj",
+    129: "num",
+    130: "bool",
+    131: "num",
+    132: "num",
+    133: "text",
+    134: "num",
+    135: "num",
+    136: "text",
+    137: "num",
+    138: "obj",
+    139: "text",
+    140: "text",
+    141: "text",
+    142: "text",
+    143: "obj",
+    144: "num",
+    145: "num",
+    146: "obj",
+    147: "text",
+    148: "text",
+    149: "bool",
+    150: "num",
+    151: "bool",
+    152: "bool",
+    153: "bool",
+    154: "text",
+    155: "text",
+    156: "bool",
+    157: "num",
+    159: "obj",
+    160: "text",
+    161: "obj",
+    162: "text",
+    163: "obj",
+    164: "obj",
+    165: "obj",
+    166: "text",
+    167: "num",
+    168: "text",
+    169: "bool",
+    170: "bool",
+    171: "num",
+    172: "bool",
+    173: "num",
+    174: "num",
+    175: "text",
+    176: "text",
+    177: "text",
+    178: "bool",
+    179: "obj",
+    180: "obj",
+    181: "bool",
+    182: "text",
+    183: "obj",
+    184: "text",
+    185: "obj",
+    186: "bool",
+    187: "num",
+    188: "bool",
+    189: "num",
+    190: "obj",
+    191: "bool",
+    192: "text",
+    193: "num",
+    194: "num",
+    195: "num",
+    196: "num",
+    197: "num",
+    198: "num",
+    199: "obj",
+    200: "text",
+    201: "obj",
+    202: "text",
+    203: "num",
+    204: "num",
+    205: "text",
+    206: "obj",
+    207: "bool",
+    208: "bool",
+    209: "bool",
+    210: "text",
+    211: "bool",
+    213: "bool",
+    214: "text",
+    215: "bool",
+    216: "text",
+    217: "num",
+    218: "num",
+    219: "num",
+    220: "num",
+    221: "bool",
+    222: "bool",
+    223: "bool",
+    224: "num",
+    225: "text",
+    226: "text",
+    229: "bool",
+    230: "text",
+    231: "num",
+    232: "obj",
+    233: "text",
+    234: "obj",
+    236: "num",
+    237: "text",
+    238: "text",
+    239: "bool",
+    240: "bool",
+    241: "bool",
+    242: "bool",
+    243: "bool",
+    245: "text",
+    246: "obj",
+    247: "num",
+    248: "num",
+    249: "num",
+    250: "num",
+    251: "text",
+    252: "num",
+    253: "bool",
+    254: "num",
+    255: "num",
+    256: "num",
+    257: "num",
+    258: "obj",
+    259: "obj",
+    260: "num",
+    261: "text",
+    262: "text",
+    263: "num",
+    264: "obj",
+    265: "bool",
+    268: "text",
+    269: "obj",
+    270: "num",
+    271: "text",
+    272: "num",
+    273: "num",
+    274: "num",
+    275: "bool",
+    276: "num",
+    277: "bool",
+    278: "bool",
+    279: "text",
+    280: "obj",
+    281: "num",
+    282: "bool",
+    283: "num",
+    284: "num",
+    285: "num",
+    286: "num",
+    287: "num",
+    288: "text",
+    289: "num",
+    290: "num",
+    291: "obj",
+    292: "num",
+    293: "num",
+    294: "num",
+    295: "num",
+    296: "obj",
+    297: "bool",
+    298: "num",
+    299: "num",
+    300: "num",
+    301: "num",
+    302: "obj",
+    303: "num",
+    304: "num",
+    305: "num",
+    306: "num",
+    307: "text",
+    308: "num",
+    309: "num",
+    310: "num",
+    311: "bool",
+    312: "num",
+    313: "bool",
+    314: "num",
+    315: "num",
+    316: "num",
+    317: "num",
+    318: "num",
+    319: "num",
+    320: "num",
+    321: "num",
+    322: "bool",
+    323: "bool",
+    324: "bool",
+    325: "num",
+    326: "num",
+    327: "num",
+    328: "text",
+    329: "text",
+    330: "text",
+    331: "num",
+    332: "num",
+    333: "num",
+    334: "num",
+    335: "num",
+    336: "bool",
+    337: "bool",
+    338: "bool",
+    339: "bool",
+    340: "num",
+    341: "num",
+    342: "num",
+    343: "num",
+    344: "obj",
+    346: "text",
+    347: "num",
+    348: "text",
+    349: "num",
+    350: "obj",
+    351: "num",
+    352: "num",
+    353: "num",
+    354: "num",
+    355: "num",
+    356: "obj",
+    357: "text",
+    358: "obj",
+    359: "num",
+    360: "text",
+    361: "text",
+    362: "text",
+    363: "bool",
+    364: "bool",
+    365: "text",
+    366: "text",
+    367: "obj",
+    370: "text",
+    371: "text",
+    372: "text",
+    373: "num",
+    374: "text",
+    375: "num",
+    376: "text",
+    377: "bool",
+    378: "num",
+    379: "bool",
+    380: "num",
+    381: "num",
+    382: "text",
+    383: "obj",
+    418: "obj",
+    419: "text",
+    422: "text",
+    425: "text",
+    428: "text",
+    431: "bool",
+    432: "num",
+    433: "num",
+    434: "bool",
+    435: "num",
+    436: "num",
+    437: "obj",
+    438: "text",
+    439: "text",
+    440: "obj",
+    441: "obj",
+    442: "text",
+    443: "obj",
+    444: "bool",
+    445: "bool",
+    446: "num",
+    447: "text",
+    448: "bool",
+    450: "num",
+    451: "text",
+    452: "bool",
+    453: "bool",
+    454: "bool",
+    455: "num",
+    456: "obj",
+    457: "text",
+    458: "text",
+    459: "text",
+    460: "text",
+    461: "text",
+    462: "num",
+    463: "num",
+    464: "num",
+    465: "num",
+    466: "num",
+    467: "num",
+    468: "num",
+    469: "num",
+    470: "num",
+    471: "num",
+    472: "obj",
+    473: "obj",
+    474: "num",
+    475: "bool",
+    476: "num",
+    477: "text",
+    478: "text",
+    479: "text",
+    480: "text",
+    481: "bool",
+    482: "bool",
+    483: "bool",
+    484: "bool",
+    485: "bool",
+    486: "bool",
+    487: "bool",
+    488: "num",
+    489: "bool",
+    490: "text",
+    491: "num",
+    492: "bool",
+    493: "text",
+    494: "num",
+    495: "num",
+    496: "text",
+    497: "text",
+    498: "num",
+    499: "text",
+    500: "text",
+    501: "text",
+    502: "num",
+    503: "num",
+    504: "num",
+    505: "text",
+    506: "obj",
+    507: "text",
+    508: "obj",
+    509: "obj",
+    510: "obj",
+    511: "obj",
+    512: "obj",
+    513: "obj",
+    514: "obj",
+    515: "obj",
+    516: "obj",
+    517: "obj",
+    532: "num",
+    533: "num",
+    535: "num",
+    536: "num",
+    537: "text",
+    538: "num",
+    539: "text",
+    540: "num",
+    541: "num",
+    542: "num",
+    543: "num",
+    544: "text",
+    545: "text",
+    546: "text",
+    547: "text",
+    548: "bool",
+    549: "bool",
+    550: "text",
+    551: "text",
+    552: "bool",
+    553: "bool",
+    554: "bool",
+    555: "bool",
+    556: "text",
+    557: "text",
+    558: "text",
+    559: "bool",
+    560: "blob",
+    561: "num",
+    562: "num",
+    563: "num",
+    564: "bool",
+    565: "bool",
+    566: "bool",
+    567: "obj",
+    568: "text",
+    569: "num",
+    570: "obj",
+    572: "num",
+    573: "num",
+}
+
+# bitsets of the property numbers every object type has, by object number
+supported_properties: Dict[int, int] = {
+    1: 0x53000020000000003E000000000000030000000000000000000000000000000000010800000000006000400000000000000000840000000000000000FC020002000800080207E0,
+    2: 0x300000000000000000000000000000000000000000000000000000000000000000008000000000000000000000000000000008400000003000000000000000000080008000000,
+    3: 0x5380186000003FF03E0000083000000F009248000000003E0C0000400000000000010801000240006181003F08703804C18003A400000008200300008002000204088008020000,
+    4: 0x5F008020000000003E00000004000043000000000000000000C01000000000000001080000308BE06000000000000080000000840000000000000240FC0200D6000808088A0000,
+    7: 0x4000000000000000000000000000000000100800180000000,
+    8: 0x230000000000000000000000000000800000000000000001C000008000000000000008000000000000000000000000000000008000000000000000000000000000000008000000,
+    9: 0x230026000000000000000000000000001E000000000000003000000000000000000008000000000000000000000000000000008000000000000000000000000000000008000000,
+    10: 0x53000020000000003E000000000000030000000000000000000000000000000000010800070080206000400000000000000000840000000000000240FC02000000080008420000,
+    11: 0x7C00000000000000000000,
+    12: 0x1013004020100000003E00000278000000000000000000000000000000000000000000080100011400040140008020800018001084401C0040000000020398010201280009200808,
+    13: 0x53000020000000003E00000000000003000000000000000000000000000000000001080000000000000000000000000000000084000000000000000C0000000000080008000000,
+    14: 0x333000021800000003FF8000003FF0003800000000000000000006001FFFFFFFFFFFF08FE06008000600000240000502000000084000000000000004080020002005000088A0000,
+    15: 0x20336F8026000000003E077E040000000360000000000000C000FFEF3C000000000001FF01F700803FE2C181404323427F067F8C9E92027D90D03D2BF1FC223E06D058127E1F0010,
+    16: 0x1000000000000080000000000000000000000000000000000000000000000000000000000000000000000008400000000000000000000000000000000000000,
+    17: 0x8000000000000000000000000000000000000000000000000000000000000000000008000000000000000000000000000000008000000003000000000000000000000000000800,
+    18: 0x53000020000000003E000000000060030000000000000000000000000000000000010800060080006000400000030000000040840000022000000040FC0200020008400803B000,
+    19: 0x1300000000000000000000000000000000000000000000000000000000000000000008000000000000004000040000000000008400000000000000000000002000000008000000,
+    20: 0x53000020000000003E0000000000000300000000000000000000000000000000000108000000000000006400000000000000008400800000000000000000000000080008400000,
+    21: 0x330000260000000EBE0000000000113300000000000000000000000000000000000108000000000060000000000000000000008409008000400021007C00200C000E0008000004,
+    22: 0x1300002000000000BE0080000000000000000000000000000000000000000000000008000000040008000200000000001800108400650000000000000000000000080008000800,
+    23: 0x13000020200000003E0000000000000300000000000000000000000000000000000108000000000000000000000000000000208400000000000000000000000000080008000000,
+    24: 0x3300000000000000000000010000000200000000000000000000000000000000000008000000000000000000000000000000008400000000000000000000000000000008000000,
+    25: 0x1300000000000000400000000000000000000400000000000000000000000000000008000000000000000000000000000000008400000000000000000000000000080008000000,
+    26: 0x1300000000000000400000000000000000000000000000000000000000000000000008000000000000000000000000000000008400000000400000000000000000080008000000,
+    27: 0x3000000000000000000000000000000000000000000000000000000000000000000008000600000000000000000000000000008400000000000000000000000000000000000000,
+    28: 0x43000020000000013E0000000000080300000000000000000000000000000000000108000000000000000000000000000000008400000000000000000000000000080008000000,
+    29: 0x53000020000000003E0000000000000300000000000000000000000000000000000108000000000000010000000000000000008400000000000000000000000000080008000000,
+    30: 0x3300003E000000003E00000000000003600000000000000000000000000000000001FF0006008016E0008000400041000000008C10000000C0000040FC02200410080008020000,
+    31: 0x53000020000000003E0000000000800300000000000000000000000000000000000108000000000000000000000C00000000008400000000000000000000000000090008000000,
+    32: 0x330001800000000000000000000000030000000000000000000000000000000000010800000000000000000000000000200000840000000008000000000000002A080008004000,
+    33: 0x53000020000000003E0001F00000000300000000000000000021800000000000000108000000000000000000000000000000008400000000000000300000000000080008000000,
+    34: 0x241300000000000000000000008000000000000000000000000000000000000000000008000000000000000000000000000000008400020000000000000000000000002008000000,
+    35: 0x33000026000000003E0000000000000300000000000000000000000000000000000108000000000020000000000000000000008400000000400000008002200400080008820000,
+    37: 0x7300003E000000003E0000000000000301000000000000000000000000000000000108000000000000360080200000000000008400000000000000000004400000080008000000,
+    39: 0x53000020000000003E00000003FC040300000000000000000000000000000000000108000000000680008000400000000000008C0000000080000000FC02000010080008020000,
+    41: 0x53008020000000003E0000000000000300000000000000000000000000000000000108000EC0A020600040000080000000000085200000000000F640FC420002000804080A0000,
+}
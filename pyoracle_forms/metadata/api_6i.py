@@ -0,0 +1,1093 @@
+# generated by forms_api/api_scraper.py from parsed_6i.json
+from typing import Dict
+
+object_numbers: Dict[str, int] = {
+    "D2FFO_ALERT": 1,
+    "D2FFO_ANY": 0,
+    "D2FFO_ATT_LIB": 2,
+    "D2FFO_BLOCK": 3,
+    "D2FFO_CANVAS": 4,
+    "D2FFO_COORD": 5,
+    "D2FFO_DAT_SRC_ARG": 6,
+    "D2FFO_DAT_SRC_COL": 7,
+    "D2FFO_EDITOR": 8,
+    "D2FFO_FONT": 9,
+    "D2FFO_FORM_MODULE": 10,
+    "D2FFO_FORM_PARAM": 11,
+    "D2FFO_GRAPHIC": 12,
+    "D2FFO_ITEM": 13,
+    "D2FFO_LIBRARY_MODULE": 14,
+    "D2FFO_LIB_PROG_UNIT": 36,
+    "D2FFO_LOV": 15,
+    "D2FFO_LV_COLMAP": 16,
+    "D2FFO_MENU": 17,
+    "D2FFO_MENU_ITEM": 18,
+    "D2FFO_MENU_MODULE": 19,
+    "D2FFO_MENU_PARAM": 20,
+    "D2FFO_OBG_CHILD": 22,
+    "D2FFO_OBJ_GROUP": 21,
+    "D2FFO_OBJ_LIB": 23,
+    "D2FFO_OBJ_LIB_TAB": 24,
+    "D2FFO_POINT": 39,
+    "D2FFO_PROG_UNIT": 25,
+    "D2FFO_PROP_CLASS": 26,
+    "D2FFO_RADIO_BUTTON": 27,
+    "D2FFO_REC_GROUP": 28,
+    "D2FFO_RELATION": 29,
+    "D2FFO_REPORT": 30,
+    "D2FFO_RG_COLSPEC": 31,
+    "D2FFO_TAB_PAGE": 32,
+    "D2FFO_TRIGGER": 33,
+    "D2FFO_VIS_ATTR": 34,
+    "D2FFO_WINDOW": 35,
+}
+
+property_numbers: Dict[str, int] = {
+    "ACCESS_KEY": 1,
+    "ALERT": 3,
+    "ALIAS": 4,
+    "ALLOW_EXPANSION": 5,
+    "ALLOW_MLT_LIN_PRMPTS": 6,
+    "ALLOW_STRT_ATT_PRMPTS": 7,
+    "ALLOW_TOP_ATT_PRMPTS": 8,
+    "ALT_MSG": 9,
+    "ALT_STY": 11,
+    "ARROW_STY": 12,
+    "ASSOC_MENUS_COUNT": 13,
+    "ASSOC_MNUS": 14,
+    "ATT_LIB": 15,
+    "AUDIO_CHNNLS": 16,
+    "AUTO_COL_WID": 17,
+    "AUTO_DISP": 18,
+    "AUTO_HINT": 19,
+    "AUTO_POS": 20,
+    "AUTO_QRY": 21,
+    "AUTO_RFRSH": 22,
+    "AUTO_SKP": 23,
+    "AUTO_SLCT": 24,
+    "BACK_COLOR": 25,
+    "BEVEL": 26,
+    "BLK_DESCRIPTION": 27,
+    "BLOCK": 29,
+    "BOUNDING_BX_SCALABLE": 30,
+    "BTM_TTL": 31,
+    "BTN_1_LBL": 33,
+    "BTN_2_LBL": 35,
+    "BTN_3_LBL": 37,
+    "CALC_MODE": 39,
+    "CANVAS": 40,
+    "CAP_STY": 41,
+    "CASE_INSENSITIVE_QRY": 42,
+    "CASE_RSTRCTION": 43,
+    "CHAR_CELL_HGT": 44,
+    "CHAR_CELL_WID": 45,
+    "CHAR_MODE_LOGICAL_ATTR": 541,
+    "CHKED_VAL": 46,
+    "CHK_BX_OTHER_VALS": 47,
+    "CLIENT_INFO": 48,
+    "CLIP_HGT": 49,
+    "CLIP_WID": 50,
+    "CLIP_X_POS": 51,
+    "CLIP_Y_POS": 52,
+    "CLOSED": 53,
+    "CLS_ALLOWED": 54,
+    "CMPRSSION_QLTY": 55,
+    "CNV_NAM": 57,
+    "CNV_OBJ": 58,
+    "CNV_TYP": 59,
+    "COLUMN_VALUE": 538,
+    "COL_DAT_TYP": 60,
+    "COL_MAP": 61,
+    "COL_NAM": 62,
+    "COL_SPEC": 63,
+    "COL_VALS_COUNT": 64,
+    "COMMENT": 65,
+    "COMM_MODE": 66,
+    "COMPRESS": 67,
+    "COM_TXT": 68,
+    "COM_TYP": 69,
+    "CONCEAL_DATA": 70,
+    "CONSOLE_WIN": 71,
+    "COORD_SYS": 72,
+    "COPY_VAL_FROM_ITM": 73,
+    "CORNER_RADIUS_X": 74,
+    "CORNER_RADIUS_Y": 75,
+    "CRSR_MODE": 76,
+    "CSTM_SPCING": 77,
+    "DASH_STY": 78,
+    "DAT_SRC_BLK": 79,
+    "DAT_SRC_X_AXS": 80,
+    "DAT_SRC_Y_AXS": 81,
+    "DAT_TYP": 82,
+    "DB_BLK": 83,
+    "DB_ITM": 84,
+    "DEFERRED": 85,
+    "DEFER_REQ_ENF": 86,
+    "DEL_ALLOWED": 87,
+    "DEL_DAT_SRC_ARG": 88,
+    "DEL_DAT_SRC_COL": 89,
+    "DEL_PROC_NAM": 90,
+    "DEL_REC": 91,
+    "DETAIL_BLK": 92,
+    "DETAIL_ITEMREF": 93,
+    "DFLT_ALT_BTN": 94,
+    "DFLT_BTN": 95,
+    "DFLT_FNT_SCALING": 96,
+    "DIRTY_INFO": 97,
+    "DISP_IN_KBRD_HLP": 98,
+    "DISP_NO_PRIV": 99,
+    "DISP_QLTY": 100,
+    "DISP_WID": 101,
+    "DIST_BTWN_RECS": 102,
+    "DITHER": 103,
+    "DML_ARY_SIZ": 104,
+    "DML_DAT_NAM": 105,
+    "DML_DAT_TYP": 106,
+    "DML_RET_VAL": 107,
+    "DSA_MODE": 108,
+    "DSA_NAM": 109,
+    "DSA_TYP": 110,
+    "DSA_TYP_NAM": 111,
+    "DSA_VAL": 112,
+    "DSC_LEN": 113,
+    "DSC_MANDATORY": 114,
+    "DSC_NAM": 115,
+    "DSC_NOCHILDREN": 116,
+    "DSC_PARENT_NAME": 117,
+    "DSC_PRECISION": 118,
+    "DSC_SCALE": 119,
+    "DSC_TYP": 120,
+    "DSC_TYPE_NAME": 121,
+    "EDGE_BACK_COLOR": 132,
+    "EDGE_FORE_COLOR": 133,
+    "EDGE_PAT": 134,
+    "EDITOR": 135,
+    "EDT_NAM": 136,
+    "EDT_OBJ": 137,
+    "EDT_X_POS": 138,
+    "EDT_Y_POS": 139,
+    "ENABLED": 140,
+    "ENFRC_COL_SECURITY": 141,
+    "ENFRC_PRMRY_KEY": 142,
+    "EXEC_HIERARCHY": 143,
+    "EXEC_MODE": 144,
+    "FILL_PAT": 146,
+    "FIRE_IN_QRY": 147,
+    "FIXED_BOUNDING_BX": 148,
+    "FIXED_LEN": 149,
+    "FLNAM": 150,
+    "FLTR_BEFORE_DISP": 151,
+    "FMT_MSK": 152,
+    "FONT_NAM": 153,
+    "FONT_SCALEABLE": 154,
+    "FONT_SIZ": 155,
+    "FONT_SPCING": 156,
+    "FONT_STY": 157,
+    "FONT_WGHT": 158,
+    "FORE_COLOR": 159,
+    "FORMULA": 160,
+    "FORM_PARAM": 161,
+    "FRAME_ALIGN": 162,
+    "FRAME_TTL": 163,
+    "FRAME_TTL_ALIGN": 164,
+    "FRAME_TTL_BACK_COLOR": 165,
+    "FRAME_TTL_FILL_PAT": 166,
+    "FRAME_TTL_FONT_NAM": 167,
+    "FRAME_TTL_FONT_SIZ": 168,
+    "FRAME_TTL_FONT_SPCING": 169,
+    "FRAME_TTL_FONT_STY": 170,
+    "FRAME_TTL_FONT_WGHT": 171,
+    "FRAME_TTL_FORE_COLOR": 172,
+    "FRAME_TTL_OFST": 173,
+    "FRAME_TTL_SPCING": 174,
+    "FRAME_TTL_VAT_NAM": 176,
+    "FRAME_TTL_VAT_OBJ": 177,
+    "FRST_NAVIGATION_BLK_NAM": 178,
+    "FRST_NAVIGATION_BLK_OBJ": 179,
+    "GRAPHIC": 180,
+    "GRAPHICS_TYP": 181,
+    "GRA_FONT_COLOR": 182,
+    "GRA_FONT_COLOR_CODE": 183,
+    "GRA_FONT_NAM": 184,
+    "GRA_FONT_SIZ": 185,
+    "GRA_FONT_SPCING": 186,
+    "GRA_FONT_STY": 187,
+    "GRA_FONT_WGHT": 188,
+    "GRA_TEXT": 189,
+    "HEIGHT": 190,
+    "HELP_BOOK_TITLE": 191,
+    "HELP_BOOK_TOPIC": 192,
+    "HIDE": 193,
+    "HIDE_ON_EXIT": 194,
+    "HIGHEST_ALLOWED_VAL": 195,
+    "HINT": 197,
+    "HLP_DESCRIPTION": 199,
+    "HORZ_JST": 201,
+    "HORZ_MARGN": 202,
+    "HORZ_OBJ_OFST": 203,
+    "HORZ_ORGN": 204,
+    "HORZ_TLBR_CNV": 205,
+    "HTB_CNV_NAME": 206,
+    "ICONIC": 207,
+    "ICON_FLNAM": 208,
+    "ICON_IN_MNU": 209,
+    "IMG_DPTH": 210,
+    "IMG_FMT": 211,
+    "IMPL_CLASS": 212,
+    "INCLUDE_REFITEM": 213,
+    "INHRT_MNU": 214,
+    "INIT_KBRD_DIR": 215,
+    "INIT_MNU": 216,
+    "INIT_VAL": 217,
+    "INSRT_ALLOWED": 219,
+    "INSRT_PROC_NAM": 220,
+    "INS_DAT_SRC_ARG": 221,
+    "INS_DAT_SRC_COL": 222,
+    "INTERACTION_MODE": 223,
+    "INTERNAL_END_ANGLE": 224,
+    "INTERNAL_LIN_WID": 225,
+    "INTERNAL_ROTATION_ANGLE": 226,
+    "INTERNAL_STRT_ANGLE": 227,
+    "ISOLATION_MODE": 228,
+    "ITEM": 229,
+    "ITMS_DISP": 230,
+    "ITM_TYP": 231,
+    "JOIN_COND": 232,
+    "JOIN_STY": 233,
+    "JUSTIFICATION": 234,
+    "KBRD_ACC": 235,
+    "KBRD_HLP_TXT": 237,
+    "KBRD_NAVIGABLE": 239,
+    "KBRD_STATE": 240,
+    "KEEP_CRSR_POS": 241,
+    "KEY_MODE": 242,
+    "LABEL": 243,
+    "LANG_DIR": 246,
+    "LAYOUT_DATA_BLK_NAM": 247,
+    "LAYOUT_STY": 248,
+    "LIB_LOC": 249,
+    "LIB_PROG_UNIT": 250,
+    "LIB_SRC": 251,
+    "LIN_SPCING": 252,
+    "LOCK_DAT_SRC_ARG": 254,
+    "LOCK_DAT_SRC_COL": 255,
+    "LOCK_MODE": 256,
+    "LOCK_PROC_NAM": 257,
+    "LOCK_REC": 258,
+    "LOV": 259,
+    "LOV_NAM": 260,
+    "LOV_OBJ": 261,
+    "LOV_X_POS": 262,
+    "LOV_Y_POS": 263,
+    "LOWEST_ALLOWED_VAL": 264,
+    "LST_ELEMENT_COUNT": 266,
+    "LST_IN_BLK_MNU": 267,
+    "LST_STY": 268,
+    "LST_TYP": 269,
+    "MAGIC_ITM": 270,
+    "MAIN_MNU": 271,
+    "MAXIMIZE_ALLOWED": 272,
+    "MAX_LEN": 273,
+    "MAX_OBJS": 274,
+    "MAX_QRY_TIME": 275,
+    "MAX_RECS_FETCHED": 276,
+    "MENU": 277,
+    "MINIMIZE_ALLOWED": 278,
+    "MINIMIZE_TTL": 279,
+    "MLT_LIN": 281,
+    "MNU_DRCTRY": 282,
+    "MNU_FLNAM": 283,
+    "MNU_ITM": 284,
+    "MNU_ITM_CODE": 285,
+    "MNU_ITM_RAD_GRP": 286,
+    "MNU_ITM_TYP": 287,
+    "MNU_MOD": 288,
+    "MNU_PARAM": 289,
+    "MNU_PARAM_INIT_VAL": 290,
+    "MNU_ROLE": 292,
+    "MNU_SRC": 293,
+    "MNU_STY": 294,
+    "MODAL": 295,
+    "MODULE": 296,
+    "MOUSE_NAVIGATE": 297,
+    "MOUSE_NAVIGATION_LMT": 298,
+    "MV_ALLOWED": 299,
+    "NAME": 300,
+    "NAVIGATION_STY": 301,
+    "NEWDEFER_REQ_ENF": 540,
+    "NEXT": 302,
+    "NXT_NAVIGATION_BLK_NAM": 303,
+    "NXT_NAVIGATION_BLK_OBJ": 304,
+    "NXT_NAVIGATION_ITM_NAM": 305,
+    "NXT_NAVIGATION_ITM_OBJ": 306,
+    "OBJ_COUNT": 307,
+    "OBJ_GRP": 308,
+    "OBJ_GRP_CHILD_REAL_OBJ": 309,
+    "OBJ_LIB_TAB": 310,
+    "OG_CHILD": 311,
+    "OLD_LOV_TXT": 312,
+    "OLE_ACT_STY": 313,
+    "OLE_CLASS": 314,
+    "OLE_INSD_OUT_SUPPORT": 315,
+    "OLE_IN_PLACE_ACT": 316,
+    "OLE_POPUP_MNU_ITMS": 317,
+    "OLE_RESIZ_STY": 318,
+    "OLE_SHOW_POPUP_MNU": 319,
+    "OLE_SHOW_TNNT_TYP": 320,
+    "OLE_TNNT_ASPCT": 321,
+    "OLE_TNNT_TYP": 322,
+    "OPT_HINT": 323,
+    "ORDR_BY_CLAUSE": 324,
+    "OTHER_VALS": 325,
+    "OWNER": 326,
+    "PARAM_DAT_TYP": 327,
+    "PARAM_INIT_VAL": 328,
+    "PAR_FLNAM": 330,
+    "PAR_FLPATH": 331,
+    "PAR_MODSTR": 332,
+    "PAR_MODTYP": 333,
+    "PAR_MODULE": 334,
+    "PAR_NAM": 335,
+    "PAR_SL1OBJ_NAM": 336,
+    "PAR_SL1OBJ_TYP": 337,
+    "PAR_SL2OBJ_NAM": 338,
+    "PAR_SL2OBJ_TYP": 339,
+    "PAR_TYP": 340,
+    "PERSIST_CLIENT_INFO": 341,
+    "PERSIST_CLT_INF_LEN": 342,
+    "PGU_TXT": 343,
+    "PGU_TYP": 344,
+    "POINT": 345,
+    "POPUP_MNU_NAM": 346,
+    "POPUP_MNU_OBJ": 347,
+    "POPUP_VA_OBJ": 348,
+    "PRECOMP_SUMM": 349,
+    "PREVIOUS": 350,
+    "PREV_NAVIGATION_BLK_NAM": 351,
+    "PREV_NAVIGATION_BLK_OBJ": 352,
+    "PREV_NAVIGATION_ITM_NAM": 353,
+    "PREV_NAVIGATION_ITM_OBJ": 354,
+    "PRMPT": 355,
+    "PRMPT_ALIGN": 356,
+    "PRMPT_ALIGN_OFST": 357,
+    "PRMPT_ATT_EDGE": 358,
+    "PRMPT_ATT_OFST": 359,
+    "PRMPT_BACK_COLOR": 360,
+    "PRMPT_DISP_STY": 361,
+    "PRMPT_FILL_PAT": 362,
+    "PRMPT_FONT_NAM": 363,
+    "PRMPT_FONT_SIZ": 364,
+    "PRMPT_FONT_SPCING": 365,
+    "PRMPT_FONT_STY": 366,
+    "PRMPT_FONT_WGHT": 367,
+    "PRMPT_FORE_COLOR": 368,
+    "PRMPT_JST": 369,
+    "PRMPT_READING_ORDR": 370,
+    "PRMPT_VAT_NAM": 372,
+    "PRMPT_VAT_OBJ": 373,
+    "PRMRY_CNV": 374,
+    "PRMRY_KEY": 375,
+    "PROG_UNIT": 376,
+    "PROP_CLASS": 377,
+    "PRVNT_MSTRLESS_OPS": 378,
+    "QRY_ALLOWED": 379,
+    "QRY_ALL_RECS": 380,
+    "QRY_DAT_SRC_ARG": 381,
+    "QRY_DAT_SRC_COL": 382,
+    "QRY_DAT_SRC_NAM": 383,
+    "QRY_DAT_SRC_TYP": 384,
+    "QRY_LEN": 385,
+    "QRY_ONLY": 386,
+    "RAD_BUT": 387,
+    "RAISE_ON_ENT": 388,
+    "RDB_VAL": 389,
+    "READING_ORDR": 390,
+    "REAL_UNIT": 391,
+    "RECS_BUFFERED_COUNT": 392,
+    "RECS_DISP_COUNT": 393,
+    "RECS_FETCHED_COUNT": 394,
+    "REC_GRP": 395,
+    "REC_GRP_FETCH_SIZ": 396,
+    "REC_GRP_NAM": 397,
+    "REC_GRP_OBJ": 398,
+    "REC_GRP_QRY": 399,
+    "REC_GRP_TYP": 400,
+    "REC_ORNT": 401,
+    "REC_VAT_GRP_NAM": 402,
+    "REC_VAT_GRP_OBJ": 403,
+    "REL": 404,
+    "REL_TYPE": 405,
+    "RENDERED": 406,
+    "REPORT": 407,
+    "REQUIRED": 408,
+    "RESIZE_ALLOWED": 409,
+    "REV_DIR": 410,
+    "ROLE_COUNT": 411,
+    "RPT_DESTINATION_FMT": 412,
+    "RPT_DESTINATION_NAM": 413,
+    "RPT_DESTINATION_TYP": 414,
+    "RPT_PARAMS": 415,
+    "RPT_SRVR": 416,
+    "RTRN_ITM": 417,
+    "RUNTIME_COMP": 418,
+    "SCRLBR_ALIGN": 419,
+    "SCRLBR_CNV_NAM": 420,
+    "SCRLBR_CNV_OBJ": 421,
+    "SCRLBR_LEN": 422,
+    "SCRLBR_ORNT": 423,
+    "SCRLBR_TBP_NAM": 424,
+    "SCRLBR_TBP_OBJ": 425,
+    "SCRLBR_WID": 426,
+    "SCRLBR_X_POS": 427,
+    "SCRLBR_Y_POS": 428,
+    "SHARE_LIB": 429,
+    "SHOW_FAST_FWD": 430,
+    "SHOW_HORZ_SCRLBR": 431,
+    "SHOW_PALETTE": 432,
+    "SHOW_PLAY": 433,
+    "SHOW_REC": 434,
+    "SHOW_REWIND": 435,
+    "SHOW_SCRLBR": 436,
+    "SHOW_SLIDER": 437,
+    "SHOW_TIME": 438,
+    "SHOW_VERT_SCRLBR": 439,
+    "SHOW_VOLUME": 440,
+    "SHRINKWRAP": 441,
+    "SIZING_STY": 442,
+    "SND_FMT": 443,
+    "SND_QLTY": 444,
+    "SNGL_OBJ_ALIGN": 445,
+    "SNGL_REC": 446,
+    "SOURCE": 447,
+    "STRTUP_CODE": 448,
+    "STRT_PRMPT_ALIGN": 449,
+    "STRT_PRMPT_OFST": 450,
+    "SUBCL_OBJGRP": 451,
+    "SUBCL_SUBOBJ": 452,
+    "SUB_MNU_NAM": 453,
+    "SUB_MNU_OBJ": 454,
+    "SUB_TTL": 455,
+    "SUMM_BLK_NAM": 457,
+    "SUMM_FUNC": 458,
+    "SUMM_ITM_NAM": 459,
+    "SVPNT_MODE": 460,
+    "SYNC_ITM_NAM": 461,
+    "SYNC_ITM_OBJ": 462,
+    "TAB_ACT_STY": 463,
+    "TAB_ATT_EDGE": 464,
+    "TAB_PAGE": 465,
+    "TAB_STY": 466,
+    "TAB_WID_STY": 467,
+    "TBP_NAM": 468,
+    "TBP_OBJ": 469,
+    "TEAR_OFF_MNU": 470,
+    "TITLE": 474,
+    "TOOLTIP": 476,
+    "TOOLTIP_VAT_GRP": 478,
+    "TOP_PRMPT_ALIGN": 479,
+    "TOP_PRMPT_OFST": 480,
+    "TRE_ALLW_EMP_BRANCH": 481,
+    "TRE_DATA_QRY": 482,
+    "TRE_MULTI_SELECT": 483,
+    "TRE_REC_GRP": 484,
+    "TRE_SHOW_LINES": 485,
+    "TRE_SHOW_SYMBOL": 486,
+    "TRG_INTERNAL_TYP": 487,
+    "TRG_STY": 488,
+    "TRG_TXT": 489,
+    "TRIGGER": 490,
+    "TRIG_STEP": 550,
+    "TTL_READING_ORDR": 491,
+    "UNCHKED_VAL": 492,
+    "UPDT_ALLOWED": 493,
+    "UPDT_CHANGED_COLS": 494,
+    "UPDT_COMMIT": 495,
+    "UPDT_IF_NULL": 496,
+    "UPDT_LAYOUT": 497,
+    "UPDT_PROC_NAM": 498,
+    "UPDT_QRY": 499,
+    "UPD_DAT_SRC_ARG": 500,
+    "UPD_DAT_SRC_COL": 501,
+    "USE_3D_CNTRLS": 502,
+    "USE_SECURITY": 503,
+    "VALIDATE_FROM_LST": 504,
+    "VALIDATION_UNIT": 505,
+    "VAT_NAM": 506,
+    "VAT_OBJ": 507,
+    "VAT_TYP": 508,
+    "VERT_FILL": 509,
+    "VERT_JST": 510,
+    "VERT_MARGN": 511,
+    "VERT_OBJ_OFST": 512,
+    "VERT_ORGN": 513,
+    "VERT_TLBR_CNV": 514,
+    "VISIBLE": 515,
+    "VIS_ATTR": 516,
+    "VPRT_HGT": 517,
+    "VPRT_WID": 518,
+    "VPRT_X_POS": 519,
+    "VPRT_X_POS_ON_CNV": 520,
+    "VPRT_Y_POS": 521,
+    "VPRT_Y_POS_ON_CNV": 522,
+    "VSBL_IN_HORZ_MNU_TLBR": 523,
+    "VSBL_IN_MENU": 524,
+    "VSBL_IN_VERT_MNU_TLBR": 525,
+    "VTB_CNV_NAME": 526,
+    "WHERE_CLAUSE": 527,
+    "WHITE_ON_BLACK": 528,
+    "WIDTH": 529,
+    "WINDOW": 530,
+    "WIN_STY": 531,
+    "WND_NAM": 532,
+    "WND_OBJ": 533,
+    "WRAP_STY": 534,
+    "WRAP_TXT": 535,
+    "X_POS": 536,
+    "Y_POS": 537,
+}
+
+# data types of the properties, by property number
+property_types: Dict[int, str] = {
+    1: "text",
+    3: "obj",
+    4: "text",
+    5: "bool",
+    6: "bool",
+    7: "bool",
+    8: "bool",
+    9: "text",
+    11: "num",
+    12: "num",
+    13: "num",
+    14: "obj",
+    15: "obj",
+    16: "num",
+    17: "bool",
+    18: "bool",
+    19: "bool",
+    20: "bool",
+    21: "bool",
+    22: "bool",
+    23: "bool",
+    24: "bool",
+    25: "text",
+    26: "num",
+    27: "text",
+    29: "obj",
+    30: "bool",
+    31: "text",
+    33: "text",
+    35: "text",
+    37: "text",
+    39: "num",
+    40: "obj",
+    41: "num",
+    42: "bool",
+    43: "num",
+    44: "num",
+    45: "num",
+    46: "text",
+    47: "num",
+    48: "blob",
+    49: "num",
+    50: "num",
+    51: "num",
+    52: "num",
+    53: "bool",
+    54: "bool",
+    55: "num",
+    57: "text",
+    58: "obj",
+    59: "num",
+    60: "num",
+    61: "obj",
+    62: "text",
+    63: "obj",
+    64: "num",
+    65: "text",
+    66: "num",
+    67: "num",
+    68: "text",
+    69: "num",
+    70: "bool",
+    71: "text",
+    72: "num",
+    73: "text",
+    74: "num",
+    75: "num",
+    76: "num",
+    77: "num",
+    78: "num",
+    79: "text",
+    80: "text",
+    81: "text",
+    82: "num",
+    83: "bool",
+    84: "bool",
+    85: "bool",
+    86: "bool",
+    87: "bool",
+    88: "obj",
+    89: "obj",
+    90: "text",
+    91: "num",
+    92: "text",
+    93: "text",
+    94: "num",
+    95: "bool",
+    96: "bool",
+    97: "bool",
+    98: "bool",
+    99: "bool",
+    100: "num",
+    101: "num",
+    102: "num",
+    103: "bool",
+    104: "num",
+    105: "text",
+    106: "num",
+    107: "bool",
+    108: "num",
+    109: "text",
+    110: "num",
+    111: "text",
+    112: "text",
+    113: "num",
+    114: "bool",
+    115: "text",
+    116: "bool",
+    117: "text",
+    118: "num",
+    119: "num",
+    120: "num",
+    121: "text",
+    132: "text",
+    133: "text",
+    134: "text",
+    135: "obj",
+    136: "text",
+    137: "obj",
+    138: "num",
+    139: "num",
+    140: "bool",
+    141: "bool",
+    142: "bool",
+    143: "num",
+    144: "num",
+    146: "text",
+    147: "bool",
+    148: "bool",
+    149: "bool",
+    150: "text",
+    151: "bool",
+    152: "text",
+    153: "text",
+    154: "bool",
+    155: "num",
+    156: "num",
+    157: "num",
+    158: "num",
+    159: "text",
+    160: "text",
+    161: "obj",
+    162: "num",
+    163: "text",
+    164: "num",
+    165: "text",
+    166: "text",
+    167: "text",
+    168: "num",
+    169: "num",
+    170: "num",
+    171: "num",
+    172: "text",
+    173: "num",
+    174: "num",
+    176: "text",
+    177: "obj",
+    178: "text",
+    179: "obj",
+    180: "obj",
+    181: "num",
+    182: "text",
+    183: "num",
+    184: "text",
+    185: "num",
+    186: "num",
+    187: "num",
+    188: "num",
+    189: "text",
+    190: "num",
+    191: "text",
+    192: "text",
+    193: "bool",
+    194: "bool",
+    195: "text",
+    197: "text",
+    199: "text",
+    201: "num",
+    202: "num",
+    203: "num",
+    204: "num",
+    205: "text",
+    206: "text",
+    207: "bool",
+    208: "text",
+    209: "bool",
+    210: "num",
+    211: "num",
+    212: "text",
+    213: "bool",
+    214: "bool",
+    215: "num",
+    216: "text",
+    217: "text",
+    219: "bool",
+    220: "text",
+    221: "obj",
+    222: "obj",
+    223: "num",
+    224: "num",
+    225: "num",
+    226: "num",
+    227: "num",
+    228: "num",
+    229: "obj",
+    230: "num",
+    231: "num",
+    232: "text",
+    233: "num",
+    234: "num",
+    235: "text",
+    237: "text",
+    239: "bool",
+    240: "num",
+    241: "bool",
+    242: "num",
+    243: "text",
+    246: "num",
+    247: "text",
+    248: "num",
+    249: "text",
+    250: "obj",
+    251: "num",
+    252: "num",
+    254: "obj",
+    255: "obj",
+    256: "num",
+    257: "text",
+    258: "bool",
+    259: "obj",
+    260: "text",
+    261: "obj",
+    262: "num",
+    263: "num",
+    264: "text",
+    266: "num",
+    267: "bool",
+    268: "num",
+    269: "num",
+    270: "num",
+    271: "text",
+    272: "bool",
+    273: "num",
+    274: "num",
+    275: "num",
+    276: "num",
+    277: "obj",
+    278: "bool",
+    279: "text",
+    281: "bool",
+    282: "text",
+    283: "text",
+    284: "obj",
+    285: "text",
+    286: "text",
+    287: "num",
+    288: "text",
+    289: "obj",
+    290: "text",
+    292: "text",
+    293: "num",
+    294: "num",
+    295: "bool",
+    296: "obj",
+    297: "bool",
+    298: "num",
+    299: "bool",
+    300: "text",
+    301: "num",
+    302: "obj",
+    303: "text",
+    304: "obj",
+    305: "text",
+    306: "obj",
+    307: "num",
+    308: "obj",
+    309: "obj",
+    310: "obj",
+    311: "obj",
+    312: "text",
+    313: "num",
+    314: "text",
+    315: "bool",
+    316: "bool",
+    317: "num",
+    318: "num",
+    319: "bool",
+    320: "bool",
+    321: "num",
+    322: "num",
+    323: "text",
+    324: "text",
+    325: "text",
+    326: "obj",
+    327: "num",
+    328: "text",
+    330: "text",
+    331: "text",
+    332: "num",
+    333: "num",
+    334: "text",
+    335: "text",
+    336: "text",
+    337: "num",
+    338: "text",
+    339: "num",
+    340: "num",
+    341: "blob",
+    342: "num",
+    343: "text",
+    344: "num",
+    345: "obj",
+    346: "text",
+    347: "text",
+    348: "obj",
+    349: "bool",
+    350: "obj",
+    351: "text",
+    352: "obj",
+    353: "text",
+    354: "obj",
+    355: "text",
+    356: "num",
+    357: "num",
+    358: "num",
+    359: "num",
+    360: "text",
+    361: "num",
+    362: "text",
+    363: "text",
+    364: "num",
+    365: "num",
+    366: "num",
+    367: "num",
+    368: "text",
+    369: "num",
+    370: "num",
+    372: "text",
+    373: "obj",
+    374: "text",
+    375: "bool",
+    376: "obj",
+    377: "obj",
+    378: "bool",
+    379: "bool",
+    380: "bool",
+    381: "obj",
+    382: "obj",
+    383: "text",
+    384: "num",
+    385: "num",
+    386: "bool",
+    387: "obj",
+    388: "bool",
+    389: "text",
+    390: "num",
+    391: "num",
+    392: "num",
+    393: "num",
+    394: "num",
+    395: "obj",
+    396: "num",
+    397: "text",
+    398: "obj",
+    399: "text",
+    400: "num",
+    401: "num",
+    402: "text",
+    403: "obj",
+    404: "obj",
+    405: "num",
+    406: "bool",
+    407: "obj",
+    408: "bool",
+    409: "bool",
+    410: "bool",
+    411: "num",
+    412: "text",
+    413: "text",
+    414: "num",
+    415: "text",
+    416: "text",
+    417: "text",
+    418: "num",
+    419: "num",
+    420: "text",
+    421: "obj",
+    422: "num",
+    423: "num",
+    424: "text",
+    425: "obj",
+    426: "num",
+    427: "num",
+    428: "num",
+    429: "bool",
+    430: "bool",
+    431: "bool",
+    432: "bool",
+    433: "bool",
+    434: "bool",
+    435: "bool",
+    436: "bool",
+    437: "bool",
+    438: "bool",
+    439: "bool",
+    440: "bool",
+    441: "bool",
+    442: "num",
+    443: "num",
+    444: "num",
+    445: "num",
+    446: "bool",
+    447: "obj",
+    448: "text",
+    449: "num",
+    450: "num",
+    451: "bool",
+    452: "bool",
+    453: "text",
+    454: "obj",
+    455: "text",
+    457: "text",
+    458: "num",
+    459: "text",
+    460: "bool",
+    461: "text",
+    462: "obj",
+    463: "num",
+    464: "num",
+    465: "obj",
+    466: "num",
+    467: "num",
+    468: "text",
+    469: "obj",
+    470: "bool",
+    474: "text",
+    476: "text",
+    478: "text",
+    479: "num",
+    480: "num",
+    481: "bool",
+    482: "text",
+    483: "bool",
+    484: "text",
+    485: "bool",
+    486: "bool",
+    487: "num",
+    488: "num",
+    489: "text",
+    490: "obj",
+    491: "num",
+    492: "text",
+    493: "bool",
+    494: "bool",
+    495: "bool",
+    496: "bool",
+    497: "num",
+    498: "text",
+    499: "bool",
+    500: "obj",
+    501: "obj",
+    502: "bool",
+    503: "bool",
+    504: "bool",
+    505: "num",
+    506: "text",
+    507: "obj",
+    508: "num",
+    509: "bool",
+    510: "num",
+    511: "num",
+    512: "num",
+    513: "num",
+    514: "text",
+    515: "bool",
+    516: "obj",
+    517: "num",
+    518: "num",
+    519: "num",
+    520: "num",
+    521: "num",
+    522: "num",
+    523: "bool",
+    524: "bool",
+    525: "bool",
+    526: "text",
+    527: "text",
+    528: "bool",
+    529: "num",
+    530: "obj",
+    531: "num",
+    532: "text",
+    533: "obj",
+    534: "num",
+    535: "bool",
+    536: "num",
+    537: "num",
+    538: "obj",
+    540: "num",
+    541: "text",
+    550: "obj",
+}
+
+# bitsets of the property numbers every object type has, by object number
+supported_properties: Dict[int, int] = {
+    1: 0x100000C000000040000008000000000000000000000004070FC400000510000000000004000000000000000000000FA04000000000000400000020001002A02000A00,
+    2: 0x4060000000005000000000000A00000000000000000000000000000000000000000000020001000000000000,
+    3: 0x180000C34640000000000C0101FF0041E0701F8000001E070FC580001F10000180803C04400207820000000000000FA04600000000F0007880002000100000A000010,
+    4: 0x3307E80C000000000F80008080800000000010000000004C70FC400000510000000000004000000000000140100000FA04000000000000000000020801000006000000,
+    5: 0x80000000000000000000000000000000000000000000000000000000000000000000000001000001000000300000000000,
+    6: 0x406000000000400000000000000000000000000000000000000000000001F000000000000001000000000000,
+    7: 0x4060000000004000000000000000000000000000000000000000000003FE0000000000000001000000000000,
+    8: 0x34300000C000000040000008080800000000000000000004070FC400000510000000000000000000000000040000000FA04000000000000000000020001000082000000,
+    9: 0x7A00000000000000000000000000000000000000,
+    10: 0x40014024004000400100000000004008C0800030000004060000000105471003800080040001081002000800C00020000008000000000004010820001010020008008,
+    11: 0x8000000000000000000000004070FDC000005100000200000000000000000000000000000000000000000000000000020001000000000000,
+    12: 0x3820003EC02080180300006A210040800000200000000004270FC40000051000004000011C0020F00001E007FF37FFC84140070000000D000006C00003F0200460011E0,
+    13: 0x34300080D09B47E50306E009DEFC000014C004E08B7FFFE5C73FC67FE065300020215F4004B84C00A9D802940000001FB651F00000000508017824E4681CC8006890002,
+    14: 0x4000000000004000000000000E00000000000000000000000000000000000000000000000000000000008000,
+    15: 0x30300000C000000040000008000000000006000000000004070FC400100510000002000004000000000000040000000FA84000000000000000000022001000003D60000,
+    16: 0x40000000000000200000000000000004060000000005000000000000000000000000000000000000000000000000020000000000001000000000000,
+    17: 0x44000808000000000000000000000004070FC4000005100100000000000000000000000000000000000000000000000000000020001000080000000,
+    18: 0x38080C000000000000608000000008000000000000004073FC4000005100E000400000080800000300A0000000007A00100000000008000000320001000000000000,
+    19: 0x1000800000000000010000200008000000030000004070FC00001050020C2080000000000000000000000000000000000000000000000000020001000000008000,
+    20: 0x8000000001000000000000004070FC4000005104000200000008000000000020000000000020000000000000000000420001080000006000,
+    21: 0x8000000000000000000000004070FC4000805100000000000000000000000000000000000000000000000000000000020001000000000000,
+    22: 0x8000000000000000000000004060000000205000000000000000000000000000000000000000000000000000000000000001000000000000,
+    23: 0x4060000000485000000000000000000000000000000000000000000000000000000000000001000000000000,
+    24: 0x4060000000085000000000000008000000000000000000000000000000000000000000020001000000000000,
+    25: 0x80000000000000000000000041F0FC4000005100000000000000000000000000000000000000000000000000000000020001000000000000,
+    26: 0x400000000008000000000000000000000004070FC4000005100000000000000000000000000000000000000000000000000000000020001000000000000,
+    27: 0x30300080C0000000000000080000000000000200037FFF8407FFC400000510000000000000800000000000040000000FA04100000000040000000020001000002000002,
+    28: 0x8000000000019000000000004070FC4000005100000000000000000000000000000000000000000000000000000000028001000000000000,
+    29: 0x8000000000200000040000004060004000005100000000000000010000000000000000000000000000000000382000020001000000200000,
+    30: 0x80000001F0000000000000004060004000005100000000000000000000000000000000000041000000000000000080060001000000000000,
+    31: 0x400000000000000000000000000000000000000000000004060000000005000000200000000000000000000000000000000000000000000000000011001000000000000,
+    32: 0x800000000000000008000000000000000000000004060004000005100000000000008000000000000001000000000100000000000000000020001000000000000,
+    33: 0x40000000000000038000000000800000000000000000000000407FFC4000005100000000000000200000000002000000000008800000000004000000020001000000000000,
+    34: 0x10000100000000000000080000000000000000001FD004070FC400000510000000000000000000000000000000000FA04000000000000000000020001000002000000,
+    35: 0x30B40000C000000040000008080800002000000004000004070FC400000598000C10000004000000041400540000000FA04000000000000000000020041000006000000,
+    36: 0x180000000005000000000000000000000000000000000000000000000000000000000000000000000000000,
+    39: 0x300000000000000000000000000000000000000000000004000000000005000000000000000000000000000000000000000000000000000000000000000000000000000,
+}
@@ -1,47 +1,57 @@
 from __future__ import annotations
 
 import enum
+import os
+import sys
+from ctypes import Structure, byref, c_size_t, c_ulong, sizeof
 from typing import (
     Dict,
     Type,
     Tuple,
-    Union,
     NoReturn,
     Iterable,
+    Iterator,
     List,
     TypeVar,
     Generic,
     Any,
     TYPE_CHECKING,
     Optional,
+    Union,
 )
 
 from .context import context, property_type, find_library_tab_object_by_position
 from .context import get_boolean
+from .context import get_booleans
 from .context import get_number
+from .context import get_numbers
 from .context import get_object
+from .context import get_objects
 from .context import get_text
-from .context import object_name
+from .context import get_texts
+from .context import object_number
 from .context import property_constant_name
-from .context import property_constant_number
 from .context import property_name
-from .context import query_type
 from .context import set_boolean
 from .context import set_number
 from .context import set_object
 from .context import set_text
 from .context import find_library_object_by_position
-from .generic_object import BaseObject, ValueTypes, GenericObject
+from .error_handling import FormsException
+from .generic_object import BaseObject, ValueTypes, GenericObject, Common
+from .generic_object import get_object_constructor
+from .generic_object import object_classes
+from .generic_object import objects
+from .generic_object import registered_objects
+from .generic_object import type_numbers
+from .generic_object import wrap
+from .object_collection import ObjectCollection, object_collection, object_renamed
 from .property_types import Properties
 from .constants import Justification
 
 if TYPE_CHECKING:  # pragma: no cover
     from . import ObjectLibraryTab
-    from . import Module
-    from . import Library
-
-objects = Union[Type["Module"], Type["Library"], Type[GenericObject]]
-registered_objects: Dict[str, objects] = {}
+    from .forms_objects import Library, Module, ObjectLibrary
 
 
 class ObjectProperties(enum.Enum):
@@ -79,12 +89,9 @@ class ObjectProperties(enum.Enum):
     column_values = "D2FP_COLUMN_VALUE"
 
 
-class Common:
-    def __init__(self, constant: str):
-        self.constant = constant
-
-
 class Unknown(Common):
+    writable = False
+
     def __get__(self, instance: BaseObject, owner: Type[BaseObject]) -> None:
         return None
 
@@ -93,17 +100,18 @@ class Unknown(Common):
 
 
 class Text(Common):
+    bulk_getter = staticmethod(get_texts)  # type: ignore
+
     def __get__(self, instance: BaseObject, owner: Type[BaseObject]) -> str:
-        return (
-            get_text(instance, property_constant_number(self.constant)) or b""
-        ).decode(context.encoding)
+        return self.convert(get_text(instance, self.number))
+
+    def convert(self, value: Optional[bytes]) -> str:  # type: ignore
+        return (value or b"").decode(context.encoding)
 
     def __set__(self, instance: BaseObject, value: str) -> None:
-        set_text(
-            instance,
-            property_constant_number(self.constant),
-            value.encode(context.encoding),
-        )
+        set_text(instance, self.number, value.encode(context.encoding))
+        if self.constant == "NAME":
+            object_renamed(instance, value)
 
 
 U = TypeVar("U")
@@ -119,54 +127,63 @@ class BasicAttribute(Common, Generic[U]):
         raise NotImplementedError()  # pragma: no cover
 
     def __get__(self, instance: BaseObject, owner: Type[BaseObject]) -> U:
-        return self._getter(instance, property_constant_number(self.constant))
+        return self._getter(instance, self.number)
 
     def __set__(self, instance: BaseObject, value: U) -> None:
-        self._setter(instance, property_constant_number(self.constant), value)
+        self._setter(instance, self.number, value)
 
 
 class Bool(BasicAttribute[bool]):
     _getter = staticmethod(get_boolean)  # type: ignore
     _setter = staticmethod(set_boolean)  # type: ignore
+    bulk_getter = staticmethod(get_booleans)  # type: ignore
 
 
 class Number(BasicAttribute[int]):
     _getter = staticmethod(get_number)  # type: ignore
     _setter = staticmethod(set_number)  # type: ignore
+    bulk_getter = staticmethod(get_numbers)  # type: ignore
 
 
 class Constant(Common, Generic[U]):
     _getter = staticmethod(get_number)
     _setter = staticmethod(set_number)
+    bulk_getter = staticmethod(get_numbers)  # type: ignore
 
     def __init__(self, constant: str, klass: Type[U]):
         self.constant, self.klass = constant, klass
 
     def __get__(self, instance: BaseObject, owner: Type[BaseObject]) -> U:
-        return self.klass(int(self._getter(instance, property_constant_number(self.constant))))  # type: ignore
+        return self.convert(self._getter(instance, self.number))
+
+    def convert(self, value: int) -> U:  # type: ignore
+        return self.klass(int(value))  # type: ignore
 
     def __set__(self, instance: BaseObject, value: U) -> None:
         to_set = (
             value.value if isinstance(value, self.klass) else self.klass(value).value  # type: ignore
         )
-        self._setter(instance, property_constant_number(self.constant), int(to_set))
+        self._setter(instance, self.number, int(to_set))
 
 
 T = TypeVar("T")
 
 
 class Object(Common, Generic[T]):
+    bulk_getter = staticmethod(get_objects)  # type: ignore
+
     def __get__(
         self, instance: BaseObject, owner: Type[BaseObject]
     ) -> Optional[BaseObject]:
-        obj = get_object(instance, property_constant_number(self.constant))
+        return self.convert(get_object(instance, self.number))
+
+    def convert(self, obj: Optional[BaseObject]) -> Optional[BaseObject]:  # type: ignore
         if obj:
-            klass = get_object_constructor(obj)
-            return klass(obj)
+            return wrap(get_object_constructor(obj), obj)
         return None
 
     def __set__(self, instance: BaseObject, value: BaseObject) -> None:
-        set_object(instance, property_constant_number(self.constant), value)
+        set_object(instance, self.number, value)
 
 
 properties = {
@@ -178,33 +195,35 @@ properties = {
 }
 
 
-def get_object_constructor(obj: BaseObject) -> objects:
-    obj_name = object_name(query_type(obj))
-    klass = registered_objects.get(obj_name, GenericObject)
-    return klass
+next_property = Common("NEXT")
 
 
-class Subobjects(Generic[T]):
-    def __init__(self, constant: str) -> None:
-        self.constant = constant
+def object_chain(first_object: Optional[BaseObject]) -> Iterator[BaseObject]:
+    # every sibling shares the class of the first one, so only NEXT gets fetched,
+    # ahead of handing out the current one, which may get moved or destroyed
+    if first_object:
+        klass = get_object_constructor(first_object)
+        next_number = next_property.number
 
-    # todo: this generates a new list every time would be better if its the same list, then
-    #  could operate on that list object creation/deletion and you won't have multiple inconsistent lists
-    def __get__(
-        self, instance: GenericObject, owner: Type[GenericObject]
-    ) -> List[BaseObject]:
-        def gen_subobjects() -> Iterable[BaseObject]:
-            first_child = get_object(instance, property_constant_number(self.constant))
-            if first_child:
-                klass = get_object_constructor(first_child)
+        child = wrap(klass, first_object)
+        while child:
+            next_object = get_object(child, next_number)
+            next_child = wrap(klass, next_object) if next_object else None
+            yield child
+            child = next_child
 
-                child = klass(first_child)
-                while child:
-                    yield child
-                    child = klass(child.next_object)  # type: ignore
 
-        subobjects = list(gen_subobjects())
-        return subobjects
+class Subobjects(Common, Generic[T]):
+    writable = False
+
+    def __get__(
+        self, instance: GenericObject, owner: Type[GenericObject]
+    ) -> ObjectCollection[BaseObject]:
+        return object_collection(
+            instance,
+            self.number,
+            lambda: object_chain(get_object(instance, self.number)),
+        )
 
     def __set__(self, instance: BaseObject, value: List[BaseObject]) -> NoReturn:
         raise AttributeError("can't set attribute")
@@ -220,7 +239,7 @@ class ObjectLibraryTabObjects:
 
                 klass = get_object_constructor(BaseObject(first_child))
 
-                child = klass(first_child)
+                child = wrap(klass, first_child)
 
                 yield child
 
@@ -231,22 +250,74 @@ class ObjectLibraryTabObjects:
         raise AttributeError("can't set attribute")  # pragma: nocover
 
 
-def add_properties(klass: Type[BaseObject], api_objects: Dict) -> Type[BaseObject]:  # type: ignore
-    try:
-        obj_type = api_objects[klass.object_type.value]
-    except KeyError:
-        # todo: clean up dirty hack
-        #  mostly for column_value, which seems to be not documented by orcl anyway
-        #  other objects also do not have their own specific entries
-        obj_type = api_objects["D2FFO_ANY"]
-        object_number = 6
-    else:
-        object_number = obj_type["object_number"]
-
-    klass._object_number = object_number
+def add_properties(
+    klass: Type[BaseObject], object_numbers: Dict[str, int]
+) -> Type[BaseObject]:
+    # todo: clean up dirty hack
+    #  mostly for column_value, which seems to be not documented by orcl anyway
+    #  other objects also do not have their own specific entries
+    klass._object_number = object_numbers.get(klass.object_type.value, 6)
     return klass
 
 
+def index_object_classes() -> None:
+    for obj_name, klass in registered_objects.items():
+        try:
+            number = object_number(obj_name)
+        except FormsException:
+            # not known to this version, get_object_constructor falls back to names
+            continue
+        object_classes[number] = klass
+        type_numbers[klass.object_type] = number
+
+
 def forms_object(klass: objects) -> objects:
     registered_objects[klass.object_type.value[6:]] = klass
     return klass
+
+
+def load_file(path: str) -> Union[Library, Module, ObjectLibrary]:
+    # a module, library or object library, by the extension of path
+    from .forms_objects import Library, Module, ObjectLibrary
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".pll":
+        return Library.load(path)
+    if extension == ".olb":
+        return ObjectLibrary.load(path)
+    return Module.load(path)
+
+
+class ProcessMemoryCounters(Structure):
+    _fields_ = [
+        ("cb", c_ulong),
+        ("PageFaultCount", c_ulong),
+        ("PeakWorkingSetSize", c_size_t),
+        ("WorkingSetSize", c_size_t),
+        ("QuotaPeakPagedPoolUsage", c_size_t),
+        ("QuotaPagedPoolUsage", c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", c_size_t),
+        ("QuotaNonPagedPoolUsage", c_size_t),
+        ("PagefileUsage", c_size_t),
+        ("PeakPagefileUsage", c_size_t),
+    ]
+
+
+def resident_memory() -> int:
+    # bytes of memory of this process, 0 if it can't be told
+    if sys.platform == "win32":
+        from ctypes import windll
+
+        counters = ProcessMemoryCounters()
+        counters.cb = sizeof(counters)
+        process_handle = windll.kernel32.GetCurrentProcess()
+        if windll.kernel32.K32GetProcessMemoryInfo(
+            process_handle, byref(counters), counters.cb
+        ):
+            return int(counters.WorkingSetSize)
+        return 0
+    try:
+        with open("/proc/self/statm", mode="r") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+    TYPE_CHECKING,
+)
+
+from .context import context
+from .context import get_object
+from .context import get_text
+from .context import property_number
+from .error_handling import FormsException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .generic_object import BaseObject, PropertyTypes
+
+T = TypeVar("T", bound="BaseObject")
+
+# cached collections by the handle of their owner and their property number
+collections: Dict[int, Dict[int, ObjectCollection]] = {}  # type: ignore
+# the cached collection every object loaded so far belongs to
+memberships: Dict[int, ObjectCollection] = {}  # type: ignore
+
+
+class PropertyWrites(NamedTuple):
+    written: int
+    skipped: int
+
+
+def object_handle(generic_object: Optional[BaseObject]) -> int:
+    return generic_object._as_parameter_ if generic_object is not None else 0
+
+
+class ObjectCollection(Sequence[T]):
+    """Live view over the chain of objects an owner has for one property.
+
+    Objects are read from the API only as far as they are needed and kept
+    afterwards. Changes done through the wrappers are applied to the loaded
+    objects instead of reading the chain again, and replace the list, so
+    iterations already running keep going over what was there before.
+
+    Objects can also be looked up by name, case insensitive like Forms itself,
+    from an index that is built on first use and then kept up to date.
+    """
+
+    def __init__(
+        self,
+        owner: BaseObject,
+        chain: Callable[[], Iterator[T]],
+        owners: Tuple[int, ...],
+    ) -> None:
+        self.owner = owner
+        # handles of the owner and everything above it, up to its module
+        self.owners = owners
+        self._chain = chain
+        self._objects: List[T] = []
+        self._loader: Optional[Iterator[T]] = None
+        self._complete = False
+        self._names: Optional[Dict[str, T]] = None
+        self._keys: Dict[int, str] = {}
+
+    @property
+    def klass(self) -> Optional[type]:
+        return type(self._objects[0]) if self._objects else None
+
+    def load(self, count: Optional[int] = None) -> None:
+        if self._complete or (count is not None and len(self._objects) >= count):
+            return
+        if self._loader is None:
+            self._loader = self._chain()
+        for generic_object in self._loader:
+            self._objects.append(generic_object)
+            memberships[object_handle(generic_object)] = self
+            if count is not None and len(self._objects) >= count:
+                return
+        self._complete, self._loader = True, None
+
+    def invalidate(self) -> None:
+        if self._objects or self._complete:
+            self.load()
+            for generic_object in self._objects:
+                memberships.pop(object_handle(generic_object), None)
+            self._objects, self._complete = [], False
+        self._names, self._keys = None, {}
+
+    def names(self) -> Dict[str, T]:
+        if self._names is None:
+            self.load()
+            self._names, self._keys = {}, {}
+            for generic_object in self._objects:
+                self._index(generic_object, object_name(generic_object))
+        return self._names
+
+    def _index(self, generic_object: T, name: str) -> None:
+        assert self._names is not None
+        key = self._keys[object_handle(generic_object)] = name.upper()
+        self._names.setdefault(key, generic_object)
+
+    def _unindex(self, generic_object: BaseObject) -> None:
+        assert self._names is not None
+        key = self._keys.pop(object_handle(generic_object), None)
+        if key is not None and self._names.get(key) == generic_object:
+            del self._names[key]
+
+    def get(self, name: str, default: Optional[T] = None) -> Optional[T]:
+        return self.names().get(name.upper(), default)
+
+    def renamed(self, generic_object: T, name: str) -> None:
+        if self._names is not None:
+            self._unindex(generic_object)
+            self._index(generic_object, name)
+
+    def append(self, generic_object: T) -> None:
+        self.load()
+        self._objects = self._objects + [generic_object]
+        memberships[object_handle(generic_object)] = self
+        if self._names is not None:
+            self._index(generic_object, object_name(generic_object))
+
+    def remove(self, generic_object: BaseObject) -> None:
+        self.load()
+        self._objects = [obj for obj in self._objects if obj != generic_object]
+        memberships.pop(object_handle(generic_object), None)
+        if self._names is not None:
+            self._unindex(generic_object)
+
+    def move(self, generic_object: T, next_object: Optional[BaseObject]) -> None:
+        self.load()
+        objects = [obj for obj in self._objects if obj != generic_object]
+        if not next_object:
+            objects.append(generic_object)
+        elif next_object in objects:
+            objects.insert(objects.index(next_object), generic_object)  # type: ignore
+        else:
+            self.invalidate()
+            return
+        self._objects = objects
+        memberships[object_handle(generic_object)] = self
+
+    def set_all(
+        self, values: Mapping[str, PropertyTypes], skip_unchanged: bool = False
+    ) -> PropertyWrites:
+        written = skipped = 0
+        for generic_object in self:
+            writes = generic_object.set_properties(values, skip_unchanged)
+            written, skipped = written + writes.written, skipped + writes.skipped
+        return PropertyWrites(written, skipped)
+
+    def __iter__(self) -> Iterator[T]:
+        objects, index = self._objects, 0
+        while True:
+            if index >= len(objects):
+                if objects is not self._objects:
+                    return
+                self.load(index + 1)
+                if index >= len(objects):
+                    return
+            yield objects[index]
+            index += 1
+
+    def __reversed__(self) -> Iterator[T]:
+        self.load()
+        return reversed(self._objects)
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._objects)
+
+    def __bool__(self) -> bool:
+        self.load(1)
+        return bool(self._objects)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:  # type: ignore
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: str) -> T: ...  # pragma: no cover
+
+    def __getitem__(self, index: Union[int, slice, str]) -> Union[T, List[T]]:  # type: ignore
+        if isinstance(index, str):
+            return self.names()[index.upper()]
+        if isinstance(index, int) and index >= 0:
+            self.load(index + 1)
+        else:
+            self.load()
+        return self._objects[index]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+def object_name(generic_object: BaseObject) -> str:
+    name = get_text(generic_object, property_number("NAME")) or b""
+    return name.decode(context.encoding)
+
+
+def object_collection(
+    owner: BaseObject, property_number: int, chain: Callable[[], Iterator[T]]
+) -> ObjectCollection[T]:
+    handle = object_handle(owner)
+    owned = collections.get(handle)
+    if owned is None:
+        collection = ObjectCollection(owner, chain, owner_handles(handle))
+        collections[handle] = {property_number: collection}
+        return collection
+    try:
+        return owned[property_number]
+    except KeyError:
+        owners = next(iter(owned.values())).owners
+        collection = owned[property_number] = ObjectCollection(owner, chain, owners)
+        return collection
+
+
+def owner_handles(handle: int) -> Tuple[int, ...]:
+    # the handle and those of its owners, up to the module, from what is cached
+    # where it can, so objects reached through find or object properties are
+    # known to belong to their module as well
+    handles: Tuple[int, ...] = ()
+    while handle:
+        membership = memberships.get(handle)
+        if membership is not None:
+            return handles + (handle,) + membership.owners
+        owned = collections.get(handle)
+        if owned:
+            return handles + next(iter(owned.values())).owners
+        handles += (handle,)
+        try:
+            owner: Optional[int] = get_object(handle, property_number("OWNER"))  # type: ignore
+        except FormsException:
+            break
+        handle = owner or 0
+    return handles
+
+
+def owned_collections(owner: Union[BaseObject, int]) -> List[ObjectCollection]:  # type: ignore
+    handle = owner if isinstance(owner, int) else object_handle(owner)
+    return list(collections.get(handle, {}).values())
+
+
+def loaded_collection(generic_object: BaseObject) -> Optional[ObjectCollection]:  # type: ignore
+    collection = memberships.get(object_handle(generic_object))
+    if collection is None and collections:
+        # the object could still be further down a partially loaded chain
+        owner = get_object(generic_object, property_number("OWNER")) or 0
+        for owned in owned_collections(owner):
+            owned.load()
+        collection = memberships.get(object_handle(generic_object))
+    elif collection is not None:
+        collection.load()
+    return collection
+
+
+def object_renamed(generic_object: BaseObject, name: str) -> None:
+    collection = memberships.get(object_handle(generic_object))
+    if collection is not None:
+        collection.renamed(generic_object, name)
+
+
+def prepare_collections(owner: BaseObject, klass: type) -> List[ObjectCollection]:  # type: ignore
+    owned = owned_collections(owner)
+    for collection in owned:
+        if collection.klass is klass:
+            collection.load()
+    return owned
+
+
+def object_added(owned: List[ObjectCollection], generic_object: BaseObject) -> None:  # type: ignore
+    # new objects are created at the end of their chain
+    for collection in owned:
+        if collection.klass is type(generic_object):
+            collection.append(generic_object)
+        elif collection.klass is None:
+            collection.invalidate()
+
+
+def forget_collections(owner: BaseObject) -> None:
+    # objects owned by a destroyed object are gone as well, however they were
+    # reached, and their handles may get reused by the API
+    handle = object_handle(owner)
+    for owner_handle, owned in list(collections.items()):
+        if handle not in next(iter(owned.values())).owners:
+            continue
+        del collections[owner_handle]
+        context.objects.pop(owner_handle, None)
+        for collection in owned.values():
+            for generic_object in collection._objects:
+                memberships.pop(object_handle(generic_object), None)
+                context.objects.pop(object_handle(generic_object), None)
+
+
+def clear_collections() -> None:
+    collections.clear()
+    memberships.clear()
+
+
+context.destroy_hooks.append(clear_collections)
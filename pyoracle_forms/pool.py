@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import RLock
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
+
+from .misc import load_file, resident_memory
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .forms_objects import Library, Module, ObjectLibrary
+
+# modules kept loaded between uses, for tools loading the same ones over and
+# over, by path and the modification time and size of the file:
+#     pool = ModulePool(max_modules=20, max_memory=2**30)
+#     with pool.lease("module.fmb") as module:
+#         ...
+# a module that changed on disk is loaded again, and once there are more than
+# max_modules, or they are estimated to take more than max_memory bytes, the
+# least recently used ones that are not leased are destroyed.
+
+Loaded = Union["Library", "Module", "ObjectLibrary"]
+
+
+class PoolEntry:
+    __slots__ = ("module", "mtime", "size", "memory", "leases", "stale")
+
+    def __init__(self, module: Loaded, mtime: int, size: int, memory: int) -> None:
+        self.module = module
+        self.mtime, self.size = mtime, size
+        # estimated bytes of native memory the module takes
+        self.memory = memory
+        self.leases = 0
+        # changed on disk while leased, destroyed once the last lease ends
+        self.stale = False
+
+
+class ModulePool:
+    def __init__(self, max_modules: int = 16, max_memory: Optional[int] = None) -> None:
+        self.max_modules, self.max_memory = max_modules, max_memory
+        # least recently used first
+        self.entries: OrderedDict[str, PoolEntry] = OrderedDict()
+        self.lock = RLock()
+        self.hits = self.loads = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.abspath(path) in self.entries
+
+    @property
+    def memory(self) -> int:
+        return sum(entry.memory for entry in self.entries.values())
+
+    @contextmanager
+    def lease(self, path: str) -> Iterator[Loaded]:
+        # the module stays loaded, and is not evicted, until the lease ends
+        entry = self.acquire(path)
+        try:
+            yield entry.module
+        finally:
+            self.release(entry)
+
+    def acquire(self, path: str) -> PoolEntry:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and (entry.mtime, entry.size) != (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                self.discard(path)
+                entry = None
+            if entry is None:
+                entry = self.entries[path] = self.load(path, stat)
+            else:
+                self.entries.move_to_end(path)
+                self.hits += 1
+            entry.leases += 1
+            self.evict()
+            return entry
+
+    def load(self, path: str, stat: os.stat_result) -> PoolEntry:
+        before = resident_memory()
+        module = load_file(path)
+        # the growth of the process, where it can be told, else the file size
+        memory = max(resident_memory() - before, stat.st_size)
+        self.loads += 1
+        return PoolEntry(module, stat.st_mtime_ns, stat.st_size, memory)
+
+    def release(self, entry: PoolEntry) -> None:
+        with self.lock:
+            entry.leases -= 1
+            if entry.stale and not entry.leases:
+                entry.module.destroy()
+            else:
+                self.evict()
+
+    def discard(self, path: str) -> None:
+        entry = self.entries.pop(path)
+        if entry.leases:
+            entry.stale = True
+        else:
+            entry.module.destroy()
+
+    def over_budget(self) -> bool:
+        return len(self.entries) > self.max_modules or (
+            self.max_memory is not None and self.memory > self.max_memory
+        )
+
+    def evict(self) -> List[str]:
+        # paths of the modules destroyed, leased ones are kept even over budget
+        evicted = []
+        with self.lock:
+            for path in list(self.entries):
+                if not self.over_budget():
+                    break
+                if not self.entries[path].leases:
+                    self.discard(path)
+                    evicted.append(path)
+        return evicted
+
+    def clear(self) -> None:
+        with self.lock:
+            for path in list(self.entries):
+                self.discard(path)
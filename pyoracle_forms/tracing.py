@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from ctypes import c_bool, c_char_p, c_int, c_void_p, string_at
+from struct import Struct
+from time import perf_counter, perf_counter_ns
+from types import TracebackType
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from .context import ApiFunction, Instrument, api_signatures, context
+from .error_handling import TraceError
+from .fake_api import (
+    FAILURE,
+    SUCCESS,
+    CallbackAPI,
+    FakeAPI,
+    Value,
+    write_int,
+    write_pointer,
+)
+
+# every call made to the d2f library, in order, with its arguments, result code
+# and duration, written out as the calls are made:
+#     with trace("script.trace"):
+#         ...
+# and played back without the library, to time the python side alone:
+#     replay("script.trace", script)
+#
+# the file starts with the magic bytes, followed by records. a function record
+#     b"F", function id (H), name length (B), name
+# comes before the first call of a function, and a call record
+#     b"C", function id (H), result (i), nanoseconds (I), argument count (B)
+# is followed by the arguments, less the context, each one of
+#     b"N"                      None
+#     b"B", value (?)           bool
+#     b"I", value (q)           number or handle
+#     b"S", length (I), bytes   text
+#     b"O", kind, argument      written by the call, the kind being i (c_int),
+#                               b (c_bool), p (c_void_p), s (c_char_p) or t,
+#                               a text to be freed by the caller
+magic = b"PFTRACE1"
+
+function_header = Struct("<HB")
+call_header = Struct("<HiIB")
+int64 = Struct("<q")
+boolean = Struct("<?")
+length = Struct("<I")
+max_duration = 2**32 - 1
+
+output_kinds = {c_int: b"i", c_bool: b"b", c_void_p: b"p", c_char_p: b"s"}
+# entry points writing out a text the caller frees, rather than a handle
+text_functions = {"d2fobgt_GetTextProp"}
+# the package caches what these answer, so a replay does not always repeat them
+constant_functions = {
+    "d2fobgcn_GetConstName",
+    "d2fobgcv_GetConstValue",
+    "d2fprgcn_GetConstName",
+    "d2fprgcv_GetConstValue",
+    "d2fprgn_GetName",
+    "d2fprgt_GetType",
+}
+
+
+class Output(NamedTuple):
+    kind: str
+    value: Value
+
+
+class TraceRecord(NamedTuple):
+    function: str
+    arguments: Tuple[object, ...]
+    result: int
+    # nanoseconds
+    duration: int
+
+
+class ReplayStats(NamedTuple):
+    calls: int
+    # seconds spent in the library while recording
+    native: float
+    # seconds the script took in the replay, less answering from the trace
+    python: float
+
+
+def encode_value(value: object) -> bytes:
+    value = getattr(value, "_as_parameter_", value)
+    if isinstance(value, (c_void_p, c_int, c_bool, c_char_p)):
+        value = value.value
+    if value is None:
+        return b"N"
+    if isinstance(value, bool):
+        return b"B" + boolean.pack(value)
+    if isinstance(value, int):
+        return b"I" + int64.pack(value)
+    if isinstance(value, bytes):
+        return b"S" + length.pack(len(value)) + value
+    raise TraceError(f"can not record {value!r}")
+
+
+def encode_argument(argument: object, text: bool) -> bytes:
+    # out-parameters are passed byref, what the call wrote is in their _obj
+    written = getattr(argument, "_obj", None)
+    if written is None:
+        return encode_value(argument)
+    value = written.value
+    if text:
+        return b"Ot" + encode_value(string_at(value) if value else None)
+    return b"O" + output_kinds[type(written)] + encode_value(value)
+
+
+class TraceWriter:
+    def __init__(self, path: str) -> None:
+        self.file: BinaryIO = open(path, mode="wb", buffering=1 << 16)
+        self.file.write(magic)
+        self.function_ids: Dict[str, int] = {}
+        self.calls = 0
+
+    def write_call(
+        self,
+        function: str,
+        arguments: Sequence[object],
+        result: int,
+        duration: int,
+        text: bool = False,
+    ) -> None:
+        try:
+            function_id = self.function_ids[function]
+        except KeyError:
+            function_id = self.function_ids[function] = len(self.function_ids)
+            name = function.encode()
+            self.file.write(b"F" + function_header.pack(function_id, len(name)) + name)
+        header = call_header.pack(
+            function_id, result, min(duration, max_duration), len(arguments)
+        )
+        encoded = [encode_argument(argument, text) for argument in arguments]
+        self.file.write(b"".join((b"C", header, *encoded)))
+        self.calls += 1
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self) -> TraceWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def recorder(writer: TraceWriter) -> Instrument:
+    def record(api_function_name: str, func: ApiFunction) -> ApiFunction:
+        text = api_function_name in text_functions
+
+        def _record(ctx: object, *arguments: object) -> int:
+            start = perf_counter_ns()
+            result = func(ctx, *arguments)
+            duration = perf_counter_ns() - start
+            writer.write_call(api_function_name, arguments, result, duration, text)
+            return result
+
+        return _record
+
+    return record
+
+
+# the trace being recorded, and the instrument writing it
+recording: List[Tuple[TraceWriter, Instrument]] = []
+
+
+def start_trace(path: str) -> None:
+    if recording:
+        raise TraceError("a trace is being recorded already")
+    writer = TraceWriter(path)
+    instrument = recorder(writer)
+    recording.append((writer, instrument))
+    context.add_instrument(instrument)
+
+
+def stop_trace() -> int:
+    # the number of calls recorded
+    if not recording:
+        return 0
+    writer, instrument = recording.pop()
+    context.remove_instrument(instrument)
+    writer.close()
+    return writer.calls
+
+
+@contextmanager
+def trace(path: str) -> Iterator[None]:
+    start_trace(path)
+    try:
+        yield
+    finally:
+        stop_trace()
+
+
+def read_exact(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise TraceError("trace ends in the middle of a record")
+    return data
+
+
+def read_argument(file: BinaryIO) -> object:
+    tag = read_exact(file, 1)
+    if tag == b"N":
+        return None
+    if tag == b"B":
+        return boolean.unpack(read_exact(file, boolean.size))[0]
+    if tag == b"I":
+        return int64.unpack(read_exact(file, int64.size))[0]
+    if tag == b"S":
+        (size,) = length.unpack(read_exact(file, length.size))
+        return read_exact(file, size)
+    if tag == b"O":
+        kind = read_exact(file, 1).decode()
+        return Output(kind, read_argument(file))  # type: ignore
+    raise TraceError(f"unknown argument {tag!r} in trace")
+
+
+def read_trace(path: str) -> Iterator[TraceRecord]:
+    # one record at a time, traces can be far larger than memory
+    with open(path, mode="rb", buffering=1 << 16) as file:
+        if file.read(len(magic)) != magic:
+            raise TraceError(f"{path} is not a trace")
+        functions: Dict[int, str] = {}
+        while True:
+            tag = file.read(1)
+            if not tag:
+                return
+            if tag == b"F":
+                function_id, size = function_header.unpack(
+                    read_exact(file, function_header.size)
+                )
+                functions[function_id] = read_exact(file, size).decode()
+            elif tag == b"C":
+                function_id, result, duration, count = call_header.unpack(
+                    read_exact(file, call_header.size)
+                )
+                arguments = tuple(read_argument(file) for _ in range(count))
+                yield TraceRecord(functions[function_id], arguments, result, duration)
+            else:
+                raise TraceError(f"unknown record {tag!r} in {path}")
+
+
+def matches(recorded: Sequence[object], arguments: Sequence[object]) -> bool:
+    if len(recorded) != len(arguments):
+        return False
+    for expected, argument in zip(recorded, arguments):
+        if isinstance(expected, Output):
+            if not argument:
+                return False
+        elif expected is None:
+            if argument:
+                return False
+        elif isinstance(expected, bytes) and isinstance(argument, int):
+            # a text passed as c_void_p arrives as its address
+            if string_at(argument) != expected:
+                return False
+        elif argument != expected:
+            return False
+    return True
+
+
+class ReplayAPI(CallbackAPI):
+    # answers every call from a trace, in the order recorded, for replay
+    def __init__(self, path: str, version: str = "12c") -> None:
+        self.records = read_trace(path)
+        self.next_record: Optional[TraceRecord] = None
+        # constant lookups from the trace, by function and argument
+        self.constant_records: Dict[Tuple[str, object], TraceRecord] = {}
+        # answers lookups the recorded script had cached before the trace began
+        self.fake = FakeAPI(version)
+        self.calls, self.native, self.elapsed = 0, 0, 0.0
+        self.divergence: Optional[str] = None
+        super().__init__({name: self.replayer(name) for name in api_signatures})
+
+    def replayer(self, api_function_name: str) -> Callable[..., int]:  # type: ignore
+        if api_function_name in constant_functions:
+            answer = self.replay_constant
+        else:
+            answer = self.replay_call
+
+        def _replay(ctx: int, *arguments: object) -> int:
+            start = perf_counter()
+            try:
+                return answer(api_function_name, ctx, arguments)
+            finally:
+                self.elapsed += perf_counter() - start
+
+        return _replay
+
+    def peek(self) -> Optional[TraceRecord]:
+        if self.next_record is None:
+            self.next_record = next(self.records, None)
+        return self.next_record
+
+    def consume(self, record: TraceRecord) -> None:
+        self.next_record = None
+        self.calls += 1
+        self.native += record.duration
+        if record.function in constant_functions:
+            self.constant_records[record.function, record.arguments[0]] = record
+
+    def replay_call(
+        self, function: str, ctx: int, arguments: Tuple[object, ...]
+    ) -> int:
+        if self.divergence is not None:
+            return SUCCESS if function == "d2fctxde_Destroy" else FAILURE
+        record = self.peek()
+        while record is not None and record.function in constant_functions:
+            # looked up while recording, but cached by now
+            self.consume(record)
+            record = self.peek()
+        if record is None and function == "d2fctxde_Destroy":
+            return SUCCESS
+        if (
+            record is None
+            or record.function != function
+            or not matches(record.arguments, arguments)
+        ):
+            expected = f"{record.function}{record.arguments}" if record else "nothing"
+            self.divergence = (
+                f"call {self.calls + 1} is {function}{arguments}, "
+                f"the trace has {expected}"
+            )
+            return FAILURE
+        self.consume(record)
+        return self.answer(record, arguments)
+
+    def replay_constant(
+        self, function: str, ctx: int, arguments: Tuple[object, ...]
+    ) -> int:
+        record = self.peek()
+        if (
+            record is not None
+            and record.function == function
+            and matches(record.arguments, arguments)
+        ):
+            self.consume(record)
+            return self.answer(record, arguments)
+        try:
+            return self.answer(self.constant_records[function, arguments[0]], arguments)
+        except KeyError:
+            return int(getattr(self.fake, function)(ctx, *arguments))
+
+    def answer(self, record: TraceRecord, arguments: Tuple[object, ...]) -> int:
+        for recorded, argument in zip(record.arguments, arguments):
+            if isinstance(recorded, Output):
+                self.write_output(recorded, argument)  # type: ignore
+        return record.result
+
+    def write_output(self, output: Output, address: int) -> None:
+        kind, value = output
+        if kind == "i":
+            write_int(address, value)  # type: ignore
+        elif kind == "b":
+            c_bool.from_address(address).value = bool(value)
+        elif kind == "p":
+            write_pointer(address, value)  # type: ignore
+        elif kind == "s" and value is not None:
+            self.write_constant(address, value)  # type: ignore
+        elif kind == "s":
+            write_pointer(address, None)
+        else:
+            self.write_text(address, value)  # type: ignore
+
+    def remaining(self) -> int:
+        # calls left in the trace, other than lookups and destroying the context
+        left = 0
+        record = self.peek()
+        while record is not None:
+            self.next_record = None
+            if record.function not in constant_functions | {"d2fctxde_Destroy"}:
+                left += 1
+            record = self.peek()
+        return left
+
+
+def replay(
+    path: str,
+    script: Callable[[], object],
+    version: str = "12c",
+    encoding: str = "utf-8",
+) -> ReplayStats:
+    # runs script in a context of its own, answered from the trace at path
+    from . import initialize_context
+
+    if context:
+        raise TraceError("replay needs a context of its own, destroy the current one")
+    api = ReplayAPI(path, version)
+    initialize_context(version=version, encoding=encoding, api=api)
+
+    start = perf_counter()
+    try:
+        script()
+    except Exception as error:
+        if api.divergence is not None:
+            raise TraceError(api.divergence) from error
+        raise
+    finally:
+        elapsed, answering = perf_counter() - start, api.elapsed
+        # whatever the trace has left, destroying the context is not one of them
+        left = api.remaining()
+        context.destroy_context()
+
+    if api.divergence is None and left:
+        api.divergence = f"the script made {api.calls} calls, the trace has {left} more"
+    if api.divergence is not None:
+        raise TraceError(api.divergence)
+    return ReplayStats(api.calls, api.native / 1e9, elapsed - answering)
@@ -1,3 +1,4 @@
+import os
 import shutil
 
 import pytest
@@ -14,6 +15,7 @@ from pyoracle_forms import (
     Library,
 )
 from pyoracle_forms import context as ctx
+from pyoracle_forms import FakeAPI
 
 
 @pytest.fixture(scope="session")
@@ -23,6 +25,77 @@ def context():
     ctx.destroy_context()
 
 
+@pytest.fixture
+def fake_api():
+    if ctx:
+        pytest.skip("context is initialized on the Oracle Forms API already")
+    api = FakeAPI()
+    initialize_context(api=api)
+    yield api
+    ctx.destroy_context()
+
+
+@pytest.fixture
+def fake_module(fake_api):
+    with Module.create("FAKE_MODULE") as module:
+        yield module
+
+
+@pytest.fixture
+def fake_block(fake_module):
+    block = DataBlock.create(fake_module, "FAKE_BLOCK")
+    for name in ("FIRST", "SECOND", "THIRD"):
+        Item.create(block, name)
+    return block
+
+
+# module level, so batch workers can unpickle them
+def read_block_names(module):
+    return [data_block.name for data_block in module.data_blocks]
+
+
+def read_process_id(module):
+    return os.getpid()
+
+
+@pytest.fixture
+def block_names():
+    return read_block_names
+
+
+@pytest.fixture
+def process_id():
+    return read_process_id
+
+
+@pytest.fixture
+def save_module(fake_api):
+    def _save_module(path, *blocks, name="SAVED_MODULE"):
+        with Module.create(name) as module:
+            for block in blocks:
+                DataBlock.create(module, block)
+            module.save(str(path))
+        return str(path)
+
+    return _save_module
+
+
+@pytest.fixture
+def modules(save_module, tmp_path):
+    # paths of count saved modules, MODULE_<n> with the one block BLOCK_<n>
+    def _modules(count):
+        return [
+            save_module(
+                tmp_path / f"module_{number}.fmb",
+                f"BLOCK_{number}",
+                name=f"MODULE_{number}",
+            )
+            for number in range(count)
+        ]
+
+    return _modules
+
+
 @pytest.fixture(scope="session")
 def module(context):
     with Module.load(path="./tests/test_modules/simple_module.fmb") as module:
@@ -0,0 +1,85 @@
+import os
+import time
+
+import pytest
+
+from pyoracle_forms import FakeAPI, Module, batch
+
+
+def rename_blocks(module):
+    for data_block in module.data_blocks:
+        data_block.name = f"{data_block.name}_RENAMED"
+
+
+def hang_or_exit(module):
+    if module.name == "MODULE_1":
+        time.sleep(60)
+    if module.name == "MODULE_2":
+        os._exit(3)
+    return module.name
+
+
+def test_map(modules, block_names):
+    paths = modules(4)
+
+    results = list(batch.map(block_names, paths, workers=2, api_factory=FakeAPI))
+
+    assert sorted(result.path for result in results) == paths
+    assert all(result.ok for result in results)
+    assert {result.path: result.result for result in results} == {
+        path: [f"BLOCK_{number}"] for number, path in enumerate(paths)
+    }
+
+
+def test_map_saves(modules, block_names):
+    paths = modules(2)
+
+    for result in batch.map(
+        rename_blocks, paths, workers=2, save=True, api_factory=FakeAPI
+    ):
+        assert result.ok
+
+    with Module.load(paths[1]) as module:
+        assert block_names(module) == ["BLOCK_1_RENAMED"]
+
+
+def test_map_errors(tmp_path, modules, block_names):
+    paths = modules(1) + [str(tmp_path / "missing.fmb")]
+
+    results = {
+        result.path: result
+        for result in batch.map(block_names, paths, workers=2, api_factory=FakeAPI)
+    }
+
+    assert results[paths[0]].ok
+    assert not results[paths[1]].ok
+    assert "FormsException" in results[paths[1]].error
+    assert "Traceback" in results[paths[1]].traceback
+
+
+@pytest.mark.parametrize("recycle", [{"max_modules": 2}, {"max_memory": 1}])
+def test_map_recycles_workers(modules, process_id, recycle):
+    paths = modules(4)
+
+    results = list(
+        batch.map(process_id, paths, workers=1, api_factory=FakeAPI, **recycle)
+    )
+
+    modules_per_worker = recycle.get("max_modules", 1)
+    assert len({result.result for result in results}) == 4 / modules_per_worker
+
+
+def test_map_replaces_hung_and_crashed_workers(modules):
+    paths = modules(4)
+
+    results = {
+        result.path: result
+        for result in batch.map(
+            hang_or_exit, paths, workers=2, timeout=2, api_factory=FakeAPI
+        )
+    }
+
+    assert results[paths[0]].result == "MODULE_0"
+    assert results[paths[1]].error == "timed out after 2 seconds"
+    assert results[paths[2]].error == "worker exited with code 3"
+    assert results[paths[3]].result == "MODULE_3"
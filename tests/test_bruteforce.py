@@ -1,6 +1,7 @@
 import inspect
 
 from pyoracle_forms.generic_object import BaseObject
+from pyoracle_forms.object_collection import ObjectCollection
 
 
 def get_user_attributes(cls):
@@ -16,19 +17,14 @@ def test_bruteforce(module):
     traversed_objects = set()
 
     def traverse_object(obj):
-        try:
-            pointer = obj._as_parameter_.value
-        except AttributeError:
-            pointer = obj._as_parameter_
-
-        if pointer in traversed_objects or (pointer or 0) == 0:
+        if not obj or obj in traversed_objects:
             return
 
-        traversed_objects.add(pointer)
+        traversed_objects.add(obj)
         attributes = get_user_attributes(obj)
 
         for (name, data) in attributes:
-            if isinstance(data, list):
+            if isinstance(data, (list, ObjectCollection)):
                 for item in data:
                     traverse_object(item)
             elif isinstance(data, BaseObject):
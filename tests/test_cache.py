@@ -0,0 +1,133 @@
+import os
+from functools import partial
+
+import pytest
+
+from pyoracle_forms import FakeAPI, batch
+from pyoracle_forms.cache import ResultCache, function_identity
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / "cache"))
+
+
+def test_apply(fake_api, tmp_path, save_module, block_names, cache):
+    path = save_module(tmp_path / "module.fmb", "BLOCK")
+
+    assert cache.apply(block_names, path) == ["BLOCK"]
+    calls = fake_api.api_calls
+    assert cache.apply(block_names, path) == ["BLOCK"]
+
+    # not even loaded
+    assert fake_api.api_calls == calls
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_unpicklable_result(tmp_path, save_module, cache):
+    path = save_module(tmp_path / "module.fmb", "BLOCK")
+
+    def reader(module):
+        name = module.name
+        return lambda: name
+
+    assert cache.apply(reader, path)() == "SAVED_MODULE"
+    assert cache.apply(reader, path)() == "SAVED_MODULE"
+
+    assert cache.misses == 2
+    assert os.listdir(os.path.dirname(cache.entry_path(cache.key(path, reader)))) == []
+
+
+def test_keyed_by_content_and_function(
+    tmp_path, save_module, block_names, process_id, cache
+):
+    path = save_module(tmp_path / "module.fmb", "BLOCK")
+    cache.apply(block_names, path)
+
+    save_module(path, "CHANGED")
+
+    assert cache.apply(block_names, path) == ["CHANGED"]
+    assert cache.key(path, block_names) != cache.key(path, process_id)
+
+
+def make_reader(limit):
+    def reader(module):
+        return module.data_blocks[:limit]
+
+    return reader
+
+
+def reader_with_default(module, limit=10):
+    return module.data_blocks[:limit]
+
+
+def reader_with_keyword(module, *, limit=10):
+    return module.data_blocks[:limit]
+
+
+def test_keyed_by_closure_and_defaults():
+    assert function_identity(make_reader(10)) == function_identity(make_reader(10))
+    assert function_identity(make_reader(10)) != function_identity(make_reader(20))
+
+    identity = function_identity(reader_with_default)
+    reader_with_default.__defaults__ = (20,)
+    assert function_identity(reader_with_default) != identity
+    reader_with_default.__defaults__ = (10,)
+
+    identity = function_identity(reader_with_keyword)
+    reader_with_keyword.__kwdefaults__ = {"limit": 20}
+    assert function_identity(reader_with_keyword) != identity
+    reader_with_keyword.__kwdefaults__ = {"limit": 10}
+
+
+def test_keyed_by_partial_arguments():
+    identity = function_identity(partial(reader_with_default, limit=1))
+
+    assert identity == function_identity(partial(reader_with_default, limit=1))
+    assert identity != function_identity(partial(reader_with_default, limit=2))
+    assert "0x" not in identity
+
+
+def test_explicit_version(tmp_path, save_module, block_names, cache):
+    path = save_module(tmp_path / "module.fmb", "BLOCK")
+
+    assert cache.key(path, block_names) != cache.key(path, block_names, version="2")
+    cache.apply(block_names, path, version="2")
+    cache.apply(block_names, path, version="3")
+    assert cache.misses == 2
+
+    versioned = ResultCache(cache.directory, version="3")
+    assert versioned.apply(block_names, path) == ["BLOCK"]
+    assert versioned.hits == 1
+
+
+def test_evicts_least_recently_used(modules, block_names, cache):
+    paths = modules(3)
+    cache.apply(block_names, paths[0])
+    entry_size = cache.entries()[0][1]
+    cache.max_size = entry_size * 2
+    cache.apply(block_names, paths[1])
+    os.utime(cache.entry_path(cache.key(paths[0], block_names)), (0, 0))
+    os.utime(cache.entry_path(cache.key(paths[1], block_names)), (1, 1))
+
+    cache.apply(block_names, paths[2])
+
+    assert len(cache.entries()) == 2
+    assert not os.path.exists(cache.entry_path(cache.key(paths[0], block_names)))
+
+
+def test_batch(modules, process_id, cache):
+    # modules of different content, the same would share their result
+    paths = modules(2)
+
+    def run():
+        return {
+            result.path: result.result
+            for result in batch.map(
+                process_id, paths, 2, api_factory=FakeAPI, cache=cache
+            )
+        }
+
+    assert run() == run()
+    with pytest.raises(ValueError):
+        next(batch.map(process_id, paths, save=True, cache=cache))
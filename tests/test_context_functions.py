@@ -1,6 +1,12 @@
 from pyoracle_forms.context import object_name
 from pyoracle_forms.context import object_number
 from pyoracle_forms.context import property_type
+from pyoracle_forms.context import api_signatures
+from pyoracle_forms.context import property_constant_number
+from pyoracle_forms.context import property_numbers
+from pyoracle_forms import context as ctx
+from pyoracle_forms import Item
+from pyoracle_forms.misc import object_classes
 
 
 def test_object_name():
@@ -13,3 +19,16 @@ def test_object_number():
 
 def test_property_type():
     assert property_type(167) == 2
+
+
+def test_api_functions_are_bound(context):
+    assert set(api_signatures) <= set(ctx.functions)
+
+
+def test_property_numbers_match_api(context):
+    for constant in ("NAME", "NEXT", "ITEM", "TRG_TXT"):
+        assert property_numbers[constant] == property_constant_number(constant)
+
+
+def test_object_classes_indexed_by_number(context):
+    assert object_classes[object_number("ITEM")] is Item
@@ -1,10 +1,126 @@
+import os
+
 import pytest
-from pyoracle_forms.forms_api import find_dll, dlls
+from pyoracle_forms import DLLNotFoundError
+from pyoracle_forms.forms_api import (
+    find_dll,
+    dll_cache_file,
+    read_dll_cache,
+    dlls,
+    api_metadata,
+    read_api_objects,
+)
+
+
+@pytest.fixture
+def search_path(tmp_path, monkeypatch):
+    directories = [tmp_path / name for name in ("first", "second", "third")]
+    for directory in directories:
+        directory.mkdir()
+    (directories[1] / "frmd2f.dll").touch()
+    (directories[2] / "frmd2f.dll").touch()
+
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    monkeypatch.delenv("PYORACLE_FORMS_DLL_PATH", raising=False)
+    monkeypatch.setenv("PATH", os.pathsep.join(map(str, directories)))
+    return directories
 
 
-def test_dll_not_exists():
+def test_dll_not_exists(search_path):
     with pytest.raises(ImportError):
         dlls("6i")
+    assert not os.path.exists(dll_cache_file())
+
+
+def test_find_dll_by_file_path(search_path):
+    dll_file = str(search_path[2] / "frmd2f.dll")
+
+    assert find_dll("frmd2f.dll", dll_file) == str(search_path[2])
+
+
+def test_find_dll_on_path(search_path):
+    assert find_dll("frmd2f.dll") == str(search_path[1])
+    assert read_dll_cache()["frmd2f.dll"]["directory"] == str(search_path[1])
+
+
+def test_find_dll_from_cache(search_path, monkeypatch):
+    find_dll("frmd2f.dll")
+
+    scanned = []
+    monkeypatch.setattr(
+        "pyoracle_forms.forms_api.exists",
+        lambda path: scanned.append(path) or os.path.exists(path),
+    )
+    assert find_dll("frmd2f.dll") == str(search_path[1])
+    assert len(scanned) == 1
+
+
+def test_find_dll_cache_keyed_on_path(search_path, monkeypatch):
+    find_dll("frmd2f.dll")
+    monkeypatch.setenv("PATH", str(search_path[2]))
+
+    assert find_dll("frmd2f.dll") == str(search_path[2])
+
+
+def test_find_dll_cache_stale(search_path):
+    find_dll("frmd2f.dll")
+    (search_path[1] / "frmd2f.dll").unlink()
+
+    assert find_dll("frmd2f.dll") == str(search_path[2])
+
+
+def test_find_dll_broken_cache(search_path):
+    os.makedirs(os.path.dirname(dll_cache_file()))
+    with open(dll_cache_file(), mode="w") as file:
+        file.write("{")
+
+    assert find_dll("frmd2f.dll") == str(search_path[1])
+
+
+def test_find_dll_explicit_path(search_path, monkeypatch):
+    assert find_dll("frmd2f.dll", str(search_path[2])) == str(search_path[2])
+
+    monkeypatch.setenv("PYORACLE_FORMS_DLL_PATH", str(search_path[2]))
+    assert find_dll("frmd2f.dll") == str(search_path[2])
+
+
+def test_dll_not_found_lists_directories(search_path):
+    with pytest.raises(DLLNotFoundError) as error:
+        dlls("6i")
+
+    assert error.value.dll_name == "ifd2f60.dll"
+    assert error.value.searched == list(map(str, search_path))
+    assert str(search_path[0]) in str(error.value)
+
+
+@pytest.mark.parametrize("version", ["6i", "10g", "12c"])
+def test_metadata_matches_parsed_headers(version):
+    metadata = api_metadata(version)
+    api_objects = read_api_objects(version)
+
+    assert metadata.property_numbers == {
+        api_property["macro_name"][5:]: api_property["property_number"]
+        for api_object in api_objects.values()
+        for api_property in api_object["properties"]
+    }
+    assert metadata.supported_properties == {
+        api_object["object_number"]: sum(
+            {
+                1 << api_property["property_number"]
+                for api_property in api_object["properties"]
+            }
+        )
+        for name, api_object in api_objects.items()
+        if name != "D2FFO_ANY"
+    }
+    assert metadata.property_types == {
+        api_property["property_number"]: api_property["data_type"]
+        for api_object in api_objects.values()
+        for api_property in api_object["properties"]
+    }
+    assert metadata.object_numbers == {
+        name: api_object["object_number"] for name, api_object in api_objects.items()
+    }
 
 
 # find_dll("")
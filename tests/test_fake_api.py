@@ -0,0 +1,179 @@
+import pytest
+
+from pyoracle_forms import (
+    Canvas,
+    DataBlock,
+    FormsException,
+    FormsObjects,
+    Item,
+    Module,
+    Trigger,
+    FakeAPI,
+    initialize_context,
+)
+from pyoracle_forms import context as ctx
+from pyoracle_forms.context import property_type, object_name, property_number
+from pyoracle_forms.object_collection import collections, memberships
+
+
+def names(objects):
+    return [generic_object.name for generic_object in objects]
+
+
+def test_traverse(fake_module, fake_block):
+    assert names(fake_module.data_blocks) == ["FAKE_BLOCK"]
+    assert names(fake_block.items) == ["FIRST", "SECOND", "THIRD"]
+    assert fake_block.items[1].next_object == fake_block.items[2]
+    assert isinstance(fake_block.items[0], Item)
+
+
+def test_properties(fake_module, fake_block):
+    canvas = Canvas.create(fake_module, "FAKE_CANVAS")
+    item = fake_block.items[0]
+
+    item.prompt = "Prompt"
+    item.enabled = True
+    item.maximum_length = 10
+    item.canvas_object_pointer = canvas
+
+    assert item.get_properties(["prompt", "enabled", "maximum_length"]) == {
+        "prompt": "Prompt",
+        "enabled": True,
+        "maximum_length": 10,
+    }
+    assert item.canvas_object_pointer == canvas
+
+
+def test_texts_are_freed(fake_api, fake_block):
+    assert names(fake_block.items)
+    assert not fake_api.allocated
+
+
+def test_move_duplicate_destroy(fake_block):
+    first, second, third = fake_block.items
+
+    third.move(first)
+    assert names(fake_block.items) == ["THIRD", "FIRST", "SECOND"]
+
+    second.destroy()
+    Item.create(fake_block, "FOURTH")
+    assert names(fake_block.items) == ["THIRD", "FIRST", "FOURTH"]
+
+
+def test_destroyed_keeps_hash(fake_block):
+    first, second, _ = fake_block.items
+    objects = {first, second}
+    names_by_object = {first: "FIRST", second: "SECOND"}
+    handle = first._as_parameter_
+
+    first.destroy()
+    second.destroy()
+
+    assert first in objects and second in objects
+    assert names_by_object[first] == "FIRST"
+    assert first == first and first != second
+    assert first != Item(handle)
+
+
+def test_destroy_other_module(fake_module, fake_block):
+    items = fake_block.items
+    other = Module.create("OTHER_MODULE")
+    DataBlock.create(other, "OTHER_BLOCK").items
+    other.destroy()
+
+    assert fake_block.items is items
+    Item.create(fake_block, "FOURTH")
+    assert names(items) == ["FIRST", "SECOND", "THIRD", "FOURTH"]
+    assert fake_module.data_blocks[0] is fake_block
+
+
+def test_find(fake_module, fake_block):
+    assert fake_module.find("fake_block.second") == fake_block.items[1]
+    with pytest.raises(FormsException):
+        fake_block.find_object("MISSING", FormsObjects.item)
+
+
+def test_find_in_destroyed_object(fake_module, fake_block):
+    fake_block.destroy()
+    with pytest.raises(FormsException) as raised:
+        fake_block.find("SECOND")
+    assert raised.value.args[0] == 10
+
+
+def test_has_property(fake_block):
+    item = fake_block.items[0]
+
+    assert item.has_property(property_number("MAX_LEN"))
+    assert not fake_block.has_property(property_number("MAX_LEN"))
+
+
+@pytest.mark.parametrize("name, value", [("items", []), ("case_info", None)])
+def test_set_read_only_property_writes_nothing(fake_block, name, value):
+    fake_block.comments = "before"
+
+    with pytest.raises(AttributeError):
+        fake_block.set_properties({"comments": "after", name: value})
+
+    assert fake_block.comments == "before"
+
+
+def test_constants(fake_api):
+    assert object_name(1) == "ALERT"
+    assert property_type(167) == 2
+
+
+def test_save_and_load(tmp_path, fake_module, fake_block):
+    fake_block.items[1].prompt = "Saved"
+    fake_block.items[1].canvas_object_pointer = Canvas.create(fake_module, "CANVAS")
+    path = str(tmp_path / "fake_module.fmb")
+
+    fake_module.save(path)
+
+    with Module.load(path) as loaded:
+        block = loaded.data_blocks[0]
+        assert names(block.items) == ["FIRST", "SECOND", "THIRD"]
+        assert block.items[1].prompt == "Saved"
+        assert block.items[1].canvas_object_pointer == loaded.canvases[0]
+
+
+def test_load_missing_file(fake_api, tmp_path):
+    with pytest.raises(FormsException):
+        Module.load(str(tmp_path / "missing.fmb"))
+
+
+def test_switch_versions(fake_api):
+    with Module.create("MODULE") as module:
+        Item.create(DataBlock.create(module, "BLOCK"), "ITEM").prompt = "12c"
+    ctx.destroy_context()
+
+    api = FakeAPI("6i")
+    initialize_context(version="6i", api=api)
+    with Module.create("MODULE") as module:
+        item = Item.create(DataBlock.create(module, "BLOCK"), "ITEM")
+        item.prompt = "6i"
+
+        properties = api.objects[item._as_parameter_].properties
+        assert properties[api.property_numbers["PRMPT"]] == b"6i"
+        assert item.prompt == "6i"
+
+
+def test_collections_do_not_outlive_the_context(fake_api):
+    module = Module.create("MODULE")
+    DataBlock.create(module, "BLOCK")
+    assert names(module.data_blocks) == ["BLOCK"]
+    ctx.destroy_context()
+
+    initialize_context(api=FakeAPI())
+    assert names(Module.create("MODULE").data_blocks) == []
+
+
+def test_destroy_forgets_collections_of_found_objects(fake_api):
+    module = Module.create("MODULE")
+    item = Item.create(DataBlock.create(module, "EMP"), "SAL")
+    Trigger.create(item, "WHEN-VALIDATE-ITEM")
+
+    assert names(module.find("EMP.SAL").triggers) == ["WHEN-VALIDATE-ITEM"]
+    module.destroy()
+
+    assert collections == {}
+    assert memberships == {}
@@ -1,2 +1,20 @@
 def test_repr(item):
     assert str(item)  # forgive me
+
+
+def test_same_handle_same_wrapper(data_block, item):
+    assert item.owning_object is item.owning_object
+    assert data_block.items[0] is item
+
+
+def test_wrappers_are_hashable(data_block):
+    items = set(data_block.items)
+
+    assert len(items) == len(data_block.items)
+    assert data_block.items[0] in items
+
+
+def test_wrappers_have_no_instance_dict(module, item):
+    assert not hasattr(item, "__dict__")
+    assert not hasattr(module, "__dict__")
+    assert isinstance(item._as_parameter_, int)
@@ -52,3 +52,70 @@ def test_null_assignment(new_canvas):
 def test_cant_set_subobject_list(new_canvas):
     with pytest.raises(AttributeError):
         new_canvas.graphics = []
+
+
+def test_get_properties(new_item):
+    new_item.width = 10
+    new_item.database_item = True
+
+    assert new_item.get_properties(["width", "name", "database_item"]) == {
+        "width": 10,
+        "name": "ITM",
+        "database_item": True,
+    }
+
+
+def test_get_all_properties(item):
+    properties = item.get_properties()
+
+    assert properties["name"] == item.name
+    assert properties == {name: getattr(item, name) for name in properties}
+
+
+def test_get_unknown_property(new_item):
+    with pytest.raises(AttributeError):
+        new_item.get_properties(["no_such_property"])
+
+
+def test_set_properties(new_item):
+    writes = new_item.set_properties({"width": 10, "database_item": False})
+
+    assert writes == (2, 0)
+    assert new_item.width == 10
+    assert not new_item.database_item
+
+
+def test_set_properties_skips_unchanged(new_item):
+    new_item.width = 10
+
+    writes = new_item.set_properties({"width": 10, "height": 20}, skip_unchanged=True)
+
+    assert writes.written == 1
+    assert writes.skipped == 1
+    assert new_item.height == 20
+
+
+def test_set_unknown_property_writes_nothing(new_item):
+    new_item.width = 10
+
+    with pytest.raises(AttributeError):
+        new_item.set_properties({"width": 20, "no_such_property": 1})
+
+    assert new_item.width == 10
+
+
+def test_set_all(new_data_block, make_item):
+    for i in range(3):
+        make_item(new_data_block, f"ITM_{i}")
+    new_data_block.items[0].width = 10
+
+    writes = new_data_block.items.set_all({"width": 10}, skip_unchanged=True)
+
+    assert writes == (2, 1)
+    assert all(item.width == 10 for item in new_data_block.items)
+
+
+def test_text_read_repeatedly(new_item):
+    new_item.column_name = "COLUMN"
+
+    assert all(new_item.column_name == "COLUMN" for _ in range(1000))
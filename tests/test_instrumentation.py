@@ -0,0 +1,63 @@
+import pytest
+
+from pyoracle_forms import (
+    FormsException,
+    disable_stats,
+    enable_stats,
+    reset_stats,
+    stats,
+)
+from pyoracle_forms import context as ctx
+from pyoracle_forms.misc import Text
+
+
+@pytest.fixture
+def instrumented(fake_api):
+    reset_stats()
+    enable_stats()
+    yield
+    disable_stats()
+    reset_stats()
+
+
+def test_counts_calls(instrumented, fake_block):
+    item = fake_block.items[0]
+    reset_stats()
+
+    item.prompt = "Prompt"
+    assert item.prompt == "Prompt"
+    assert item.prompt == "Prompt"
+
+    functions, descriptors = stats()
+    assert functions["d2fobgt_GetTextProp"].calls == 2
+    assert functions["d2fobst_SetTextProp"].calls == 1
+    assert descriptors['Text("PRMPT")'].calls == 3
+    assert descriptors['Text("PRMPT")'].total >= descriptors['Text("PRMPT")'].maximum
+
+
+def test_counts_errors(instrumented, fake_block):
+    with pytest.raises(FormsException):
+        fake_block.find_object("MISSING", fake_block.items[0].object_type)
+
+    assert stats().functions["d2fobfo_FindObj"].errors == 1
+
+
+def test_reset(instrumented, fake_block):
+    assert fake_block.name
+    reset_stats()
+
+    assert stats().functions == {}
+    assert stats().descriptors == {}
+
+
+def test_disabled(fake_block):
+    text_getter = vars(Text)["__get__"]
+    reset_stats()
+    enable_stats()
+    disable_stats()
+
+    assert fake_block.items[0].name
+    assert stats().functions == {}
+    assert stats().descriptors == {}
+    assert vars(Text)["__get__"] is text_getter
+    assert not ctx.instruments
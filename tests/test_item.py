@@ -3,6 +3,7 @@ import pytest
 from pyoracle_forms import Justification
 from pyoracle_forms import Properties, FormsObjects
 from pyoracle_forms import Item, FormsException
+from pyoracle_forms.context import has_property
 
 
 def test_item_has_name(item):
@@ -27,6 +28,15 @@ def test_has_no_such_property(item):
     assert not item.has_property(100)
 
 
+def test_has_property_matches_api(item):
+    for property_number in range(1, 600):
+        try:
+            expected = has_property(item, property_number)
+        except FormsException:
+            continue
+        assert item.has_property(property_number) == expected, property_number
+
+
 def test_invalid_property(item):
     with pytest.raises(FormsException):
         assert not item.has_property(1000)
@@ -86,7 +96,6 @@ def test_replicate(new_item):
     assert replicated.name == "REPLICATED_ITEM"
 
 
-@pytest.mark.xfail
 def test_find_object(new_item):
     to_find = new_item.name
 
@@ -95,6 +104,16 @@ def test_find_object(new_item):
     )
 
 
+def test_find_by_path(new_module, new_item):
+    assert new_module.find("BLK.ITM") == new_item
+    assert new_module.find("BLK.ITM", FormsObjects.item) == new_item
+
+
+def test_find_missing_object(new_module, new_item):
+    with pytest.raises(FormsException):
+        new_module.find("BLK.MISSING")
+
+
 @pytest.mark.xfail
 def test_inherit_property(new_item):
     assert new_item.inherit_property(Properties.x_position)
@@ -108,3 +127,26 @@ def test_is_property_inherited(new_item):
 @pytest.mark.xfail
 def test_is_property_default(new_item):
     assert new_item.is_property_default(Properties.x_position)
+
+
+def test_items_by_name(new_data_block, make_item):
+    item = make_item(new_data_block, "SAL")
+
+    assert new_data_block.items["SAL"] == item
+    assert new_data_block.items.get("sal") == item
+    assert new_data_block.items.get("EMP") is None
+
+
+def test_items_by_name_kept_up_to_date(new_data_block, make_item):
+    item = make_item(new_data_block, "SAL")
+    assert new_data_block.items["SAL"] == item
+
+    item.name = "COMM"
+    other = make_item(new_data_block, "SAL")
+
+    assert new_data_block.items["COMM"] == item
+    assert new_data_block.items["SAL"] == other
+
+    other.destroy()
+
+    assert "SAL" not in new_data_block.items.names()
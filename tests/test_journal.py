@@ -0,0 +1,67 @@
+import json
+
+from pyoracle_forms import FakeAPI, batch
+from pyoracle_forms.journal import Journal, content_hash
+
+
+def test_skips_completed(tmp_path, modules, save_module, block_names):
+    paths = modules(3)
+    journal = str(tmp_path / "batch.journal")
+
+    first = list(batch.map(block_names, paths, 2, api_factory=FakeAPI, journal=journal))
+    save_module(paths[1], "CHANGED")
+    second = list(
+        batch.map(block_names, paths, 2, api_factory=FakeAPI, journal=journal)
+    )
+
+    assert len(first) == 3
+    assert [(result.path, result.result) for result in second] == [
+        (paths[1], ["CHANGED"])
+    ]
+    entries = [json.loads(line) for line in open(journal, encoding="utf-8")]
+    assert len(entries) == 4
+    assert entries[-1]["summary"] == "['CHANGED']"
+    assert entries[-1]["hash"] == content_hash(paths[1])
+
+
+def test_retries_failed(fake_api, tmp_path, block_names):
+    path = str(tmp_path / "missing.fmb")
+    journal = str(tmp_path / "batch.journal")
+
+    for _ in range(2):
+        (result,) = batch.map(
+            block_names, [path], 1, api_factory=FakeAPI, journal=journal
+        )
+        assert result.error
+
+    assert Journal(journal).entries[path].status == "failed"
+
+
+def test_schedule_slowest_first(tmp_path):
+    paths = {name: tmp_path / f"{name}.fmb" for name in ("slow", "fast", "new")}
+    paths["slow"].write_bytes(b"1" * 10)
+    paths["fast"].write_bytes(b"2" * 10)
+    paths["new"].write_bytes(b"3" * 100)
+    journal = tmp_path / "batch.journal"
+    journal.write_text(
+        "".join(
+            json.dumps(
+                {
+                    "path": str(paths[name]),
+                    "hash": None,
+                    "size": 10,
+                    "status": "failed",
+                    "seconds": seconds,
+                    "summary": "",
+                }
+            )
+            + "\n"
+            for name, seconds in (("slow", 3.0), ("fast", 1.0))
+        )
+        + '{"path": "cut sh'
+    )
+
+    scheduled = Journal(str(journal)).schedule(str(path) for path in paths.values())
+
+    # the new file is estimated at 100 bytes times 0.2 seconds a byte
+    assert scheduled == [str(paths["new"]), str(paths["slow"]), str(paths["fast"])]
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pyoracle_forms
+from pyoracle_forms import forms_objects, constants
+
+root = Path(__file__).parent.parent
+
+
+def imported_modules(code):
+    # in a fresh interpreter, as -X importtime would list them
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy():
+    modules = imported_modules("import pyoracle_forms")
+
+    assert "pyoracle_forms" in modules
+    assert "pyoracle_forms.forms_objects" not in modules
+    assert "pyoracle_forms.constants" not in modules
+    assert "json" not in modules
+
+
+def test_imports_used_module_only():
+    modules = imported_modules("from pyoracle_forms import Justification")
+
+    assert "pyoracle_forms.constants" in modules
+    assert "pyoracle_forms.forms_objects" not in modules
+
+
+def test_lazy_names():
+    assert pyoracle_forms.Item is forms_objects.Item
+    assert pyoracle_forms.Justification is constants.Justification
+    for name in pyoracle_forms.__all__:
+        assert getattr(pyoracle_forms, name) is not None
+        assert name in dir(pyoracle_forms)
+
+
+def test_missing_name():
+    with pytest.raises(AttributeError):
+        pyoracle_forms.NotThere
@@ -35,3 +35,15 @@ def test_move_object_second(new_items):
     first_item.move(third_item)
 
     assert data_block.items[1] == first_item
+
+
+def test_move_keeps_collection(new_items):
+    data_block, first_item = new_items
+
+    items = data_block.items
+    first_item.move(None)
+
+    assert data_block.items is items
+    assert len(items) == 10
+    assert items[-1] == first_item
+    assert list(reversed(items))[0] == first_item
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+from pyoracle_forms import Item
+from pyoracle_forms.pool import ModulePool
+
+
+@pytest.fixture
+def paths(modules):
+    return modules(3)
+
+
+def handle(module):
+    return module._as_parameter_
+
+
+def test_lease_reuses_loaded(paths):
+    pool = ModulePool()
+
+    with pool.lease(paths[0]) as first:
+        pass
+    with pool.lease(paths[0]) as second:
+        pass
+
+    assert handle(first) == handle(second)
+    assert (pool.loads, pool.hits) == (1, 1)
+
+
+def test_reloads_changed(fake_api, save_module, paths):
+    pool = ModulePool()
+    with pool.lease(paths[0]) as module:
+        old = handle(module)
+
+    save_module(paths[0], "CHANGED")
+    stat = os.stat(paths[0])
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    with pool.lease(paths[0]) as module:
+        assert module.data_blocks[0].name == "CHANGED"
+    assert old not in fake_api.objects
+
+
+def test_evicts_least_recently_used(fake_api, paths):
+    pool = ModulePool(max_modules=2)
+
+    handles = {}
+    for path in (paths[0], paths[1], paths[0], paths[2]):
+        with pool.lease(path) as module:
+            handles[path] = handle(module)
+
+    assert paths[1] not in pool
+    assert paths[0] in pool and paths[2] in pool
+    assert handles[paths[1]] not in fake_api.objects
+    assert handles[paths[2]] in fake_api.objects
+
+
+def test_leased_are_kept(fake_api, paths):
+    pool = ModulePool(max_modules=1)
+
+    with pool.lease(paths[0]) as first:
+        with pool.lease(paths[1]):
+            assert len(pool) == 2
+        assert first.data_blocks[0].name == "BLOCK_0"
+
+    assert len(pool) == 1
+
+
+def test_eviction_keeps_leased_collections(paths):
+    pool = ModulePool(max_modules=1)
+
+    with pool.lease(paths[0]) as module:
+        data_blocks = module.data_blocks
+        items = data_blocks[0].items
+        with pool.lease(paths[1]) as other:
+            other.data_blocks[0].items
+        assert paths[1] not in pool
+
+        Item.create(data_blocks[0], "CREATED")
+        assert module.data_blocks is data_blocks
+        assert [item.name for item in items] == ["CREATED"]
+
+
+def test_memory_budget(paths):
+    pool = ModulePool(max_memory=1)
+
+    for path in paths:
+        with pool.lease(path):
+            pass
+
+    assert len(pool) == 0
+
+
+def test_clear(fake_api, paths):
+    pool = ModulePool()
+    with pool.lease(paths[0]) as module:
+        loaded = handle(module)
+
+    pool.clear()
+
+    assert len(pool) == 0
+    assert loaded not in fake_api.objects
@@ -0,0 +1,95 @@
+import pytest
+
+from pyoracle_forms import (
+    DataBlock,
+    Item,
+    Module,
+    TraceError,
+    read_trace,
+    replay,
+    start_trace,
+    stop_trace,
+    trace,
+)
+from pyoracle_forms import context as ctx
+from pyoracle_forms.tracing import Output
+
+
+def script():
+    with Module.create("TRACED") as module:
+        block = DataBlock.create(module, "BLOCK")
+        for name in ("FIRST", "SECOND"):
+            Item.create(block, name).prompt = name.title()
+        assert [item.prompt for item in block.items] == ["First", "Second"]
+        assert module.find("block.second").name == "SECOND"
+
+
+@pytest.fixture
+def recorded(fake_api, tmp_path):
+    path = str(tmp_path / "script.trace")
+    with trace(path):
+        script()
+    ctx.destroy_context()
+    return path
+
+
+def test_records_calls(recorded):
+    records = list(read_trace(recorded))
+
+    create_module = records[0]
+    assert create_module.function == "d2ffmdcr_Create"
+    assert create_module.arguments[1] == b"TRACED"
+    assert create_module.arguments[0].kind == "p"
+    assert create_module.result == 0
+    assert all(record.duration > 0 for record in records)
+
+    texts = [
+        record.arguments[2]
+        for record in records
+        if record.function == "d2fobgt_GetTextProp"
+    ]
+    assert Output("t", b"First") in texts
+    assert Output("t", b"SECOND") in texts
+
+
+def test_stop_trace(fake_api, tmp_path):
+    start_trace(str(tmp_path / "empty.trace"))
+    assert ctx.instruments
+
+    assert stop_trace() == 0
+    assert not ctx.instruments
+    assert list(read_trace(str(tmp_path / "empty.trace"))) == []
+
+
+def test_replay(recorded):
+    stats = replay(recorded, script)
+
+    assert stats.calls == len(list(read_trace(recorded)))
+    assert stats.native > 0
+    assert not ctx
+
+
+def test_replay_diverges(recorded):
+    def other_script():
+        with Module.create("OTHER"):
+            pass
+
+    with pytest.raises(TraceError, match="d2ffmdcr_Create"):
+        replay(recorded, other_script)
+    assert not ctx
+
+
+def test_replay_stops_early(recorded):
+    def shorter_script():
+        DataBlock.create(Module.create("TRACED"), "BLOCK")
+
+    with pytest.raises(TraceError, match="more"):
+        replay(recorded, shorter_script)
+
+
+def test_not_a_trace(tmp_path):
+    path = tmp_path / "not.trace"
+    path.write_bytes(b"not a trace")
+
+    with pytest.raises(TraceError):
+        list(read_trace(str(path)))